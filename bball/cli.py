@@ -13,12 +13,11 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 from bball.data.loaders import load_season_data, load_training_dataframe, split_X_y
-from bball.data.augment import augment_home_away
-from bball.models.infer import load_regressor, predict_margin_dist
-from bball.models.trainer import fit_classifier, fit_regressor
-from bball.models.tuner import tune
-import predict_games as predict_games_mod
-from predict_games import attach_hard_rock_lines, attach_s3_lines, build_today_feature_frame
+from bball.data.augment import HomeAwayFlip
+from bball.data.feature_store import PointInTimeStore
+
+# torch / optuna / predict_games (MySQL, boto3, pyarrow) are imported inside
+# the commands that need them so `bball --help` stays fast and DB-free.
 
 load_dotenv()
 
@@ -132,24 +131,15 @@ def _coerce_date(value: object) -> _dt.date:
 def build_feature_frame_for_date(
     season_year: int,
     target_date: object,
+    feature_store=None,
 ):
-    target = _coerce_date(target_date)
-    old_year = predict_games_mod.CURR_YEAR
-    old_month = predict_games_mod.CURR_MONTH
-    old_day = predict_games_mod.CURR_DAY
-    old_yesterday = predict_games_mod.yesterday
+    import predict_games as predict_games_mod
 
-    try:
-        predict_games_mod.CURR_YEAR = target.year
-        predict_games_mod.CURR_MONTH = target.month
-        predict_games_mod.CURR_DAY = target.day
-        predict_games_mod.yesterday = _dt.datetime(target.year, target.month, target.day) - _dt.timedelta(days=1)
-        return build_today_feature_frame(season_year=season_year)
-    finally:
-        predict_games_mod.CURR_YEAR = old_year
-        predict_games_mod.CURR_MONTH = old_month
-        predict_games_mod.CURR_DAY = old_day
-        predict_games_mod.yesterday = old_yesterday
+    return predict_games_mod.build_today_feature_frame(
+        season_year=season_year,
+        feature_store=feature_store,
+        target_date=_coerce_date(target_date),
+    )
 
 
 @click.group()
@@ -157,6 +147,52 @@ def cli():
     """BBall daily pipeline CLI"""
 
 
+def _prepare_training_data(cache=None, full_refresh: bool = False) -> dict:
+    """
+    Split and scale ``sports.training_data`` for train / tune.
+
+    Home/away augmentation is not applied here: ``flip`` is a
+    ``HomeAwayFlip`` for the training batches, which draws a fresh set of
+    swapped rows every batch instead of fixing one up front.
+
+    The scaled X matrices come from ``TrainingMatrixCache``: float32 ``.npy``
+    files keyed by a fingerprint of the rows, feature order and scaler,
+    memory-mapped rather than copied into each dataset / trial.  Up to that
+    point the frame is split once and then split into X / y and scaled in
+    place, so the feature matrix never exists in float64.
+    """
+    import numpy as np
+    from sklearn.model_selection import train_test_split as tts
+    from bball.data.matrix_cache import TrainingMatrixCache, fit_scaler
+
+    cache = cache or TrainingMatrixCache()
+    # float32 features / int8 flags / int16 spread (see apply_dtype_plan);
+    # each split below is taken once and then modified in place
+    df = load_training_dataframe(full_refresh=full_refresh)
+    train_pos, val_pos = tts(
+        np.arange(len(df)), test_size=0.2, random_state=42, stratify=df[TARGET_CLS],
+    )
+    train_df, val_df = df.take(train_pos), df.take(val_pos)
+    del df
+
+    X_train, y_reg_train, y_cls_train = split_X_y(train_df, TARGET_REG, TARGET_CLS, inplace=True)
+    X_val, y_reg_val, y_cls_val = split_X_y(val_df, TARGET_REG, TARGET_CLS, inplace=True)
+
+    feature_order = X_train.columns.tolist()
+    scaler = fit_scaler(X_train)
+    return {
+        "X_train": cache.frame(X_train, feature_order, scaler),
+        "X_val": cache.frame(X_val, feature_order, scaler),
+        "y_reg_train": y_reg_train,
+        "y_cls_train": y_cls_train,
+        "y_reg_val": y_reg_val,
+        "y_cls_val": y_cls_val,
+        "scaler": scaler,
+        "feature_order": feature_order,
+        "flip": HomeAwayFlip(feature_order, scaler),
+    }
+
+
 @cli.command()
 @click.option(
     "--trials",
@@ -164,9 +200,29 @@ def cli():
     show_default=True,
     help="Optuna trials",
 )
-def tune_cmd(trials: int):
+@click.option(
+    "--full-refresh",
+    is_flag=True,
+    default=False,
+    help="Re-read sports.training_data instead of refreshing the local snapshot.",
+)
+def tune_cmd(trials: int, full_refresh: bool):
     """Hyperparameter tuning for torch regressor."""
-    tune(trials=trials)
+    from bball.models.tuner import tune
+
+    # scaled matrices are built (or mapped from .cache/matrices) once and
+    # shared by every trial
+    data = _prepare_training_data(full_refresh=full_refresh)
+    tune(
+        data["X_train"],
+        data["X_val"],
+        data["y_reg_train"],
+        data["y_reg_val"],
+        data["y_cls_train"],
+        data["y_cls_val"],
+        n_trials=trials,
+        flip=data["flip"],
+    )
 
 
 @cli.command()
@@ -218,39 +274,37 @@ def build_features(season_year: int, out: str):
     show_default=True,
     help="Torch epochs",
 )
-def train_cmd(season_year: int, epochs: int):
+@click.option(
+    "--full-refresh",
+    is_flag=True,
+    default=False,
+    help="Re-read sports.training_data instead of refreshing the local snapshot.",
+)
+def train_cmd(season_year: int, epochs: int, full_refresh: bool):
     """
     Train both regressor and classifier models for a season.
 
     Saves artifacts to ./artifacts by default (see bball.models.trainer).
     """
     import json, joblib
-    from sklearn.model_selection import train_test_split as tts
-    from sklearn.preprocessing import StandardScaler
+    from bball.models.trainer import fit_classifier, fit_regressor
 
-    df = load_training_dataframe()
-    train_df, val_df = tts(
-        df, test_size=0.2, random_state=42, stratify=df[TARGET_CLS],
-    )
-    train_df = augment_home_away(train_df)
-
-    X_train, y_reg_train, y_cls_train = split_X_y(train_df, TARGET_REG, TARGET_CLS)
-    X_val, y_reg_val, y_cls_val = split_X_y(val_df, TARGET_REG, TARGET_CLS)
+    data = _prepare_training_data(full_refresh=full_refresh)
+    X_train, X_val = data["X_train"], data["X_val"]
 
-    # Save feature order & fit scaler (inference relies on both)
+    # Save feature order & fitted scaler (inference relies on both)
     ARTS = Path("artifacts"); ARTS.mkdir(exist_ok=True)
-    json.dump(X_train.columns.tolist(), (ARTS / "feature_order.json").open("w"))
+    json.dump(list(X_train.columns), (ARTS / "feature_order.json").open("w"))
     print(f"✓ wrote {ARTS / 'feature_order.json'}")
-
-    scaler = StandardScaler().fit(X_train)
-    joblib.dump(scaler, ARTS / "scaler.pkl")
-    X_train = pd.DataFrame(scaler.transform(X_train), columns=X_train.columns, index=X_train.index)
-    X_val = pd.DataFrame(scaler.transform(X_val), columns=X_val.columns, index=X_val.index)
+    joblib.dump(data["scaler"], ARTS / "scaler.pkl")
     print("✓ fitted & saved StandardScaler")
 
+    y_reg_train, y_cls_train = data["y_reg_train"], data["y_cls_train"]
+    y_reg_val, y_cls_val = data["y_reg_val"], data["y_cls_val"]
+
     cfg = {"epochs": epochs}
-    fit_regressor(X_train, y_reg_train, X_val, y_reg_val, cfg)
-    fit_classifier(X_train, y_cls_train, X_val, y_cls_val, cfg)
+    fit_regressor(X_train, y_reg_train, X_val, y_reg_val, cfg, flip=data["flip"])
+    fit_classifier(X_train, y_cls_train, X_val, y_cls_val, cfg, flip=data["flip"])
     print("✓ training complete")
 
 
@@ -274,6 +328,8 @@ def predict_season(season_year: int, out: str):
     """
     import json, joblib
     from pathlib import Path
+    from bball.models.infer import load_regressor, predict_margin_dist
+    from predict_games import attach_s3_lines
 
     # 1️⃣ Load season data (features + info)
     df = load_season_data(season_year=season_year)
@@ -324,6 +380,7 @@ def predict_today_impl(
     season_year: int,
     out: str | None,
     target_date: object | None = None,
+    feature_store=None,
 ):
     """
     Generate model predictions for *today's* games only.
@@ -331,11 +388,15 @@ def predict_today_impl(
     import json, joblib
     from pathlib import Path
     from datetime import datetime
+    from bball.models.infer import load_regressor, predict_margin_dist
+    from predict_games import attach_s3_lines
 
     # 1️⃣ Build feature frame for target date
     if target_date is None:
         target_date = _dt.date.today()
-    info_df, X_df = build_feature_frame_for_date(season_year=season_year, target_date=target_date)
+    info_df, X_df = build_feature_frame_for_date(
+        season_year=season_year, target_date=target_date, feature_store=feature_store
+    )
 
     if X_df.empty:
         print("No eligible D1 games found for today in the super sked.")
@@ -567,11 +628,18 @@ def daily_run(season_year: int, out: str | None):
     show_default=True,
     help="Skip dates where predictions CSV already exists.",
 )
+@click.option(
+    "--workers",
+    default=1,
+    show_default=True,
+    help="Dates to predict concurrently (threads).",
+)
 def backfill_season(
     season_year: int,
     start_date: str,
     end_date: str | None,
     skip_existing: bool,
+    workers: int,
 ):
     """
     Backfill predictions and JSON outputs for a date range.
@@ -581,13 +649,21 @@ def backfill_season(
     if end < start:
         raise click.BadParameter("end-date must be on/after start-date")
 
+    import predict_games as predict_games_mod
+
+    # load the per-team source tables once for the whole range
+    store = PointInTimeStore.load(predict_games_mod.get_cursor(), start, end)
+
+    days = []
     day = start
     while day <= end:
         out_path = Path("predictions") / "csv" / f"preds_{day.year}_{day.month}_{day.day}_edge.csv"
-        if skip_existing and out_path.exists():
-            day += _dt.timedelta(days=1)
-            continue
-        predict_today_impl(season_year=season_year, out=str(out_path), target_date=day)
+        if not (skip_existing and out_path.exists()):
+            days.append((day, out_path))
+        day += _dt.timedelta(days=1)
+
+    def _backfill_day(day, out_path):
+        predict_today_impl(season_year=season_year, out=str(out_path), target_date=day, feature_store=store)
         if out_path.exists():
             subprocess.run(
                 [
@@ -599,7 +675,23 @@ def backfill_season(
                 check=True,
                 cwd=REPO_ROOT,
             )
-        day += _dt.timedelta(days=1)
+
+    # each date carries its own context, so dates can run side by side
+    if workers > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        from bball.data.best_lines import best_season_lines
+
+        # sync + dedup each season's lines once up front; the workers then
+        # only read the warm table (sync/load also lock per season)
+        for season in sorted({predict_games_mod.s3_season(d) for d, _ in days}):
+            best_season_lines(season)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for fut in [pool.submit(_backfill_day, d, p) for d, p in days]:
+                fut.result()
+    else:
+        for d, p in days:
+            _backfill_day(d, p)
 
     subprocess.run(
         [sys.executable, str(REPO_ROOT / "scripts" / "bart_finals_to_json.py")],
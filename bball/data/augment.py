@@ -4,9 +4,16 @@ Adapted from hoops-edge-predictor.  For every original row a mirror row is
 appended where home and away features are swapped, the spread is negated, and
 the win label is flipped.  This forces the model to learn team-strength
 differences rather than which slot a team occupies.
+
+``augment_home_away`` flips one fixed set of rows of a DataFrame up front.
+``HomeAwayFlip`` does the same swap per training batch instead: the column
+pairs become one permutation index (with the scaler's affine correction, as
+the batches are already standardised) and every batch draws a fresh mask.
 """
 from __future__ import annotations
 
+import copy
+
 import pandas as pd
 
 # Columns whose home/away counterpart has a *different* naming convention.
@@ -54,6 +61,7 @@ def augment_home_away(
     target_cls: str = "home_win",
     flip_frac: float = 0.5,
     random_state: int = 42,
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """Randomly flip home/away for a fraction of rows to remove positional bias.
 
@@ -63,6 +71,10 @@ def augment_home_away(
 
     Only call this on the **training** split — validation data should stay
     unaugmented so metrics reflect real-world performance.
+
+    With ``inplace=True`` the rows of ``df`` itself are swapped (only the
+    selected rows of each pair are buffered) and ``df`` is returned, so a
+    split that is already its own copy is not duplicated again.
     """
     import numpy as np
 
@@ -72,19 +84,86 @@ def augment_home_away(
     feature_cols = [c for c in df.columns if c not in (target_reg, target_cls)]
     pairs = _build_swap_pairs(feature_cols)
 
-    out = df.copy()
+    out = df if inplace else df.copy()
 
     # Swap paired feature columns only for selected rows
     for col_a, col_b in pairs:
-        out.loc[mask, col_a] = df.loc[mask, col_b].values
-        out.loc[mask, col_b] = df.loc[mask, col_a].values
+        a_vals = out.loc[mask, col_a].to_numpy()
+        out.loc[mask, col_a] = out.loc[mask, col_b].to_numpy()
+        out.loc[mask, col_b] = a_vals
 
     # Negate regression target and flip classification target for swapped rows
     if target_reg in out.columns:
-        out.loc[mask, target_reg] = -df.loc[mask, target_reg].values
+        out.loc[mask, target_reg] = -out.loc[mask, target_reg].to_numpy()
     if target_cls in out.columns:
-        out.loc[mask, target_cls] = (1 - df.loc[mask, target_cls]).values
+        out.loc[mask, target_cls] = 1 - out.loc[mask, target_cls].to_numpy()
 
     n_flipped = mask.sum()
     print(f"↕ Flipped {n_flipped:,}/{len(df):,} rows ({100*n_flipped/len(df):.0f}%) home/away swap")
     return out
+
+
+class HomeAwayFlip:
+    """Per-batch home/away swap for standardised feature tensors.
+
+    A row picked for flipping has each paired column replaced by its
+    partner, and its target negated (``target="reg"``) or complemented
+    (``target="cls"``), in one gather and one ``torch.where`` per batch.
+    Because a new mask is drawn for every batch, each epoch sees a different
+    set of flipped rows and no flipped copy of the training set is stored.
+
+    The batches are scaled with the training scaler, so column ``j`` taking
+    partner ``p``'s value becomes ``x_p * scale_p / scale_j +
+    (mean_p - mean_j) / scale_j`` — the partner's raw value standardised
+    with column ``j``'s statistics.
+
+    Only pass it to the **training** batches; validation stays unflipped.
+    """
+
+    def __init__(
+        self,
+        feature_order: list[str],
+        scaler=None,
+        flip_frac: float = 0.5,
+        target: str = "reg",
+        random_state: int = 42,
+    ):
+        import numpy as np
+        import torch
+
+        columns = list(feature_order)
+        index = {c: i for i, c in enumerate(columns)}
+        perm = np.arange(len(columns))
+        for col_a, col_b in _build_swap_pairs(columns):
+            perm[index[col_a]], perm[index[col_b]] = index[col_b], index[col_a]
+
+        mean = getattr(scaler, "mean_", None)
+        scale = getattr(scaler, "scale_", None)
+        mean = np.zeros(len(columns)) if mean is None else np.asarray(mean, dtype=np.float64)
+        scale = np.ones(len(columns)) if scale is None else np.asarray(scale, dtype=np.float64)
+        self.perm = torch.from_numpy(perm)
+        self.mul = torch.from_numpy((scale[perm] / scale).astype(np.float32))
+        self.add = torch.from_numpy(((mean[perm] - mean) / scale).astype(np.float32))
+        self.flip_frac = flip_frac
+        self.target = target
+        self.generator = torch.Generator().manual_seed(random_state)
+
+    def for_task(self, task: str) -> "HomeAwayFlip":
+        """Same swap (and random stream) with the target rule for ``task``."""
+        flip = copy.copy(self)
+        flip.target = task
+        return flip
+
+    def __call__(self, X, y):
+        import torch
+
+        dev = X.device
+        if self.perm.device != dev:
+            self.perm, self.mul, self.add = self.perm.to(dev), self.mul.to(dev), self.add.to(dev)
+        mask = (torch.rand(len(X), generator=self.generator) < self.flip_frac).to(dev)
+
+        swapped = torch.addcmul(self.add, X.index_select(1, self.perm), self.mul)
+        X = torch.where(mask.view(-1, 1), swapped, X)
+        y_flip = -y if self.target == "reg" else 1 - y
+        y = torch.where(mask.view(-1, *([1] * (y.dim() - 1))), y_flip, y)
+        return X, y
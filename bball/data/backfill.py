@@ -0,0 +1,104 @@
+"""
+Date-sharded rebuilds of the offensive / defensive averages snapshots.
+
+Each day's snapshot depends only on games strictly before that day, so a
+season's date range can be split into contiguous shards and replayed in
+parallel.  Every worker receives the season's ``BoxscoreIndex`` once (via the
+pool initializer, copy-on-write under ``fork``), seeds a ``RollingStatEngine``
+with the games before its first date and then walks its shard day by day.
+Results are yielded back in date order so the caller can write them exactly
+as the single-process loop does.
+
+Key entry points
+----------------
+snapshot_range(index, dates, min_games, season_start, required=None)
+backfill_snapshots(index, dates, min_games, season_start, workers=N, required=None)
+"""
+from __future__ import annotations
+
+import datetime as dt
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .boxscores import BoxscoreIndex
+from .rolling import AggSpec, RollingStatEngine
+
+
+def snapshot_range(
+    index: BoxscoreIndex,
+    dates: Sequence[dt.datetime],
+    min_games: Sequence[int],
+    season_start: dt.datetime,
+    required: Optional[Iterable[AggSpec]] = None,
+) -> list[tuple[dt.datetime, pd.DataFrame]]:
+    """
+    Replay the season up to ``dates[0]`` and return one snapshot per date.
+
+    ``min_games[i]`` is the eligibility threshold used on ``dates[i]``;
+    ``required`` limits the output to those aggregates (default: all).
+    """
+    if not len(dates):
+        return []
+    if required is None:
+        engine = RollingStatEngine()
+    else:
+        engine = RollingStatEngine.for_aggregates(required)
+    engine.update(index.log_between(season_start, dates[0]))
+    out = []
+    for day, min_num_games in zip(dates, min_games):
+        out.append((day, engine.snapshot(engine.eligible_teams(min_num_games), day)))
+        engine.update(index.log_between(day, day + dt.timedelta(days=1)))
+    return out
+
+
+# ---- worker side ---------------------------------------------------------- #
+_WORKER_INDEX: BoxscoreIndex | None = None
+
+
+def _init_worker(index: BoxscoreIndex) -> None:
+    global _WORKER_INDEX
+    _WORKER_INDEX = index
+
+
+def _run_shard(dates, min_games, season_start, required):
+    return snapshot_range(_WORKER_INDEX, dates, min_games, season_start, required)
+
+
+def backfill_snapshots(
+    index: BoxscoreIndex,
+    dates: Sequence[dt.datetime],
+    min_games: Sequence[int],
+    season_start: dt.datetime,
+    workers: int = 1,
+    required: Optional[Iterable[AggSpec]] = None,
+) -> Iterator[tuple[dt.datetime, pd.DataFrame]]:
+    """
+    Yield ``(date, snapshot)`` for every date, in order.
+
+    With ``workers > 1`` the dates are split into ``workers`` contiguous
+    shards and computed in a process pool; shards are yielded as soon as
+    they (and every earlier shard) are done.
+    """
+    dates = list(dates)
+    min_games = list(min_games)
+    if required is not None:
+        required = set(required)
+    if workers <= 1 or len(dates) < 2:
+        yield from snapshot_range(index, dates, min_games, season_start, required)
+        return
+
+    bounds = np.linspace(0, len(dates), min(workers, len(dates)) + 1).astype(int)
+    with ProcessPoolExecutor(
+        max_workers=len(bounds) - 1,
+        initializer=_init_worker,
+        initargs=(index,),
+    ) as pool:
+        futures = [
+            pool.submit(_run_shard, dates[lo:hi], min_games[lo:hi], season_start, required)
+            for lo, hi in zip(bounds[:-1], bounds[1:])
+        ]
+        for fut in futures:
+            yield from fut.result()
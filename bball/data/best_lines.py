@@ -0,0 +1,216 @@
+"""
+Materialised "best line per gameId" table for each season.
+
+``_dedup_s3_lines`` (and the backfill script's copy ``_dedup_lines``)
+re-sorted a whole season of raw ``fct_lines`` rows and recomputed majority
+spread signs on every call.  The dedup only ever looks at one gameId at a
+time, so the result is persisted next to the season's cache files together
+with the snapshot it was built from and a hash of each game's raw rows.  When
+a new ``asof=`` snapshot arrives only the gameIds whose rows changed are
+deduplicated again; an unchanged snapshot is a plain Parquet read.
+
+Layout (next to ``S3LinesCache``'s files)::
+
+    season=2026/best_lines.parquet   one row per gameId (+ _rows_hash)
+    season=2026/best_lines.json      {"asof", "manifest_sha256", ...}
+
+Key entry points
+----------------
+dedup_lines(raw)                           → best row per gameId (pure function)
+game_hashes(raw)                           → uint64 hash of each game's raw rows
+BestLinesTable(cache).load(season, start, end)
+best_season_lines(season, start=None, end=None)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from .s3_lines import LINE_COLUMNS, S3LinesCache, season_lock, tmp_path
+
+PROVIDER_RANK = {"Draft Kings": 0, "ESPN BET": 1, "Bovada": 2}
+
+HASH_COL = "_rows_hash"
+
+
+# --------------------------------------------------------------------------- #
+# 1. Dedup
+# --------------------------------------------------------------------------- #
+def dedup_lines(lines_df: pd.DataFrame) -> pd.DataFrame:
+    """Deduplicate lines: prefer complete data, then DK > ESPN BET > Bovada.
+    Fix spread sign via majority vote."""
+    lines_df = lines_df.copy()
+    lines_df["spread"] = pd.to_numeric(lines_df["spread"], errors="coerce")
+    lines_df["homeMoneyline"] = pd.to_numeric(lines_df["homeMoneyline"], errors="coerce")
+
+    # Spread sign fix: majority vote
+    has_spread = lines_df["spread"].notna() & (lines_df["spread"] != 0)
+    spread_sign = np.sign(lines_df.loc[has_spread, "spread"])
+    majority_sign = (
+        spread_sign.groupby(lines_df.loc[has_spread, "gameId"])
+        .sum()
+        .rename("_majority_sign")
+    )
+
+    dedup = (
+        lines_df
+        .assign(
+            _has_spread=lines_df["spread"].notna().astype(int),
+            _has_total=lines_df["overUnder"].notna().astype(int),
+            _prov_rank=lines_df["provider"].map(PROVIDER_RANK).fillna(99),
+        )
+        .sort_values(
+            ["_has_spread", "_has_total", "_prov_rank"],
+            ascending=[False, False, True],
+        )
+        .drop_duplicates(subset=["gameId"], keep="first")
+        .drop(columns=["_has_spread", "_has_total", "_prov_rank"])
+        .copy()
+    )
+
+    # Apply majority sign flip
+    dedup = dedup.merge(majority_sign, on="gameId", how="left")
+    _sp = dedup["spread"]
+    _maj = dedup["_majority_sign"]
+    mask = (
+        _sp.notna() & _maj.notna() & (_maj != 0)
+        & (abs(_sp) >= 3)
+        & (np.sign(_sp) != np.sign(_maj))
+    )
+    dedup.loc[mask, "spread"] = -_sp[mask]
+
+    # Moneyline cross-check for single-provider games
+    _sp2 = dedup["spread"]
+    _ml = dedup["homeMoneyline"]
+    mask_ml = (
+        _sp2.notna() & _ml.notna()
+        & (~mask)
+        & dedup["_majority_sign"].isna()
+        & (((_sp2 > 3) & (_ml < -150)) | ((_sp2 < -3) & (_ml > 150)))
+    )
+    dedup.loc[mask_ml, "spread"] = -_sp2[mask_ml]
+    dedup = dedup.drop(columns=["_majority_sign"])
+
+    # Extract date from startDate in Eastern Time (predictions use ET dates)
+    ts = pd.to_datetime(dedup["startDate"])
+    if ts.dt.tz is not None:
+        dedup["game_date"] = ts.dt.tz_convert("America/New_York").dt.strftime("%Y-%m-%d")
+    else:
+        dedup["game_date"] = ts.dt.tz_localize("UTC").dt.tz_convert("America/New_York").dt.strftime("%Y-%m-%d")
+
+    return dedup
+
+
+def game_hashes(raw: pd.DataFrame) -> pd.Series:
+    """
+    Order-sensitive uint64 hash of each gameId's raw rows (``LINE_COLUMNS``),
+    indexed by gameId.  Equal hash ⇒ ``dedup_lines`` gives the same row.
+    """
+    cols = [c for c in LINE_COLUMNS if c in raw.columns]
+    keyed = raw[cols].assign(_pos=raw.groupby("gameId").cumcount().to_numpy())
+    rows = pd.util.hash_pandas_object(keyed, index=False)
+    return rows.groupby(raw["gameId"].to_numpy()).sum()
+
+
+# --------------------------------------------------------------------------- #
+# 2. Persisted table
+# --------------------------------------------------------------------------- #
+def _asof(manifest: list) -> str | None:
+    for key, _etag, _size in manifest:
+        for part in key.split("/"):
+            if part.startswith("asof="):
+                return part[len("asof="):]
+    return None
+
+
+class BestLinesTable:
+    """
+    Per-season best-line tables kept next to an ``S3LinesCache``.
+
+    ``refreshed`` holds the number of gameIds re-deduplicated by the last
+    ``load`` (0 when the stored table was current).
+    """
+
+    def __init__(self, cache: S3LinesCache | None = None):
+        self.cache = cache if cache is not None else S3LinesCache()
+        self.refreshed = 0
+
+    def _refresh(self, season: int, arrow_path, best_path, meta_path, manifest_sha):
+        import pyarrow.dataset as ds
+
+        dataset = ds.dataset(str(arrow_path), format="feather")
+        cols = [c for c in LINE_COLUMNS if c in dataset.schema.names]
+        raw = dataset.to_table(columns=cols).to_pandas()
+        hashes = game_hashes(raw)
+
+        kept = None
+        if best_path.exists():
+            old = pd.read_parquet(best_path)
+            present = old["gameId"].isin(hashes.index).to_numpy()
+            same = np.zeros(len(old), dtype=bool)
+            same[present] = (
+                old[HASH_COL].to_numpy()[present]
+                == hashes.loc[old["gameId"][present]].to_numpy()
+            )
+            kept = old[same]
+        changed = raw if kept is None else raw[~raw["gameId"].isin(kept["gameId"])]
+
+        fresh = dedup_lines(changed) if len(changed) else changed.iloc[0:0]
+        fresh = fresh.assign(**{HASH_COL: hashes.reindex(fresh["gameId"]).to_numpy(dtype="uint64")})
+        best = fresh if kept is None or kept.empty else pd.concat([kept, fresh], ignore_index=True)
+        best = best.sort_values("gameId", kind="mergesort").reset_index(drop=True)
+
+        tmp = tmp_path(best_path)
+        best.to_parquet(tmp, index=False)
+        os.replace(tmp, best_path)
+        manifest = json.loads((arrow_path.parent / "manifest.json").read_text())
+        meta_path.write_text(json.dumps({
+            "asof": _asof(manifest),
+            "manifest_sha256": manifest_sha,
+            "games": int(len(best)),
+            "refreshed": int(fresh["gameId"].nunique()),
+        }))
+        self.refreshed = int(fresh["gameId"].nunique())
+        return best
+
+    def load(self, season: int, start=None, end=None) -> pd.DataFrame:
+        """
+        Best line per gameId for ``season`` (``dedup_lines`` output), limited
+        to ``start <= game_date < end`` (Eastern dates) when given.  Sync and
+        refresh hold the season's lock, so concurrent callers (backfill
+        workers) see one consistent table.
+        """
+        self.refreshed = 0
+        with season_lock(self.cache.root, season):
+            arrow_path = self.cache.sync(season)
+            if arrow_path is None:
+                return pd.DataFrame()
+            season_dir = arrow_path.parent
+            best_path = season_dir / "best_lines.parquet"
+            meta_path = season_dir / "best_lines.json"
+            manifest_sha = hashlib.sha256((season_dir / "manifest.json").read_bytes()).hexdigest()
+
+            best = None
+            if best_path.exists() and meta_path.exists():
+                try:
+                    if json.loads(meta_path.read_text()).get("manifest_sha256") == manifest_sha:
+                        best = pd.read_parquet(best_path)
+                except ValueError:
+                    best = None
+            if best is None:
+                best = self._refresh(season, arrow_path, best_path, meta_path, manifest_sha)
+
+        if start is not None:
+            best = best[best["game_date"] >= pd.Timestamp(start).strftime("%Y-%m-%d")]
+        if end is not None:
+            best = best[best["game_date"] < pd.Timestamp(end).strftime("%Y-%m-%d")]
+        return best.drop(columns=[HASH_COL]).reset_index(drop=True)
+
+
+def best_season_lines(season: int, start=None, end=None) -> pd.DataFrame:
+    """``BestLinesTable().load(season, start, end)`` with the default cache."""
+    return BestLinesTable().load(season, start=start, end=end)
@@ -0,0 +1,97 @@
+"""
+Bulk access to `sports.tot_boxscores` for the rolling-stat jobs.
+
+The season is pulled with a single query (date-range pushdown, only the
+columns the team-game log needs) and every per-date / per-team slice is then
+served from an in-memory, date-sorted index with binary search instead of a
+fresh MySQL round trip.
+
+Key entry points
+----------------
+load_boxscores(cursor, start, end)    → DataFrame of start <= date < end
+BoxscoreIndex(box_df)                  → date-sorted index over the season
+index.games_between(start, end)        → boxscore rows in [start, end)
+index.log_between(start, end)          → team-game rows in [start, end)
+index.team_log(team, before=None)      → one team's games, oldest first
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from .team_games import BOX_SCORE_COLUMNS, build_team_game_log
+
+
+def load_boxscores(
+    cursor,
+    start,
+    end,
+    columns: Sequence[str] = BOX_SCORE_COLUMNS,
+) -> pd.DataFrame:
+    """
+    Fetch ``columns`` of tot_boxscores for ``start <= date < end`` in one
+    query, oldest first.  ``cursor`` is any DB-API cursor (mysql.connector).
+    """
+    col_sql = ", ".join(f"`{c}`" for c in columns)
+    sql = f"""SELECT {col_sql} FROM tot_boxscores
+    WHERE date >= %s AND date < %s
+    ORDER BY date"""
+    cursor.execute(sql, (start, end))
+    rows = cursor.fetchall()
+    return pd.DataFrame(rows, columns=list(columns))
+
+
+def _ts(value) -> np.datetime64:
+    return np.datetime64(pd.Timestamp(value), "ns")
+
+
+class BoxscoreIndex:
+    """
+    Date-sorted, in-memory view of a season of boxscores.
+
+    The team-game log (``build_team_game_log``) is built once up front; all
+    slices are contiguous ranges found with ``np.searchsorted``.
+    """
+
+    def __init__(self, box_df: pd.DataFrame):
+        box = box_df.copy()
+        box["date"] = pd.to_datetime(box["date"])
+        self.games = box.sort_values("date", kind="mergesort").reset_index(drop=True)
+        self.log = build_team_game_log(self.games)
+        self.log["date"] = pd.to_datetime(self.log["date"])
+
+        self._game_dates = self.games["date"].to_numpy(dtype="datetime64[ns]")
+        self._log_dates = self.log["date"].to_numpy(dtype="datetime64[ns]")
+        self._team_rows = dict(self.log.groupby("team_name", sort=False).indices)
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def _bounds(self, dates: np.ndarray, start, end) -> tuple[int, int]:
+        lo = 0 if start is None else int(np.searchsorted(dates, _ts(start), side="left"))
+        hi = len(dates) if end is None else int(np.searchsorted(dates, _ts(end), side="left"))
+        return lo, max(lo, hi)
+
+    def games_between(self, start=None, end=None) -> pd.DataFrame:
+        """Boxscore rows with ``start <= date < end``."""
+        lo, hi = self._bounds(self._game_dates, start, end)
+        return self.games.iloc[lo:hi]
+
+    def log_between(self, start=None, end=None) -> pd.DataFrame:
+        """Team-game rows with ``start <= date < end``."""
+        lo, hi = self._bounds(self._log_dates, start, end)
+        return self.log.iloc[lo:hi]
+
+    def team_log(self, team: str, before=None) -> pd.DataFrame:
+        """All of ``team``'s games (optionally strictly before ``before``)."""
+        rows = self._team_rows.get(team)
+        if rows is None:
+            return self.log.iloc[0:0]
+        if before is not None:
+            rows = rows[: int(np.searchsorted(self._log_dates[rows], _ts(before), side="left"))]
+        return self.log.iloc[rows]
+
+    def teams(self) -> list[str]:
+        return list(self._team_rows)
@@ -1,12 +1,33 @@
-from torch.utils.data import Dataset
+import math
+import warnings
+
+from torch.utils.data import DataLoader, Dataset
+import numpy as np
 import torch
 import pandas as pd
 
 
+def as_float32_tensor(values) -> torch.Tensor:
+    """
+    float32 tensor over ``values`` (DataFrame, Series or array).
+
+    float32 input – e.g. a memmap from ``TrainingMatrixCache`` – is wrapped
+    with ``torch.from_numpy`` and shares memory; anything else is converted
+    once.  The tensors are only ever read, so read-only maps are fine.
+    """
+    arr = values.to_numpy() if isinstance(values, (pd.DataFrame, pd.Series)) else np.asarray(values)
+    if arr.dtype != np.float32 or not arr.flags["C_CONTIGUOUS"]:
+        arr = np.ascontiguousarray(arr, dtype=np.float32)
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="The given NumPy array is not writable")
+        return torch.from_numpy(arr)
+
+
 class BasketballDataset(Dataset):
     """
     Torch-compatible wrapper that converts a Pandas DataFrame + Series
-    into tensors on demand.
+    into tensors on demand.  float32 input (e.g. a cached memmap) is used
+    without copying.
 
     Parameters
     ----------
@@ -15,11 +36,112 @@ class BasketballDataset(Dataset):
     """
 
     def __init__(self, X_df: pd.DataFrame, y_sr):
-        self.X = torch.tensor(X_df.values, dtype=torch.float32)
-        self.y = torch.tensor(y_sr.values, dtype=torch.float32).view(-1, 1)
+        self.X = as_float32_tensor(X_df)
+        self.y = as_float32_tensor(y_sr).view(-1, 1)
 
     def __len__(self) -> int:
         return len(self.X)
 
     def __getitem__(self, idx: int):
         return self.X[idx], self.y[idx]
+
+
+class TensorBatches:
+    """
+    Mini-batches sliced straight out of a ``BasketballDataset``'s tensors.
+
+    Shuffling draws one ``randperm`` per epoch and gathers each batch with
+    ``index_select`` in the main process, so there is no per-row
+    ``__getitem__``, collation or worker IPC.  Iterates like a DataLoader.
+
+    Parameters
+    ----------
+    dataset : BasketballDataset
+    batch_size : int
+    shuffle : bool
+    generator : torch.Generator, optional
+    transform : callable, optional
+        ``(X, y) -> (X, y)`` applied to every batch, e.g. ``HomeAwayFlip``.
+    """
+
+    def __init__(
+        self,
+        dataset: BasketballDataset,
+        batch_size: int,
+        shuffle: bool = True,
+        generator=None,
+        transform=None,
+    ):
+        self.X = dataset.X.contiguous()
+        self.y = dataset.y.contiguous()
+        self.batch_size = int(batch_size)
+        self.shuffle = shuffle
+        self.generator = generator
+        self.transform = transform
+
+    def __len__(self) -> int:
+        return math.ceil(len(self.X) / self.batch_size)
+
+    def _batches(self):
+        n, bs = len(self.X), self.batch_size
+        if not self.shuffle:
+            for start in range(0, n, bs):
+                yield self.X[start:start + bs], self.y[start:start + bs]
+            return
+        order = torch.randperm(n, generator=self.generator)
+        for start in range(0, n, bs):
+            idx = order[start:start + bs]
+            yield self.X.index_select(0, idx), self.y.index_select(0, idx)
+
+    def __iter__(self):
+        if self.transform is None:
+            yield from self._batches()
+            return
+        for xb, yb in self._batches():
+            yield self.transform(xb, yb)
+
+
+class _MappedBatches:
+    """A ``DataLoader`` whose batches pass through ``transform``."""
+
+    def __init__(self, loader: DataLoader, transform):
+        self.loader = loader
+        self.transform = transform
+
+    def __len__(self) -> int:
+        return len(self.loader)
+
+    def __iter__(self):
+        for xb, yb in self.loader:
+            yield self.transform(xb, yb)
+
+
+def batch_loader(
+    dataset: BasketballDataset,
+    batch_size: int,
+    shuffle: bool,
+    device: torch.device,
+    num_workers: int = 4,
+    persistent_workers: bool = True,
+    transform=None,
+):
+    """
+    Batches for ``dataset`` on ``device``.
+
+    Worker processes and pinned memory only pay off when batches are copied
+    to a GPU, so CUDA gets the usual ``DataLoader``; everything else gets
+    ``TensorBatches``.  ``transform`` (``(X, y) -> (X, y)``) is applied to
+    each batch in the training process, after collation.
+    """
+    if device.type == "cuda" and num_workers > 0:
+        loader = DataLoader(
+            dataset,
+            batch_size=batch_size,
+            shuffle=shuffle,
+            num_workers=num_workers,
+            pin_memory=True,
+            persistent_workers=persistent_workers,
+            prefetch_factor=4,
+        )
+        return loader if transform is None else _MappedBatches(loader, transform)
+    return TensorBatches(dataset, batch_size, shuffle=shuffle, transform=transform)
@@ -0,0 +1,119 @@
+"""
+In-memory point-in-time store for the slate feature tables.
+
+Multi-date jobs (``bball backfill-season``) would otherwise re-run the
+"latest row where date <= D" lookups against MySQL for every day.  The store
+loads each ``AS_OF_SOURCES`` table once for the whole date range into
+per-team, date-sorted NumPy arrays and answers "features of team T as of D"
+with a binary search.
+
+Key entry points
+----------------
+PointInTimeStore.load(cursor, start, end)    → one query per source table
+PointInTimeStore({table: df})                → build from already-loaded rows
+store.as_of(table, teams, date)              → rows indexed by team
+store.latest(teams, date)                    → {table: rows}, for
+                                                assemble_slate_features
+"""
+from __future__ import annotations
+
+import datetime as dt
+from typing import Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from .slate_features import AS_OF_SOURCES
+
+# how far before the first date to load, so early-season lookups still see
+# last season's final rows like the unbounded per-day queries did
+DEFAULT_LOOKBACK = dt.timedelta(days=400)
+
+
+def _to_datetime64(value) -> np.datetime64:
+    return np.datetime64(pd.Timestamp(value), "ns")
+
+
+class _TeamSeries:
+    __slots__ = ("dates", "values")
+
+    def __init__(self, dates: np.ndarray, values: np.ndarray):
+        self.dates = dates
+        self.values = values
+
+
+class PointInTimeStore:
+    """
+    Date-sorted, team-indexed copy of the as-of source tables.
+
+    Parameters
+    ----------
+    tables : mapping
+        ``{table: DataFrame}`` with the table's team, date and value columns
+        (see ``AS_OF_SOURCES``).
+    """
+
+    def __init__(self, tables: Mapping[str, pd.DataFrame]):
+        self._columns: dict[str, list[str]] = {}
+        self._series: dict[str, dict[str, _TeamSeries]] = {}
+        for table, df in tables.items():
+            src = AS_OF_SOURCES[table]
+            cols = list(src["columns"])
+            df = df.copy()
+            df[src["date"]] = pd.to_datetime(df[src["date"]])
+            df = df.sort_values([src["team"], src["date"]], kind="mergesort")
+            dates = df[src["date"]].to_numpy(dtype="datetime64[ns]")
+            values = df[cols].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+            by_team = {}
+            for team, idx in df.groupby(src["team"], sort=False).indices.items():
+                by_team[team] = _TeamSeries(dates[idx], values[idx])
+            self._columns[table] = cols
+            self._series[table] = by_team
+
+    # ------------------------------------------------------------------- #
+    @classmethod
+    def load(
+        cls,
+        cursor,
+        start,
+        end,
+        lookback: dt.timedelta = DEFAULT_LOOKBACK,
+    ) -> "PointInTimeStore":
+        """
+        Load every source table for ``start - lookback <= date <= end`` with
+        one projected query per table.
+        """
+        lo = pd.Timestamp(start) - lookback
+        hi = pd.Timestamp(end)
+        tables = {}
+        for table, src in AS_OF_SOURCES.items():
+            cols = [src["team"], src["date"]] + list(src["columns"])
+            col_sql = ", ".join(f"`{c}`" for c in cols)
+            sql = f"""SELECT {col_sql} FROM sports.{table}
+            WHERE `{src['date']}` >= %s AND `{src['date']}` <= %s"""
+            cursor.execute(sql, (lo.date(), hi.date()))
+            tables[table] = pd.DataFrame(cursor.fetchall(), columns=cols)
+        return cls(tables)
+
+    # ------------------------------------------------------------------- #
+    def as_of(self, table: str, teams: Iterable[str], date) -> pd.DataFrame:
+        """Latest row per team with date <= ``date``; missing teams are absent."""
+        when = _to_datetime64(date)
+        series = self._series[table]
+        names, rows = [], []
+        for team in dict.fromkeys(teams):
+            ts = series.get(team)
+            if ts is None:
+                continue
+            pos = int(np.searchsorted(ts.dates, when, side="right")) - 1
+            if pos >= 0:
+                names.append(team)
+                rows.append(ts.values[pos])
+        cols = self._columns[table]
+        values = np.vstack(rows) if rows else np.empty((0, len(cols)))
+        return pd.DataFrame(values, index=pd.Index(names, name="team"), columns=cols)
+
+    def latest(self, teams: Iterable[str], date) -> dict[str, pd.DataFrame]:
+        """``as_of`` for every table – drop-in for ``fetch_slate_sources``."""
+        teams = list(dict.fromkeys(teams))
+        return {table: self.as_of(table, teams, date) for table in self._series}
@@ -0,0 +1,169 @@
+"""
+Batched Hard Rock line lookup for a whole slate.
+
+``predict_games.get_todays_lines`` resolves one game at a time: a
+``max(Time)`` query followed by up to four fallbacks (exact pairing at the
+latest scrape, exact pairing earlier, flipped pairing at the latest scrape,
+flipped pairing earlier).  Here the ``sports.hard_rock_lines`` rows for the
+slate's time window are read once and the same cascade is resolved for every
+game with two merges and a sort.
+
+Columns keep the table's own names (from ``cursor.description``); for a
+flipped pairing the away/home value columns are swapped, exactly like the
+per-game helper did.
+
+Key entry points
+----------------
+fetch_hard_rock_window(cursor, target_date)   → (rows, latest scrape, lower bound)
+resolve_hard_rock_lines(rows, games, latest, lower)
+                                              → one line row per game (NaN if none)
+hard_rock_lines_for_slate(cursor, games, target_date)
+"""
+from __future__ import annotations
+
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+
+from .teams import HARD_ROCK, registry
+
+TIME_COL, AWAY_COL, HOME_COL = "Time", "away_team_name", "home_team_name"
+
+# column positions swapped when the book lists the game the other way round:
+# away/home spread + spread odds, away/home moneyline
+FLIP_POSITIONS = ((3, 5), (4, 6), (11, 12))
+
+# rank of each fallback, lower wins (same order as get_todays_lines)
+EXACT_LATEST, EXACT_EARLIER, FLIPPED_LATEST, FLIPPED_EARLIER = range(4)
+
+
+# --------------------------------------------------------------------------- #
+# 1. Query
+# --------------------------------------------------------------------------- #
+def _select(cursor, where: str, params) -> pd.DataFrame:
+    cursor.execute(f"SELECT * FROM sports.hard_rock_lines {where}", params)
+    rows = cursor.fetchall()
+    fields = [d[0] for d in cursor.description] if cursor.description else []
+    return pd.DataFrame(rows, columns=fields)
+
+
+def fetch_hard_rock_window(cursor, target_date: dt.date | None = None):
+    """
+    Every ``hard_rock_lines`` row a slate can match against.
+
+    With ``target_date`` this is one query for that calendar day.  Without it
+    (live slate) the newest scrape time is looked up first and rows from the
+    last 24 hours up to it are read: two queries.
+
+    Returns
+    -------
+    rows : pd.DataFrame
+        Table columns, ``Time`` as datetime64.
+    latest : pd.Timestamp or None
+        Newest scrape time in the window (None if there are no rows).
+    lower : pd.Timestamp
+        Earliest time an "earlier" fallback may come from.
+    """
+    if target_date is None:
+        cursor.execute("SELECT max(Time) FROM sports.hard_rock_lines")
+        latest = cursor.fetchall()[0][0]
+        lower = pd.Timestamp(dt.datetime.now() - dt.timedelta(days=1))
+        if latest is None:
+            return _select(cursor, "LIMIT 0", ()), None, lower
+        latest = pd.Timestamp(latest)
+        rows = _select(cursor, "WHERE Time >= %s AND Time <= %s",
+                       (min(lower, latest).to_pydatetime(), latest.to_pydatetime()))
+    else:
+        day_start = dt.datetime(target_date.year, target_date.month, target_date.day)
+        lower = pd.Timestamp(day_start)
+        rows = _select(cursor, "WHERE Time >= %s AND Time < %s",
+                       (day_start, day_start + dt.timedelta(days=1)))
+        latest = None
+    if rows.empty:
+        return rows, None, lower
+    rows[TIME_COL] = pd.to_datetime(rows[TIME_COL])
+    if latest is None:
+        latest = rows[TIME_COL].max()
+    return rows, latest, lower
+
+
+# --------------------------------------------------------------------------- #
+# 2. Resolution
+# --------------------------------------------------------------------------- #
+def _flip(rows: pd.DataFrame) -> pd.DataFrame:
+    cols = list(rows.columns)
+    order = list(cols)
+    for a, b in FLIP_POSITIONS:
+        order[a], order[b] = cols[b], cols[a]
+    flipped = rows[order]
+    flipped.columns = cols
+    return flipped
+
+
+def _candidates(rows, keys, away_key, home_key, latest, lower, ranks):
+    hit = keys.merge(rows, left_on=[away_key, home_key], right_on=[AWAY_COL, HOME_COL])
+    at_latest = hit[TIME_COL] == latest
+    earlier = (hit[TIME_COL] < latest) & (hit[TIME_COL] >= lower)
+    hit = hit[at_latest | earlier].copy()
+    hit["_rank"] = np.where(hit[TIME_COL] == latest, ranks[0], ranks[1])
+    return hit
+
+
+def resolve_hard_rock_lines(
+    rows: pd.DataFrame,
+    games: pd.DataFrame,
+    latest,
+    lower,
+) -> pd.DataFrame:
+    """
+    Best line row for each game, in ``games`` order.
+
+    Parameters
+    ----------
+    rows : pd.DataFrame
+        Output of ``fetch_hard_rock_window`` (Hard Rock team spellings).
+    games : pd.DataFrame
+        ``away_team_name`` / ``home_team_name`` in Torvik spelling.
+    latest, lower : pd.Timestamp
+        Newest scrape time and the lower bound for earlier fallbacks.
+
+    Returns
+    -------
+    pd.DataFrame
+        Table columns minus Time/team names, one row per game; NaN where no
+        line was found.
+    """
+    value_cols = [c for c in rows.columns if c not in (TIME_COL, AWAY_COL, HOME_COL)]
+    n = len(games)
+    if rows.empty or latest is None or n == 0:
+        return pd.DataFrame(np.nan, index=pd.RangeIndex(n), columns=value_cols)
+
+    reg = registry()
+    keys = pd.DataFrame({
+        "_game": np.arange(n),
+        "_away": reg.to_source(games[AWAY_COL].reset_index(drop=True), HARD_ROCK),
+        "_home": reg.to_source(games[HOME_COL].reset_index(drop=True), HARD_ROCK),
+    })
+    rows = rows.reset_index(drop=True)
+    rows = rows.assign(_order=np.arange(len(rows)))
+    hits = pd.concat([
+        _candidates(rows, keys, "_away", "_home", latest, lower,
+                    (EXACT_LATEST, EXACT_EARLIER)),
+        _candidates(_flip(rows), keys, "_home", "_away", latest, lower,
+                    (FLIPPED_LATEST, FLIPPED_EARLIER)),
+    ], ignore_index=True)
+    hits = hits.sort_values(["_game", "_rank", TIME_COL, "_order"],
+                            ascending=[True, True, False, True], kind="mergesort")
+    best = hits.drop_duplicates("_game").set_index("_game")
+    return best.reindex(pd.RangeIndex(n))[value_cols]
+
+
+def hard_rock_lines_for_slate(
+    cursor,
+    games: pd.DataFrame,
+    target_date: dt.date | None = None,
+) -> pd.DataFrame:
+    """``fetch_hard_rock_window`` + ``resolve_hard_rock_lines`` in one call."""
+    rows, latest, lower = fetch_hard_rock_window(cursor, target_date)
+    return resolve_hard_rock_lines(rows, games, latest, lower)
@@ -0,0 +1,110 @@
+"""
+Join-based matching of S3 lines to predicted games.
+
+``attach_s3_lines`` and ``scripts/backfill_s3_lines`` both walked the
+predictions row by row and probed a dict: exact (home, away, date), then the
+flipped pairing, then both again on the day before and the day after,
+negating the spread when the book had home/away the other way round.  Here
+the same cascade is two merges on integer team IDs plus a sort on a priority
+rank, so a whole season of prediction files can be re-matched at once.
+
+Key entry points
+----------------
+LineMatcher(lines)                      → index deduplicated lines once
+matcher.match(games, game_date)         → home spread per game (NaN if none)
+match_spreads(games, lines, game_date)  → one-shot helper
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from .teams import S3, registry
+
+# (day offset of the line relative to the game, flipped) in lookup order
+MATCH_ORDER = ((0, False), (0, True), (-1, False), (-1, True), (1, False), (1, True))
+_OFFSET_RANK = np.array([2, 0, 4])  # indexed by offset + 1
+
+
+def _days(values) -> np.ndarray:
+    return pd.to_datetime(pd.Series(values)).to_numpy(dtype="datetime64[D]").astype("int64")
+
+
+class LineMatcher:
+    """
+    Deduplicated lines keyed by (home_id, away_id, day).
+
+    Parameters
+    ----------
+    lines : pd.DataFrame
+        ``homeTeam``, ``awayTeam`` (S3 spellings), ``game_date`` and ``spread``.
+        When one key appears more than once the last row wins, and keys
+        whose spread is missing are treated as absent, as the dict lookup
+        did.
+    """
+
+    def __init__(self, lines: pd.DataFrame):
+        reg = registry()
+        keyed = pd.DataFrame({
+            "home_id": reg.ids(lines["homeTeam"].astype(str), source=S3),
+            "away_id": reg.ids(lines["awayTeam"].astype(str), source=S3),
+            "day": _days(lines["game_date"].astype(str)),
+            "spread": pd.to_numeric(lines["spread"], errors="coerce").to_numpy(dtype=float),
+        })
+        keyed = keyed.drop_duplicates(["home_id", "away_id", "day"], keep="last")
+        self.lines = keyed[keyed["spread"].notna()].reset_index(drop=True)
+
+    def match(self, games: pd.DataFrame, game_date=None) -> np.ndarray:
+        """
+        Book home spread for each game, in ``games`` order.
+
+        Parameters
+        ----------
+        games : pd.DataFrame
+            ``away_team_name`` / ``home_team_name`` (Torvik spellings).
+        game_date : date-like or array-like, optional
+            Slate date for every game, or one per game.  Defaults to the
+            ``game_date`` column of ``games``.
+        """
+        n = len(games)
+        out = np.full(n, np.nan)
+        if n == 0 or self.lines.empty:
+            return out
+
+        reg = registry()
+        if game_date is None:
+            game_date = games["game_date"]
+        if np.ndim(game_date) == 0:
+            days = np.full(n, _days([game_date])[0])
+        else:
+            days = _days(game_date)
+        slate = pd.DataFrame({
+            "_game": np.arange(n),
+            "g_away": reg.ids(games["away_team_name"]),
+            "g_home": reg.ids(games["home_team_name"]),
+            "g_day": days,
+        })
+
+        hits = []
+        for flipped in (False, True):
+            home, away = ("g_away", "g_home") if flipped else ("g_home", "g_away")
+            hit = slate.merge(self.lines, left_on=[home, away], right_on=["home_id", "away_id"])
+            offset = (hit["day"] - hit["g_day"]).to_numpy()
+            near = np.abs(offset) <= 1
+            spread = hit["spread"].to_numpy()[near]
+            hits.append(pd.DataFrame({
+                "_game": hit["_game"].to_numpy()[near],
+                "_rank": _OFFSET_RANK[offset[near] + 1] + int(flipped),
+                "spread": -spread if flipped else spread,
+            }))
+        hits = pd.concat(hits, ignore_index=True)
+        if hits.empty:
+            return out
+        best = hits.sort_values(["_game", "_rank"], kind="mergesort").drop_duplicates("_game")
+        out[best["_game"].to_numpy()] = best["spread"].to_numpy()
+        return out
+
+
+def match_spreads(games: pd.DataFrame, lines: pd.DataFrame, game_date=None) -> np.ndarray:
+    """``LineMatcher(lines).match(games, game_date)``."""
+    return LineMatcher(lines).match(games, game_date)
@@ -4,7 +4,9 @@ Data-loading utilities for the College Basketball project.
 Key entry points
 ----------------
 load_training_dataframe()     → full pandas DataFrame with engineered targets
+                                (via the training_snapshot Parquet cache)
 split_X_y(df, target_reg, target_cls) → X, y_reg, y_cls split
+apply_dtype_plan(df)          → float32 features, int8 flags, int16/int8 targets
 train_val_split(df, target_reg, target_cls,
                 test_size=0.2, random_state=42) → train / val sets
 """
@@ -17,7 +19,8 @@ from decimal import Decimal
 
 import pandas as pd
 from sqlalchemy import create_engine
-from sklearn.model_selection import train_test_split
+
+from .training_snapshot import TrainingSnapshot
 
 
 # --------------------------------------------------------------------------- #
@@ -34,29 +37,39 @@ def _sa_engine():
 # --------------------------------------------------------------------------- #
 # 2. Main loader
 # --------------------------------------------------------------------------- #
-def load_training_dataframe() -> pd.DataFrame:
+def _engineer_targets(df: pd.DataFrame) -> pd.DataFrame:
+    """Targets / home flags from a snapshot frame (points already int16, NULL → 0)."""
+    df["MOV"] = df["away_team_pts"] - df["home_team_pts"]
+    df["spread_home"] = -df["MOV"] 
+    df["total_pts"] = df["away_team_pts"] + df["home_team_pts"]
+    df["home_win"] = (df["home_team_pts"] > df["away_team_pts"]).astype("int8") 
+    df["home_team_home"] = df["neutral_site"].eq(0)
+    df["away_team_home"] = False
+    return df.drop(columns=['date', 'MOV', 'total_pts' , 'away_team_name', 'home_team_name', 'away_team_pts', 'home_team_pts'])
+
+
+def load_training_dataframe(
+    snapshot: TrainingSnapshot | None = None, full_refresh: bool = False
+) -> pd.DataFrame:
     """
-    Loads `sports.training_data` from MySQL, or `training_data.csv`
-    if the DB is unreachable.  Returns a fully numeric DataFrame with
-    engineered targets.
+    Loads `sports.training_data` through the local columnar snapshot
+    (refreshed from MySQL with only the rows past its watermark, or in full
+    with `full_refresh=True`).  If the DB is unreachable the last snapshot is
+    used as is, then `training_data.csv`.
+    Returns a fully numeric DataFrame with engineered targets.
     """
     csv_fallback = Path("training_data.csv")
+    snapshot = snapshot if snapshot is not None else TrainingSnapshot()
 
     try:
-        sql = "SELECT * FROM sports.training_data"
-        df = pd.read_sql(sql, _sa_engine(), coerce_float=True)
-        df["away_team_pts"] = pd.to_numeric(df["away_team_pts"], errors="coerce").fillna(0).astype("int64")
-        df["home_team_pts"] = pd.to_numeric(df["home_team_pts"], errors="coerce").fillna(0).astype("int64")
-        df["MOV"] = df["away_team_pts"] - df["home_team_pts"]
-        df["spread_home"] = -df["MOV"] 
-        df["total_pts"] = df["away_team_pts"] + df["home_team_pts"]
-        df["home_win"] = (df["home_team_pts"] > df["away_team_pts"]).astype("int8") 
-        df["home_team_home"] = df["neutral_site"].eq(0)
-        df["away_team_home"] = False
-        df = df.drop(columns=['date', 'MOV', 'total_pts' , 'away_team_name', 'home_team_name', 'away_team_pts', 'home_team_pts'])
-        print(f"✓ Loaded {len(df):,} rows from MySQL")
+        df = _engineer_targets(snapshot.refresh(_sa_engine(), full=full_refresh))
+        print(f"✓ Loaded {len(df):,} rows from MySQL ({snapshot.pulled:,} pulled)")
     except Exception as err:
-        if csv_fallback.exists():
+        raw = snapshot.read()
+        if raw is not None:
+            print(f"⚠️  MySQL failed ({err!s}); using snapshot {snapshot.path}")
+            df = _engineer_targets(raw)
+        elif csv_fallback.exists():
             print(f"⚠️  MySQL failed ({err!s}); using {csv_fallback}")
             df = pd.read_csv(csv_fallback)
         else:
@@ -65,16 +78,30 @@ def load_training_dataframe() -> pd.DataFrame:
                 "does not exist."
             ) from err
 
-    # ------------------------------------------------------------------- #
-    # Feature engineering identical to legacy script
-    # ------------------------------------------------------------------- #
-    
-    
-    df = df.apply(pd.to_numeric, errors="raise")
+    return apply_dtype_plan(df)
+
+
+# Targets keep exact integer values; everything else is a model input.
+TARGET_DTYPES = {"spread_home": "int16", "home_win": "int8"}
+FLAG_COLUMNS = ("neutral_site", "home_team_home", "away_team_home")
+
 
-    # Make sure booleans are int8
-    bool_cols = df.select_dtypes("bool").columns
-    df[bool_cols] = df[bool_cols].astype("int8")
+def apply_dtype_plan(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast ``df`` in place to the training dtype plan: ``TARGET_DTYPES``,
+    int8 flags (``FLAG_COLUMNS`` and any bool), float32 for the rest.
+    Columns already in the planned dtype are left untouched.
+    """
+    for col in df.columns:
+        current = df[col].dtype
+        if col in TARGET_DTYPES:
+            want = TARGET_DTYPES[col]
+        elif col in FLAG_COLUMNS or current == bool:
+            want = "int8"
+        else:
+            want = "float32"
+        if current != want:
+            df[col] = pd.to_numeric(df[col], errors="raise").astype(want)
     return df
 
 
@@ -82,7 +109,7 @@ def load_training_dataframe() -> pd.DataFrame:
 # 3. Convenience split helpers
 # --------------------------------------------------------------------------- #
 def split_X_y(
-    df: pd.DataFrame, target_reg: str, target_cls: str
+    df: pd.DataFrame, target_reg: str, target_cls: str, inplace: bool = False
 ) -> Tuple[pd.DataFrame, pd.Series, pd.Series]:
     """
     Splits DataFrame into feature matrix X and two target Series.
@@ -94,11 +121,18 @@ def split_X_y(
         Column name for regression target (e.g., 'MOV').
     target_cls : str
         Column name for classification target (e.g., 'home_win').
+    inplace : bool
+        Pop the targets off ``df`` and return it as X instead of copying
+        the feature columns.
 
     Returns
     -------
     X, y_reg, y_cls
     """
+    if inplace:
+        y_reg = df.pop(target_reg)
+        y_cls = df.pop(target_cls)
+        return df, y_reg, y_cls
     X = df.drop(columns=[target_reg, target_cls])
     y_reg = df[target_reg]
     y_cls = df[target_cls]
@@ -115,6 +149,8 @@ def train_val_split(
     """
     Convenience wrapper: returns train / val splits for X, y_reg, y_cls.
     """
+    from sklearn.model_selection import train_test_split
+
     X, y_reg, y_cls = split_X_y(df, target_reg, target_cls) 
     return train_test_split(
         X,
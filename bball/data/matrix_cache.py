@@ -0,0 +1,177 @@
+"""
+Memory-mapped cache of scaled, feature-ordered training matrices.
+
+``BasketballDataset`` used to copy every DataFrame into a fresh float32
+tensor: once for train and once for val in ``trainer._fit``, again for each
+model, and again in every Optuna trial.  Here the scaled matrix is written
+once to a float32 ``.npy`` file named after a fingerprint of the source rows,
+the feature order and the scaler.  Later runs map that file read-only, and
+because ``torch.from_numpy`` wraps the mapping, a dataset built on it shares
+the pages instead of copying them.
+
+Files live under ``$BBALL_MATRIX_CACHE`` (default ``.cache/matrices``).  Each
+new training snapshot yields new fingerprints, so after writing a matrix the
+cache keeps only the ``keep`` most recently used files (a hit refreshes a
+file's mtime) plus whatever this process has mapped.
+
+Key entry points
+----------------
+matrix_fingerprint(X_df, feature_order, scaler)  → hex digest
+fit_scaler(X_df)                                 → StandardScaler, fitted in row chunks
+TrainingMatrixCache().matrix(X_df, feature_order, scaler)
+                                                → read-only float32 memmap
+TrainingMatrixCache().frame(X_df, feature_order, scaler)
+                                                → DataFrame view over the memmap
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MATRIX_DIR = Path(".cache") / "matrices"
+DEFAULT_KEEP = 4  # train + val for the current and the previous run
+
+_SCALER_ATTRS = ("mean_", "scale_")
+
+
+def matrix_cache_root() -> Path:
+    return Path(os.getenv("BBALL_MATRIX_CACHE", str(DEFAULT_MATRIX_DIR)))
+
+
+def _ordered(X_df: pd.DataFrame, feature_order: Sequence[str]) -> pd.DataFrame:
+    # reindex copies the whole frame; skip it when the columns already match
+    if list(X_df.columns) == list(feature_order):
+        return X_df
+    return X_df.reindex(columns=list(feature_order))
+
+
+def matrix_fingerprint(X_df: pd.DataFrame, feature_order: Sequence[str], scaler=None) -> str:
+    """Digest of the rows (values + index), the column order and the scaler."""
+    h = hashlib.sha256()
+    h.update(json.dumps(list(feature_order)).encode())
+    rows = pd.util.hash_pandas_object(_ordered(X_df, feature_order), index=True)
+    h.update(rows.to_numpy().tobytes())
+    if scaler is not None:
+        for attr in _SCALER_ATTRS:
+            value = getattr(scaler, attr, None)
+            if value is not None:
+                h.update(attr.encode())
+                h.update(np.asarray(value, dtype=np.float64).tobytes())
+    return h.hexdigest()[:32]
+
+
+def float32_matrix(X_df: pd.DataFrame, feature_order: Sequence[str]) -> np.ndarray:
+    """
+    ``X_df[feature_order]`` as one C-contiguous float32 array, filled column
+    by column so mixed float32 / int8 frames are never materialised twice.
+    Missing columns are NaN, as with ``reindex``.
+    """
+    X = np.empty((len(X_df), len(feature_order)), dtype=np.float32)
+    for j, col in enumerate(feature_order):
+        if col in X_df.columns:
+            X[:, j] = X_df[col].to_numpy()
+        else:
+            X[:, j] = np.nan
+    return X
+
+
+def fit_scaler(X_df: pd.DataFrame, chunk_rows: int = 65536):
+    """
+    ``StandardScaler`` fitted with ``partial_fit`` over row chunks, so at most
+    ``chunk_rows`` rows are converted to an array at a time.
+    """
+    from sklearn.preprocessing import StandardScaler
+
+    scaler = StandardScaler()
+    for start in range(0, max(len(X_df), 1), chunk_rows):
+        scaler.partial_fit(X_df.iloc[start:start + chunk_rows])
+    return scaler
+
+
+def scale_in_place(X: np.ndarray, scaler=None) -> np.ndarray:
+    """``StandardScaler.transform`` without the float64 copy (``X`` is float32)."""
+    if scaler is None:
+        return X
+    mean = getattr(scaler, "mean_", None)
+    scale = getattr(scaler, "scale_", None)
+    if mean is not None:
+        X -= np.asarray(mean, dtype=X.dtype)
+    if scale is not None:
+        X /= np.asarray(scale, dtype=X.dtype)
+    return X
+
+
+class TrainingMatrixCache:
+    """
+    Fingerprint-keyed float32 ``.npy`` matrices, mapped with ``mmap_mode='r'``.
+
+    Parameters
+    ----------
+    root : path, optional
+        Defaults to ``$BBALL_MATRIX_CACHE`` / ``.cache/matrices``.
+    keep : int
+        Most recently used ``.npy`` files kept when pruning after a write.
+    """
+
+    def __init__(self, root: str | Path | None = None, keep: int = DEFAULT_KEEP):
+        self.root = Path(root) if root is not None else matrix_cache_root()
+        self.keep = keep
+        self._maps: dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+        self.built: list[str] = []  # fingerprints written by this instance
+
+    def path(self, fingerprint: str) -> Path:
+        return self.root / f"{fingerprint}.npy"
+
+    def prune(self) -> list[str]:
+        """
+        Delete all but the ``keep`` most recently used matrices, never one
+        this instance has mapped.  Returns the removed fingerprints.
+        """
+        files = sorted(self.root.glob("*.npy"), key=lambda p: p.stat().st_mtime, reverse=True)
+        removed = []
+        for path in files[self.keep:]:
+            fp = path.name[: -len(".npy")]
+            if fp in self._maps or fp.endswith(".tmp"):
+                continue
+            path.unlink(missing_ok=True)
+            removed.append(fp)
+        return removed
+
+    def matrix(self, X_df: pd.DataFrame, feature_order: Sequence[str], scaler=None) -> np.ndarray:
+        """Scaled ``X_df[feature_order]`` as a read-only float32 memmap."""
+        fp = matrix_fingerprint(X_df, feature_order, scaler)
+        with self._lock:
+            hit = self._maps.get(fp)
+            if hit is not None:
+                return hit
+            path = self.path(fp)
+            wrote = not path.exists()
+            if wrote:
+                X = float32_matrix(X_df, feature_order)
+                scale_in_place(X, scaler)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(".tmp.npy")
+                np.save(tmp, np.ascontiguousarray(X))
+                os.replace(tmp, path)
+                del X
+                self.built.append(fp)
+            else:
+                os.utime(path)  # mark as recently used for prune()
+            mm = np.load(path, mmap_mode="r")
+            self._maps[fp] = mm
+            if wrote:
+                self.prune()
+            return mm
+
+    def frame(self, X_df: pd.DataFrame, feature_order: Sequence[str], scaler=None) -> pd.DataFrame:
+        """``matrix`` wrapped in a DataFrame without copying (same index as ``X_df``)."""
+        mm = self.matrix(X_df, feature_order, scaler)
+        return pd.DataFrame(mm, columns=list(feature_order), index=X_df.index, copy=False)
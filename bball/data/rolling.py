@@ -0,0 +1,447 @@
+"""
+Incremental rolling-stat engine for the offensive / defensive averages tables.
+
+Instead of recomputing every team's full-season, last-N-game and
+decreasing-weight averages from scratch for each calendar day, the engine
+keeps per-team running state:
+
+* running sum / sum of squares for the full-season mean and stdev
+* a ring buffer of the most recent games plus running window sums / sums of
+  squares for each last-N window
+* weighted sums of the games that have aged out of each decreasing-weight
+  window (their weight never changes once they leave it)
+
+Feeding a day's team-game rows (see ``bball.data.team_games``) only touches
+the teams that actually played, and snapshots are cached per team until that
+team's state changes again.
+
+For batch work (backfills, the legacy ``get_*_decreased_games`` helpers)
+``decayed_moments`` computes every decreasing-weight mean / stdev for every
+stat, window and prefix of a team's games with a single matmul against a
+precomputed weight tensor.
+
+``required_aggregates`` turns a model's feature order (plus the columns the
+``sub_offensive_averages`` / ``sub_defensive_averages`` projections read) into
+the minimal set of aggregates, so the engine can skip everything else.
+
+Key entry points
+----------------
+decayed_moments(values, windows)        → (mean, std), shape (W, n_games, n_stats)
+required_aggregates(feature_order)      → {(kind, window, agg, stat), ...}
+RollingStatEngine(stat_columns, windows, decay_windows, required=None)
+RollingStatEngine.for_aggregates(specs)
+engine.update(team_game_log)            → fold new games in (date order)
+engine.eligible_teams(min_games)        → teams with > min_games home or away
+engine.snapshot(teams, date)            → one row per team, legacy column names
+full_layout(snapshot)                   → pad a restricted snapshot with NULL columns
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .team_games import STAT_COLUMNS
+
+NUMBER_WORDS = {
+    2: "two",
+    3: "three",
+    4: "four",
+    5: "five",
+    7: "seven",
+    10: "ten",
+    12: "twelve",
+    15: "fifteen",
+    20: "twenty",
+}
+
+DEFAULT_WINDOWS = (3, 5, 10)
+DEFAULT_DECAY_WINDOWS = (5, 15)
+DECAY_STEP = 0.05
+
+# (kind, window, agg, stat) – see stat_column_name
+AggSpec = Tuple[str, Optional[int], str, str]
+
+
+# --------------------------------------------------------------------------- #
+# 1. Column naming (matches the legacy offensive_averages layout)
+# --------------------------------------------------------------------------- #
+def stat_column_name(kind: str, window: int | None, agg: str, stat: str) -> str:
+    """
+    Name of one aggregate column as written by more_stats.
+
+    kind   : "full_season" | "window" | "decay"
+    window : games in the window (ignored for full_season)
+    agg    : "avg" | "std"
+    """
+    if kind == "full_season":
+        return f"full_season_avg_{stat}_avg" if agg == "avg" else f"full_season_stdev_{stat}_std"
+    word = NUMBER_WORDS[window]
+    if kind == "window":
+        if agg == "avg":
+            return f"{word}_game_avg_{stat}_{window}_games_avg"
+        return f"{word}_game_std_devs_{stat}_std"
+    if kind == "decay":
+        if agg == "avg":
+            return f"{word}_game_decreasing_avg_{stat}_avg"
+        return f"{word}_game_decreasing_std_{stat}_std"
+    raise ValueError(f"unknown aggregate kind: {kind!r}")
+
+
+def decay_weight(position: int) -> float:
+    """
+    Weight of the game at ``position`` (0 = oldest) once it has dropped out
+    of a decreasing-weight window.  Games inside the window weigh 1.
+    """
+    return max(1.0 - DECAY_STEP * (position + 1), 0.0)
+
+
+def all_aggregates(
+    stat_columns: Sequence[str] = STAT_COLUMNS,
+    windows: Sequence[int] = DEFAULT_WINDOWS,
+    decay_windows: Sequence[int] = DEFAULT_DECAY_WINDOWS,
+) -> list[AggSpec]:
+    """Every aggregate the full builder writes, in legacy column order."""
+    specs: list[AggSpec] = []
+    specs += [("full_season", None, "avg", s) for s in stat_columns]
+    specs += [("full_season", None, "std", s) for s in stat_columns]
+    for w in sorted(windows):
+        specs += [("window", w, "avg", s) for s in stat_columns]
+        specs += [("window", w, "std", s) for s in stat_columns]
+    for g in sorted(decay_windows):
+        specs += [("decay", g, "avg", s) for s in stat_columns]
+        specs += [("decay", g, "std", s) for s in stat_columns]
+    return specs
+
+
+# --------------------------------------------------------------------------- #
+# 2. Required-aggregate planning
+# --------------------------------------------------------------------------- #
+# Columns of the sub_* tables read by predict_games / training, and the
+# offensive/defensive_averages aggregate each one is projected from.
+SUB_OFFENSIVE_SOURCES = {
+    stat: ("decay", 15, "avg", stat)
+    for stat in ["eff_fg_pct", "ft_pct", "ft_rate", "3pt_rate", "3p_pct",
+                 "off_rebound_pct", "def_rebound_pct"]
+}
+SUB_DEFENSIVE_SOURCES = {
+    "def_" + stat: ("decay", 15, "avg", "opp_" + stat)
+    for stat in ["eff_fg_pct", "ft_rate", "3pt_rate", "3p_pct",
+                 "off_rebound_pct", "def_rebound_pct"]
+}
+
+_SIDE_PREFIXES = ("away_", "home_")
+
+
+def _column_lookup() -> dict[str, AggSpec]:
+    windows = tuple(NUMBER_WORDS)
+    return {
+        stat_column_name(*spec): spec
+        for spec in all_aggregates(STAT_COLUMNS, windows, windows)
+    }
+
+
+def required_aggregates(
+    feature_order: Iterable[str] = (),
+    include_sub_tables: bool = True,
+) -> set[AggSpec]:
+    """
+    Aggregates needed to serve ``feature_order``.
+
+    Feature names are matched with their ``away_`` / ``home_`` prefix
+    stripped, first against the sub_* table columns (``eff_fg_pct``,
+    ``def_3p_pct``, ...) and then against raw averages column names.
+    Features that come from elsewhere (daily_data, lines, ...) are ignored.
+    The sub_* projections themselves are always included unless
+    ``include_sub_tables`` is False.
+    """
+    lookup = _column_lookup()
+    specs: set[AggSpec] = set()
+    if include_sub_tables:
+        specs.update(SUB_OFFENSIVE_SOURCES.values())
+        specs.update(SUB_DEFENSIVE_SOURCES.values())
+    for feat in feature_order:
+        name = feat
+        for prefix in _SIDE_PREFIXES:
+            if name.startswith(prefix):
+                name = name[len(prefix):]
+                break
+        spec = SUB_DEFENSIVE_SOURCES.get(name) or SUB_OFFENSIVE_SOURCES.get(name) or lookup.get(name)
+        if spec is not None:
+            specs.add(spec)
+    return specs
+
+
+# --------------------------------------------------------------------------- #
+# 3. Closed-form decreasing-weight kernel
+# --------------------------------------------------------------------------- #
+@lru_cache(maxsize=256)
+def decay_weight_matrix(n_games: int, windows: tuple[int, ...]) -> np.ndarray:
+    """
+    Weight tensor of shape ``(len(windows), n_games, n_games)``.
+
+    ``W[w, k, p]`` is the weight of game ``p`` (0 = oldest) in the snapshot
+    taken after the first ``k + 1`` games with window ``windows[w]``: 1 for the
+    last ``window`` games, ``decay_weight(p)`` for older ones, 0 for games
+    not yet played.  Cached and read-only.
+    """
+    pos = np.arange(n_games)
+    prefix_len = pos[:, None] + 1                                  # (n, 1)
+    played = pos[None, :] < prefix_len                             # (n, n)
+    decayed = np.clip(1.0 - DECAY_STEP * (pos + 1), 0.0, None)     # (n,)
+    win = np.asarray(windows)[:, None, None]                       # (W, 1, 1)
+    in_window = pos[None, None, :] >= prefix_len[None] - win       # (W, n, n)
+    weights = np.where(in_window, 1.0, decayed[None, None, :]) * played[None]
+    weights.setflags(write=False)
+    return weights
+
+
+def decayed_moments(
+    values: np.ndarray,
+    windows: Sequence[int],
+    last_only: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Decreasing-weight mean and (population) stdev of every stat column.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        ``(n_games, n_stats)`` team-game stats, oldest first.
+    windows : sequence of int
+        Decreasing-weight windows (e.g. 3, 5, 7, 10, 12, 15, 20).
+    last_only : bool
+        Only compute the snapshot after the last game.
+
+    Returns
+    -------
+    mean, std : np.ndarray
+        Shape ``(len(windows), n_prefixes, n_stats)`` where prefix ``k``
+        covers the first ``k + 1`` games (``n_prefixes == 1`` if
+        ``last_only``).
+    """
+    x = np.asarray(values, dtype=float)
+    if x.ndim == 1:
+        x = x[:, None]
+    weights = decay_weight_matrix(len(x), tuple(windows))
+    if last_only:
+        weights = weights[:, -1:, :]
+    total_w = weights.sum(axis=-1, keepdims=True)
+    mean = (weights @ x) / total_w
+    var = (weights @ (x * x)) / total_w - mean * mean
+    return mean, np.sqrt(np.clip(var, 0.0, None))
+
+
+# --------------------------------------------------------------------------- #
+# 4. Per-team running state
+# --------------------------------------------------------------------------- #
+class _TeamState:
+    __slots__ = (
+        "n", "n_home", "n_away", "total", "total_sq", "ring",
+        "win_sum", "win_sq", "decay_w", "decay_wx", "decay_wx2",
+    )
+
+    def __init__(self, n_stats: int, ring_len: int, windows: Sequence[int], decay_windows: Sequence[int]):
+        self.n = 0
+        self.n_home = 0
+        self.n_away = 0
+        self.total = np.zeros(n_stats)
+        self.total_sq = np.zeros(n_stats)
+        self.ring = np.zeros((ring_len, n_stats))
+        self.win_sum = {w: np.zeros(n_stats) for w in windows}
+        self.win_sq = {w: np.zeros(n_stats) for w in windows}
+        self.decay_w = {g: 0.0 for g in decay_windows}
+        self.decay_wx = {g: np.zeros(n_stats) for g in decay_windows}
+        self.decay_wx2 = {g: np.zeros(n_stats) for g in decay_windows}
+
+    def push(self, row: np.ndarray, is_home: bool) -> None:
+        ring_len = len(self.ring)
+        idx = self.n  # 0-based index of the incoming game
+
+        # games leaving each last-N window (read before the ring slot is reused)
+        for w in self.win_sum:
+            if idx - w >= 0:
+                old = self.ring[(idx - w) % ring_len]
+                self.win_sum[w] -= old
+                self.win_sq[w] -= old * old
+        for g in self.decay_w:
+            if idx - g >= 0:
+                old = self.ring[(idx - g) % ring_len]
+                wt = decay_weight(idx - g)
+                self.decay_w[g] += wt
+                self.decay_wx[g] += wt * old
+                self.decay_wx2[g] += wt * old * old
+
+        self.ring[idx % ring_len] = row
+        for w in self.win_sum:
+            self.win_sum[w] += row
+            self.win_sq[w] += row * row
+        self.total += row
+        self.total_sq += row * row
+        self.n += 1
+        if is_home:
+            self.n_home += 1
+        else:
+            self.n_away += 1
+
+
+def _mean_std(total: np.ndarray, total_sq: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """Mean and sample stdev (ddof=1) from running sums over ``k`` games."""
+    mean = total / k
+    if k < 2:
+        return mean, np.full_like(mean, np.nan)
+    var = (total_sq - total * mean) / (k - 1)
+    return mean, np.sqrt(np.clip(var, 0.0, None))
+
+
+# --------------------------------------------------------------------------- #
+# 5. Engine
+# --------------------------------------------------------------------------- #
+class RollingStatEngine:
+    """
+    Running per-team aggregates over a season of team-game rows.
+
+    Parameters
+    ----------
+    stat_columns : list[str]
+        Per-game stat columns to aggregate (default: every STAT_COLUMN).
+    windows : tuple[int]
+        Last-N-game windows (mean + sample stdev).
+    decay_windows : tuple[int]
+        Decreasing-weight windows (weighted mean + weighted stdev).
+    required : iterable of AggSpec, optional
+        Only emit these aggregates (see ``required_aggregates``); by default
+        every combination of the above is written.
+    """
+
+    def __init__(
+        self,
+        stat_columns: Sequence[str] = STAT_COLUMNS,
+        windows: Sequence[int] = DEFAULT_WINDOWS,
+        decay_windows: Sequence[int] = DEFAULT_DECAY_WINDOWS,
+        required: Optional[Iterable[AggSpec]] = None,
+    ):
+        self.stat_columns = list(stat_columns)
+        self.windows = tuple(sorted(windows))
+        self.decay_windows = tuple(sorted(decay_windows))
+        self._tracked = tuple(sorted(set(self.windows) | set(self.decay_windows)))
+        self._ring_len = (max(self._tracked) if self._tracked else 0) + 1
+        self._teams: dict[str, _TeamState] = {}
+        self._cache: dict[str, np.ndarray] = {}
+
+        specs = all_aggregates(self.stat_columns, self.windows, self.decay_windows)
+        if required is None:
+            self._keep = None
+        else:
+            wanted = set(required)
+            missing = wanted.difference(specs)
+            if missing:
+                raise ValueError(f"aggregates not covered by this engine: {sorted(missing, key=str)}")
+            self._keep = np.array([i for i, spec in enumerate(specs) if spec in wanted], dtype=int)
+            specs = [specs[i] for i in self._keep]
+        self.columns = [stat_column_name(*spec) for spec in specs]
+
+    @classmethod
+    def for_aggregates(cls, required: Iterable[AggSpec]) -> "RollingStatEngine":
+        """
+        Smallest engine that produces ``required``: only the stats and
+        windows that appear in it are tracked.
+        """
+        required = set(required)
+        stats = {spec[3] for spec in required}
+        return cls(
+            stat_columns=[s for s in STAT_COLUMNS if s in stats],
+            windows=sorted({w for kind, w, _, _ in required if kind == "window"}),
+            decay_windows=sorted({w for kind, w, _, _ in required if kind == "decay"}),
+            required=required,
+        )
+
+    # ------------------------------------------------------------------- #
+    def update(self, log: pd.DataFrame) -> list[str]:
+        """
+        Fold team-game rows (``build_team_game_log`` output, date-sorted)
+        into the running state.  Returns the teams that were touched.
+        """
+        if log.empty:
+            return []
+        values = log[self.stat_columns].to_numpy(dtype=float)
+        touched: dict[str, None] = {}
+        n_stats = len(self.stat_columns)
+        for team, is_home, row in zip(log["team_name"].to_numpy(), log["is_home"].to_numpy(), values):
+            state = self._teams.get(team)
+            if state is None:
+                state = _TeamState(n_stats, self._ring_len, self._tracked, self.decay_windows)
+                self._teams[team] = state
+            state.push(row, bool(is_home))
+            touched[team] = None
+        for team in touched:
+            self._cache.pop(team, None)
+        return list(touched)
+
+    def games_played(self, team: str) -> int:
+        state = self._teams.get(team)
+        return state.n if state else 0
+
+    def eligible_teams(self, min_games: int) -> list[str]:
+        """Teams with more than ``min_games`` away *or* home games so far."""
+        return [
+            team for team, st in self._teams.items()
+            if st.n_away > min_games or st.n_home > min_games
+        ]
+
+    # ------------------------------------------------------------------- #
+    def _team_row(self, team: str) -> np.ndarray:
+        cached = self._cache.get(team)
+        if cached is not None:
+            return cached
+
+        st = self._teams[team]
+        parts = list(_mean_std(st.total, st.total_sq, st.n))
+        for w in self.windows:
+            parts.extend(_mean_std(st.win_sum[w], st.win_sq[w], min(st.n, w)))
+        for g in self.decay_windows:
+            k = min(st.n, g)
+            weight = st.decay_w[g] + k
+            mean = (st.decay_wx[g] + st.win_sum[g]) / weight
+            var = (st.decay_wx2[g] + st.win_sq[g]) / weight - mean * mean
+            parts.extend([mean, np.sqrt(np.clip(var, 0.0, None))])
+
+        row = np.concatenate(parts)
+        if self._keep is not None:
+            row = row[self._keep]
+        self._cache[team] = row
+        return row
+
+    def snapshot(self, teams: Iterable[str], date=None) -> pd.DataFrame:
+        """
+        One row per team in the legacy offensive/defensive_averages layout:
+        ``Date, TeamName`` followed by ``self.columns``.
+        """
+        teams = [t for t in teams if t in self._teams]
+        if teams:
+            values = np.vstack([self._team_row(t) for t in teams])
+        else:
+            values = np.empty((0, len(self.columns)))
+        out = pd.DataFrame(values, columns=self.columns)
+        out.insert(0, "TeamName", teams)
+        out.insert(0, "Date", date)
+        return out
+
+
+def full_layout(snapshot: pd.DataFrame) -> pd.DataFrame:
+    """
+    ``snapshot`` padded to the full default-engine layout, aggregates it
+    does not carry set to NaN.  A restricted engine's rows written this way
+    NULL the unused columns on upsert (ON DUPLICATE KEY UPDATE only touches
+    the columns it sends), matching what LOAD DATA ... REPLACE does.
+    """
+    columns = ["Date", "TeamName"] + _default_columns()
+    extra = [c for c in snapshot.columns if c not in set(columns)]
+    return snapshot.reindex(columns=columns + extra)
+
+
+@lru_cache(maxsize=1)
+def _default_columns() -> list[str]:
+    return list(RollingStatEngine().columns)
@@ -0,0 +1,314 @@
+"""
+Local cache of the hoops-edge ``fct_lines`` partitions on S3.
+
+``_read_s3_lines`` used to list the season prefix and serially download every
+parquet object under the newest ``asof=`` snapshot on every call, then parse
+all columns before filtering by date.  Here each object is stored once on disk
+under a name derived from its ETag and size (the key when there is no ETag),
+so an unchanged object is never fetched twice, and the season's objects are
+consolidated into a single Arrow (Feather) file.  A repeated run only pays for
+the listing; a new ``asof=`` snapshot only transfers the objects that changed,
+fetched by a bounded thread pool.  Reads project to ``LINE_COLUMNS`` and apply
+the date window while scanning the Arrow file.
+
+Layout under the cache root (``$BBALL_S3_CACHE``, default ``.cache/fct_lines``)::
+
+    season=2026/objects/<digest>.parquet   one file per distinct object (ETag + size)
+    season=2026/lines.arrow                consolidated season table
+    season=2026/manifest.json              [key, etag, size] the .arrow was built from
+
+The client only needs ``list_objects_v2``, ``get_paginator`` and
+``get_object`` so tests can pass a local stand-in instead of boto3.
+
+Key entry points
+----------------
+read_season_lines(season, start=..., end=...)        → projected DataFrame
+list_season_objects(client, season)                  → newest asof= objects
+S3LinesCache(client, cache_dir).sync(season)         → path of the season file
+season_lock(root, season)                            → per-season RLock (threads)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Sequence
+
+import pandas as pd
+
+S3_BUCKET = "hoops-edge"
+S3_REGION = "us-east-1"
+SILVER_PREFIX = "silver"
+TABLE_FCT_LINES = "fct_lines"
+
+DEFAULT_CACHE_DIR = Path(".cache") / TABLE_FCT_LINES
+DEFAULT_WORKERS = 8
+
+# what line matching / dedup actually reads
+LINE_COLUMNS = ("gameId", "homeTeam", "awayTeam", "startDate", "spread",
+                "overUnder", "homeMoneyline", "provider")
+
+
+def s3_client():
+    import boto3
+
+    return boto3.client("s3", region_name=S3_REGION)
+
+
+def cache_root() -> Path:
+    return Path(os.getenv("BBALL_S3_CACHE", str(DEFAULT_CACHE_DIR)))
+
+
+# --------------------------------------------------------------------------- #
+# 1. Listing
+# --------------------------------------------------------------------------- #
+def season_prefix(season: int) -> str:
+    return f"{SILVER_PREFIX}/{TABLE_FCT_LINES}/season={season}/"
+
+
+def list_season_objects(client, season: int, bucket: str = S3_BUCKET) -> list[dict]:
+    """
+    ``{"key", "etag", "size"}`` for every parquet object in the season's
+    newest ``asof=`` snapshot (or directly under the season prefix if there
+    are no snapshots), sorted by key.
+    """
+    prefix = season_prefix(season)
+    resp = client.list_objects_v2(Bucket=bucket, Prefix=prefix, Delimiter="/")
+    sub_prefixes = [p["Prefix"] for p in resp.get("CommonPrefixes", [])]
+    asof_prefixes = sorted([p for p in sub_prefixes if "asof=" in p], reverse=True)
+    scan_prefix = asof_prefixes[0] if asof_prefixes else prefix
+
+    objects = []
+    paginator = client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket, Prefix=scan_prefix):
+        for obj in page.get("Contents", []):
+            if obj["Key"].endswith(".parquet"):
+                objects.append({
+                    "key": obj["Key"],
+                    "etag": str(obj.get("ETag", "")).strip('"'),
+                    "size": int(obj.get("Size", 0)),
+                })
+    return sorted(objects, key=lambda o: o["key"])
+
+
+def _window_filter(schema, start, end):
+    """pyarrow filter for ``start <= startDate < end`` (None if unbounded)."""
+    if (start is None and end is None) or "startDate" not in schema.names:
+        return None
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    field = pc.field("startDate")
+    typ = schema.field("startDate").type
+
+    def _bound(value):
+        ts = pd.Timestamp(value)
+        if pa.types.is_timestamp(typ):
+            if typ.tz is not None:
+                ts = ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+            elif ts.tzinfo is not None:
+                ts = ts.tz_convert("UTC").tz_localize(None)
+            return pa.scalar(ts, type=typ)
+        # ISO-8601 strings sort chronologically
+        return pa.scalar(ts.strftime("%Y-%m-%d"), type=typ)
+
+    expr = None
+    if start is not None:
+        expr = field >= _bound(start)
+    if end is not None:
+        upper = field < _bound(end)
+        expr = upper if expr is None else expr & upper
+    return expr
+
+
+_SEASON_LOCKS: dict[tuple[str, int], threading.RLock] = {}
+_SEASON_LOCKS_GUARD = threading.Lock()
+
+
+def season_lock(root: Path, season: int) -> threading.RLock:
+    """
+    Process-wide lock for one season directory.  Every ``S3LinesCache`` /
+    ``BestLinesTable`` on the same root shares it, so threads predicting
+    different days of one season never rebuild or prune it concurrently.
+    """
+    key = (str(Path(root).resolve()), int(season))
+    with _SEASON_LOCKS_GUARD:
+        lock = _SEASON_LOCKS.get(key)
+        if lock is None:
+            lock = _SEASON_LOCKS[key] = threading.RLock()
+        return lock
+
+
+def tmp_path(path: Path) -> Path:
+    """Unique sibling to write before ``os.replace`` (``*.tmp``, never pruned)."""
+    return path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+
+
+def _digest(obj: dict) -> str:
+    # content address: a re-published snapshot with identical objects reuses
+    # the cached files even though the asof= key changed
+    ident = f"{obj['etag']}\0{obj['size']}" if obj["etag"] else f"{obj['key']}\0{obj['size']}"
+    return hashlib.sha256(ident.encode()).hexdigest()[:32]
+
+
+# --------------------------------------------------------------------------- #
+# 2. Cache
+# --------------------------------------------------------------------------- #
+class S3LinesCache:
+    """
+    Object-level + consolidated per-season cache of ``fct_lines``.
+
+    Parameters
+    ----------
+    client : boto3 S3 client or stand-in
+    cache_dir : path, optional
+        Defaults to ``$BBALL_S3_CACHE`` / ``.cache/fct_lines``.
+    bucket : str
+    max_workers : int
+        Bound on concurrent ``get_object`` calls when filling the cache.
+    """
+
+    def __init__(
+        self,
+        client=None,
+        cache_dir: str | Path | None = None,
+        bucket: str = S3_BUCKET,
+        max_workers: int = DEFAULT_WORKERS,
+    ):
+        self._client = client
+        self.root = Path(cache_dir) if cache_dir is not None else cache_root()
+        self.bucket = bucket
+        self.max_workers = max_workers
+        self.downloaded: list[str] = []  # keys fetched by this instance
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = s3_client()
+        return self._client
+
+    def _season_dir(self, season: int) -> Path:
+        return self.root / f"season={season}"
+
+    # ---- objects --------------------------------------------------------- #
+    def _object_path(self, season: int, obj: dict) -> Path:
+        return self._season_dir(season) / "objects" / f"{_digest(obj)}.parquet"
+
+    def _fetch(self, season: int, obj: dict) -> Path:
+        path = self._object_path(season, obj)
+        if path.exists() and path.stat().st_size == obj["size"]:
+            return path
+        data = self.client.get_object(Bucket=self.bucket, Key=obj["key"])["Body"].read()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = tmp_path(path)
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        self.downloaded.append(obj["key"])
+        return path
+
+    def _prune(self, season: int, keep: set[Path]) -> None:
+        obj_dir = self._season_dir(season) / "objects"
+        if not obj_dir.exists():
+            return
+        for path in obj_dir.iterdir():
+            # *.tmp may be another process's download in flight
+            if path not in keep and path.suffix != ".tmp":
+                path.unlink(missing_ok=True)
+
+    def _fetch_all(self, season: int, objects: list[dict]) -> list[Path]:
+        # one fetch per distinct digest, so two workers never write one file
+        unique = list({_digest(obj): obj for obj in objects}.values())
+        if len(unique) <= 1 or self.max_workers <= 1:
+            fetched = [self._fetch(season, obj) for obj in unique]
+        else:
+            workers = min(self.max_workers, len(unique))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                fetched = list(pool.map(lambda obj: self._fetch(season, obj), unique))
+        by_digest = {_digest(obj): path for obj, path in zip(unique, fetched)}
+        return [by_digest[_digest(obj)] for obj in objects]
+
+    # ---- consolidated season file ---------------------------------------- #
+    def sync(self, season: int) -> Path | None:
+        """
+        Bring the season's consolidated Arrow file up to date and return its
+        path (None if the season has no objects).  Missing objects are
+        downloaded concurrently.  Serialised per season (``season_lock``).
+        """
+        with season_lock(self.root, season):
+            return self._sync(season)
+
+    def _sync(self, season: int) -> Path | None:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+        import pyarrow.parquet as pq
+
+        objects = list_season_objects(self.client, season, self.bucket)
+        if not objects:
+            return None
+
+        season_dir = self._season_dir(season)
+        arrow_path = season_dir / "lines.arrow"
+        manifest_path = season_dir / "manifest.json"
+        manifest = [[o["key"], o["etag"], o["size"]] for o in objects]
+        if arrow_path.exists() and manifest_path.exists():
+            try:
+                if json.loads(manifest_path.read_text()) == manifest:
+                    return arrow_path
+            except ValueError:
+                pass
+
+        paths = self._fetch_all(season, objects)
+        tables = [pq.read_table(str(p)) for p in paths]
+        table = pa.concat_tables(tables, promote_options="default")
+        tmp = tmp_path(arrow_path)
+        feather.write_feather(table, tmp)
+        os.replace(tmp, arrow_path)
+        manifest_path.write_text(json.dumps(manifest))
+        self._prune(season, set(paths))
+        return arrow_path
+
+    def read(
+        self,
+        season: int,
+        columns: Sequence[str] | None = LINE_COLUMNS,
+        start=None,
+        end=None,
+    ) -> pd.DataFrame:
+        """
+        ``fct_lines`` rows for ``season``, downloading only new objects.
+
+        Parameters
+        ----------
+        columns : sequence of str or None
+            Projection (columns absent from the data are skipped); None reads
+            everything.
+        start, end : date-like, optional
+            Keep rows with ``start <= startDate < end`` (UTC).  The filter is
+            applied while scanning the Arrow file, before pandas conversion.
+        """
+        import pyarrow.dataset as ds
+
+        arrow_path = self.sync(season)
+        if arrow_path is None:
+            return pd.DataFrame()
+        dataset = ds.dataset(str(arrow_path), format="feather")
+        if columns is not None:
+            columns = [c for c in columns if c in dataset.schema.names]
+        expr = _window_filter(dataset.schema, start, end)
+        return dataset.to_table(columns=columns, filter=expr).to_pandas()
+
+
+def read_season_lines(
+    season: int,
+    client=None,
+    cache_dir: str | Path | None = None,
+    columns: Sequence[str] | None = LINE_COLUMNS,
+    start=None,
+    end=None,
+) -> pd.DataFrame:
+    """Season's ``fct_lines`` through the local cache (see ``S3LinesCache.read``)."""
+    return S3LinesCache(client, cache_dir).read(season, columns=columns, start=start, end=end)
@@ -0,0 +1,140 @@
+"""
+Batched "latest row as of D" lookups for a slate of games.
+
+``predict_games.get_stats`` / ``get_all_stats`` issue six single-team queries
+per game.  Here every source table is hit once for the whole slate with a
+``ROW_NUMBER()`` window query, and the away/home feature columns are then
+assembled with vectorised joins, using the same column names as the
+per-game helpers.
+
+Key entry points
+----------------
+AS_OF_SOURCES                               → table → team/date/value columns
+fetch_latest_as_of(cursor, table, teams, d) → one row per team (latest <= d)
+fetch_slate_sources(cursor, teams, d)       → {table: latest rows}
+assemble_slate_features(games, latest)      → basic + four-factor features
+"""
+from __future__ import annotations
+
+from typing import Iterable, Mapping
+
+import numpy as np
+import pandas as pd
+
+
+# --------------------------------------------------------------------------- #
+# 1. Sources
+# --------------------------------------------------------------------------- #
+AS_OF_SOURCES = {
+    "daily_data": {
+        "team": "team_name",
+        "date": "date",
+        "columns": ["adj_oe", "adj_de", "BARTHAG", "adj_pace"],
+    },
+    "sub_offensive_averages": {
+        "team": "TeamName",
+        "date": "Date",
+        "columns": ["eff_fg_pct", "ft_pct", "ft_rate", "3pt_rate", "3p_pct",
+                    "off_rebound_pct", "def_rebound_pct"],
+    },
+    "sub_defensive_averages": {
+        "team": "TeamName",
+        "date": "Date",
+        "columns": ["def_eff_fg_pct", "def_ft_rate", "def_3pt_rate", "def_3p_pct",
+                    "def_off_rebound_pct", "def_def_rebound_pct"],
+    },
+}
+
+# get_stats output order (before the home flags)
+_BASIC_COLUMNS = [
+    ("away", "adj_oe"), ("away", "BARTHAG"), ("away", "adj_de"), ("away", "adj_pace"),
+    ("home", "adj_oe"), ("home", "adj_de"), ("home", "adj_pace"), ("home", "BARTHAG"),
+]
+
+
+# --------------------------------------------------------------------------- #
+# 2. Queries
+# --------------------------------------------------------------------------- #
+def fetch_latest_as_of(cursor, table: str, teams: Iterable[str], as_of) -> pd.DataFrame:
+    """
+    Latest row per team in ``sports.<table>`` with date <= ``as_of``.
+
+    Returns a frame indexed by team name holding the table's value columns;
+    teams with no row on or before ``as_of`` are simply absent.
+    """
+    src = AS_OF_SOURCES[table]
+    teams = sorted(set(teams))
+    if not teams:
+        return pd.DataFrame(columns=src["columns"]).rename_axis("team")
+
+    team_col, date_col = src["team"], src["date"]
+    value_sql = ", ".join(f"`{c}`" for c in src["columns"])
+    placeholders = ", ".join(["%s"] * len(teams))
+    sql = f"""SELECT `{team_col}`, {value_sql} FROM (
+        SELECT `{team_col}`, {value_sql},
+               ROW_NUMBER() OVER (PARTITION BY `{team_col}` ORDER BY `{date_col}` DESC) AS rn
+        FROM sports.{table}
+        WHERE `{team_col}` IN ({placeholders}) AND `{date_col}` <= %s
+    ) latest
+    WHERE rn = 1"""
+    cursor.execute(sql, (*teams, as_of))
+    rows = cursor.fetchall()
+    df = pd.DataFrame(rows, columns=["team"] + src["columns"])
+    return df.set_index("team")
+
+
+def fetch_slate_sources(cursor, teams: Iterable[str], as_of) -> dict[str, pd.DataFrame]:
+    """One windowed query per source table for every team on the slate."""
+    teams = sorted(set(teams))
+    return {table: fetch_latest_as_of(cursor, table, teams, as_of) for table in AS_OF_SOURCES}
+
+
+# --------------------------------------------------------------------------- #
+# 3. Assembly
+# --------------------------------------------------------------------------- #
+def _side_values(latest: pd.DataFrame, names: pd.Series, columns) -> pd.DataFrame:
+    """Row-aligned lookup of ``columns`` for each team in ``names``."""
+    return latest.reindex(names.to_numpy())[list(columns)].reset_index(drop=True)
+
+
+def assemble_slate_features(
+    games: pd.DataFrame,
+    latest: Mapping[str, pd.DataFrame],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Build the ``get_stats`` and ``get_all_stats`` columns for every game.
+
+    Parameters
+    ----------
+    games : pd.DataFrame
+        Slate with ``away_team_name``, ``home_team_name``, ``neutral_site``.
+    latest : mapping
+        ``{table: rows indexed by team}`` as returned by
+        ``fetch_slate_sources`` (or a point-in-time store).
+
+    Returns
+    -------
+    stats_basic, stats_factors : pd.DataFrame
+        Same columns as the per-game helpers, one row per game, in order.
+        Teams missing from a source get NaN.
+    """
+    names = {side: games[f"{side}_team_name"].reset_index(drop=True) for side in ("away", "home")}
+
+    daily = latest["daily_data"]
+    basic = pd.DataFrame({
+        f"{side}_team_{col}": _side_values(daily, names[side], [col])[col]
+        for side, col in _BASIC_COLUMNS
+    })
+    basic["home_team_home"] = games["neutral_site"].to_numpy() == 0
+    basic["away_team_home"] = np.zeros(len(games), dtype=bool)
+
+    off_cols = AS_OF_SOURCES["sub_offensive_averages"]["columns"]
+    def_cols = AS_OF_SOURCES["sub_defensive_averages"]["columns"]
+    parts = []
+    for side in ("away", "home"):
+        off = _side_values(latest["sub_offensive_averages"], names[side], off_cols)
+        dfn = _side_values(latest["sub_defensive_averages"], names[side], def_cols)
+        parts.append(off.add_prefix(f"{side}_"))
+        parts.append(dfn.add_prefix(f"{side}_"))
+    factors = pd.concat(parts, axis=1)
+    return basic, factors
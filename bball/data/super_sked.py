@@ -0,0 +1,182 @@
+"""
+Cached, date-indexed view of Bart Torvik's ``{season}_super_sked.csv``.
+
+The CSV is parsed once (column 1 → datetime) and written next to it as
+``.cache/{name}.parquet`` together with a small JSON sidecar recording the
+CSV's mtime, size and SHA-256.  Later loads reuse the Parquet file unless the
+CSV changed (a touched-but-identical file only refreshes the sidecar), and
+within a process the parsed schedule is memoised, so a season backfill pays
+for parsing exactly once.
+
+Columns keep read_csv(header=None) integer labels so existing positional code
+(``df[1]``, ``df[6]``, ``df[8]`` ...) works unchanged.
+
+Key entry points
+----------------
+load_super_sked(csv_path)             → SuperSked (memoised / Parquet-cached)
+super_sked_path(season_year, bart_dir)
+sked.between(start, end)              → rows with start <= date < end
+sked.on_dates(["2026-01-10", ...])    → rows on any of those calendar days
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+DATE_COL = 1
+CACHE_DIRNAME = ".cache"
+
+
+def super_sked_path(season_year: int, bart_dir: str | Path = "bart_files") -> Path:
+    return Path(bart_dir) / f"{season_year}_super_sked.csv"
+
+
+# --------------------------------------------------------------------------- #
+# 1. Parsed schedule
+# --------------------------------------------------------------------------- #
+class SuperSked:
+    """
+    Parsed super schedule plus a stable date-sorted position index.
+
+    ``frame`` keeps the CSV's row order; slices come back in that order too.
+    """
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self._dates = frame[DATE_COL].to_numpy(dtype="datetime64[ns]")
+        self._order = np.argsort(self._dates, kind="mergesort")
+        self._sorted = self._dates[self._order]
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def _positions(self, start, end) -> np.ndarray:
+        lo = np.searchsorted(self._sorted, np.datetime64(pd.Timestamp(start), "ns"), side="left")
+        hi = np.searchsorted(self._sorted, np.datetime64(pd.Timestamp(end), "ns"), side="left")
+        return np.sort(self._order[lo:hi])
+
+    def between(self, start, end) -> pd.DataFrame:
+        """Copy of the rows with ``start <= date < end`` (CSV order)."""
+        return self.frame.iloc[self._positions(start, end)].copy()
+
+    def on_dates(self, date_strs: Iterable[str]) -> pd.DataFrame:
+        """Copy of the rows falling on any of the given YYYY-MM-DD days."""
+        days = sorted({pd.Timestamp(d).normalize() for d in date_strs})
+        if not days:
+            return self.frame.iloc[0:0].copy()
+        pos = np.concatenate([self._positions(d, d + pd.Timedelta(days=1)) for d in days])
+        return self.frame.iloc[np.sort(pos)].copy()
+
+
+# --------------------------------------------------------------------------- #
+# 2. Parsing + on-disk cache
+# --------------------------------------------------------------------------- #
+def _parse_csv(csv_path: Path) -> pd.DataFrame:
+    df = pd.read_csv(csv_path, header=None, low_memory=False)
+    df[DATE_COL] = pd.to_datetime(df[DATE_COL], errors="coerce")
+    # Parquet needs one type per column: mixed object columns become strings
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        values = df[col]
+        present = values.notna()
+        if not values[present].map(type).eq(str).all():
+            df[col] = values.where(~present, values.astype(str))
+    return df
+
+
+def _fingerprint(csv_path: Path) -> dict:
+    st = csv_path.stat()
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def _sha256(csv_path: Path) -> str:
+    h = hashlib.sha256()
+    with csv_path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _cache_paths(csv_path: Path) -> tuple[Path, Path]:
+    cache_dir = csv_path.parent / CACHE_DIRNAME
+    return cache_dir / f"{csv_path.stem}.parquet", cache_dir / f"{csv_path.stem}.json"
+
+
+def _read_cached(parquet_path: Path) -> pd.DataFrame:
+    df = pd.read_parquet(parquet_path)
+    df.columns = [int(c) for c in df.columns]
+    return df
+
+
+def _write_cache(df: pd.DataFrame, parquet_path: Path, meta_path: Path, meta: dict) -> None:
+    parquet_path.parent.mkdir(parents=True, exist_ok=True)
+    out = df.copy()
+    out.columns = [str(c) for c in out.columns]
+    tmp = parquet_path.with_suffix(".parquet.tmp")
+    out.to_parquet(tmp, index=False)
+    os.replace(tmp, parquet_path)
+    meta_path.write_text(json.dumps(meta))
+
+
+def _load_frame(csv_path: Path) -> pd.DataFrame:
+    parquet_path, meta_path = _cache_paths(csv_path)
+    fp = _fingerprint(csv_path)
+    meta = None
+    if parquet_path.exists() and meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text())
+        except ValueError:
+            meta = None
+
+    if meta is not None:
+        if meta.get("mtime_ns") == fp["mtime_ns"] and meta.get("size") == fp["size"]:
+            return _read_cached(parquet_path)
+        digest = _sha256(csv_path)
+        if meta.get("sha256") == digest:
+            meta.update(fp)
+            meta_path.write_text(json.dumps(meta))
+            return _read_cached(parquet_path)
+    else:
+        digest = _sha256(csv_path)
+
+    df = _parse_csv(csv_path)
+    try:
+        _write_cache(df, parquet_path, meta_path, {**fp, "sha256": digest})
+    except (OSError, ImportError, ValueError) as exc:  # read-only dir, no pyarrow, ...
+        print(f"super_sked: not caching {csv_path}: {exc}")
+    return df
+
+
+# --------------------------------------------------------------------------- #
+# 3. In-process memo
+# --------------------------------------------------------------------------- #
+_MEMO: dict[Path, tuple[tuple[int, int], SuperSked]] = {}
+_MEMO_LOCK = threading.Lock()
+
+
+def load_super_sked(csv_path: str | Path) -> SuperSked:
+    """
+    Parsed super schedule for ``csv_path``.
+
+    Raises FileNotFoundError if the CSV does not exist.
+    """
+    csv_path = Path(csv_path).resolve()
+    if not csv_path.exists():
+        raise FileNotFoundError(csv_path)
+    fp = _fingerprint(csv_path)
+    key = (fp["mtime_ns"], fp["size"])
+    with _MEMO_LOCK:
+        hit = _MEMO.get(csv_path)
+        if hit is not None and hit[0] == key:
+            return hit[1]
+        sked = SuperSked(_load_frame(csv_path))
+        _MEMO[csv_path] = (key, sked)
+        return sked
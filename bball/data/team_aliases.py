@@ -0,0 +1,217 @@
+"""
+Per-source spellings of Torvik team names.
+
+Each table maps the Torvik (canonical) name to the name another source
+uses; names missing from a table are spelled the same in that source.
+Consumed by ``bball.data.teams.TeamRegistry``.
+"""
+
+# Torvik -> sports.hard_rock_lines (formerly hard_rock_converter.hr_name_dict)
+HARD_ROCK_ALIASES = {
+    'Boise St.': 'Boise State',
+    'Penn St.': 'Penn State',
+    'Wichita St.': 'Wichita State',
+    'Indiana St.': 'Indiana State',
+    'Gardner Webb': 'Gardner-Webb',
+    "Saint Joseph's": "St. Joseph's",
+    'Missouri St.': 'Missouri State',
+    'East Tennessee St.': 'East Tennessee State',
+    'USC Upstate': 'SC Upstate',
+    'Arkansas St.': 'Arkansas State',
+    'Chicago St.': 'Chicago State',
+    'Texas A&M Commerce': 'East Texas A&M',
+    'Loyola MD': 'Loyola Maryland',
+    'Arizona St.': 'Arizona State',
+    'Youngstown St.': 'Youngstown State',
+    'Wright St.': 'Wright State',
+    'Montana St.': 'Montana State',
+    'UT Arlington': 'Texas Arlington',
+    'Long Beach St.': 'Long Beach State',
+    'Cal St. Bakersfield': 'CSU Bakersfield',
+    'Jacksonville St.': 'Jacksonville State',
+    'St. Thomas': 'St. Thomas (MN)',
+    'Nebraska Omaha': 'Omaha',
+    'Sam Houston St.': 'Sam Houston State',
+    'Tennessee Martin': 'UT Martin',
+    'Tarleton St.': 'Tarleton State',
+    'Appalachian St.': 'Appalachian State',
+    'Georgia St.': 'Georgia State',
+    'UMKC': 'Kansas City',
+    'New Mexico St.': 'New Mexico State',
+    'Morehead St.': 'Morehead State',
+    'Tennessee St.': 'Tennessee State',
+    'Oregon St.': 'Oregon State',
+    'Texas St.': 'Texas State',
+    'Cal St. Fullerton': 'Cal State Fullerton',
+    'Utah Valley': 'Utah Valley State',
+    'Stephen F. Austin': 'Stephen F Austin',
+    'Fort Wayne': 'IPFW',
+    'UT Rio Grande Valley': 'Texas Rio Grande Valley',
+    'Cal St. Northridge': 'CSU Northridge',
+    'Little Rock': 'Arkansas Little Rock',
+    'Weber St.': 'Weber State',
+    'North Dakota St.': 'North Dakota State',
+    'South Dakota St.': 'South Dakota State',
+    'Kennesaw St.': 'Kennesaw State',
+    'Idaho St.': 'Idaho State',
+    'LIU Brooklyn': 'Long Island',
+    'Cleveland St.': 'Cleveland State',
+    'Detroit': 'Detroit Mercy',
+    'St. Francis PA': 'St. Francis (PA)',
+    'Ohio St.': 'Ohio State',
+    'Penn': 'Pennsylvania',
+    'San Jose St.': 'San Jose State',
+    'Kent St.': 'Kent State',
+    'Iowa St.': 'Iowa State',
+    'Mississippi': 'Ole Miss',
+    'Washington St.': 'Washington State',
+    'Mississippi St.': 'Mississippi State',
+    'Utah St.': 'Utah State',
+    'San Diego St.': 'San Diego St',
+    'Miami FL': 'Miami (FL)',
+    'Kansas St.': 'Kansas State',
+    'Oklahoma St.': 'Oklahoma State',
+    'Cal Baptist': 'California Baptist',
+    'Massachusetts': 'UMass',
+    'Michigan St.': 'Michigan State',
+    'North Carolina St.': 'NC State',
+    'Ball St.': 'Ball State',
+    'Grambling St.': 'Grambling State',
+    'Florida St.': 'Florida State',
+    'Murray St.': 'Murray State',
+    'Coppin St.': 'Coppin State',
+    'Delaware St.': 'Delaware State',
+    'Morgan St.': 'Morgan State',
+    'Alcorn St.': 'Alcorn State',
+    'McNeese St.': 'McNeese State',
+    'Sacramento St.': 'Sacramento State',
+    'Colorado St.': 'Colorado State',
+    'Fresno St.': 'Fresno State',
+    'Illinois St.': 'Illinois State',
+    'Jackson St.': 'Jackson State',
+    'Texas A&M Corpus Chris': 'Texas A&M-Corpus Christi',
+    'Alabama St.': 'Alabama State',
+    'Miami OH': 'Miami (OH)',
+    'Norfolk St.': 'Norfolk State',
+    'Northwestern St.': 'Northwestern State',
+    'Nicholls St.': 'Nicholls State',
+    'South Carolina St.': 'South Carolina State',
+    'Bethune Cookman': 'Bethune-Cookman',
+    'Southeast Missouri St.': 'Southeast Missouri State',
+    'Portland St.': 'Portland State',
+    'Southeastern Louisiana': 'SE Louisiana',
+    'North Carolina Central': 'NC Central',
+    'Mississippi Valley St.': 'Mississippi Valley',
+    'Arkansas Pine Bluff': 'Arkansas-Pine Bluff',
+    'N.C. State': 'NC State',
+    'Louisiana': 'Louisiana Lafayette',
+    'LIU': 'Long Island',
+    'IU Indy': 'IUPUI',
+    'Saint Francis': 'St. Francis (PA)',
+    'Purdue Fort Wayne': 'IPFW',
+    'Texas A&M–Commerce': 'East Texas A&M',
+    'Texas A&M-Commerce': 'East Texas A&M',
+    'Mercyhurst': 'Mercyhurst Lakers',
+    'Charleston': 'College of Charleston',
+    'West Georgia': 'West Georgia',
+}
+
+
+# Torvik -> hoops-edge S3 lakehouse (formerly predict_games.LOCAL_TO_S3 and the
+# copy in scripts/backfill_s3_lines.py)
+S3_ALIASES = {
+    "Alabama St.": "Alabama State",
+    "Albany": "UAlbany",
+    "Alcorn St.": "Alcorn State",
+    "American": "American University",
+    "Appalachian St.": "App State",
+    "Arizona St.": "Arizona State",
+    "Arkansas Pine Bluff": "Arkansas-Pine Bluff",
+    "Arkansas St.": "Arkansas State",
+    "Ball St.": "Ball State",
+    "Bethune Cookman": "Bethune-Cookman",
+    "Boise St.": "Boise State",
+    "Cal Baptist": "California Baptist",
+    "Cal St. Bakersfield": "Cal State Bakersfield",
+    "Cal St. Fullerton": "Cal State Fullerton",
+    "Cal St. Northridge": "Cal State Northridge",
+    "Chicago St.": "Chicago State",
+    "Cleveland St.": "Cleveland State",
+    "Colorado St.": "Colorado State",
+    "Connecticut": "UConn",
+    "Coppin St.": "Coppin State",
+    "Delaware St.": "Delaware State",
+    "East Tennessee St.": "East Tennessee State",
+    "FIU": "Florida International",
+    "Florida St.": "Florida State",
+    "Fresno St.": "Fresno State",
+    "Gardner Webb": "Gardner-Webb",
+    "Georgia St.": "Georgia State",
+    "Grambling St.": "Grambling",
+    "Hawaii": "Hawai'i",
+    "IU Indy": "IU Indianapolis",
+    "Idaho St.": "Idaho State",
+    "Illinois Chicago": "UIC",
+    "Illinois St.": "Illinois State",
+    "Indiana St.": "Indiana State",
+    "Iowa St.": "Iowa State",
+    "Jackson St.": "Jackson State",
+    "Jacksonville St.": "Jacksonville State",
+    "Kansas St.": "Kansas State",
+    "Kennesaw St.": "Kennesaw State",
+    "Kent St.": "Kent State",
+    "LIU": "Long Island University",
+    "Long Beach St.": "Long Beach State",
+    "Louisiana Monroe": "UL Monroe",
+    "Loyola MD": "Loyola Maryland",
+    "McNeese St.": "McNeese",
+    "Miami FL": "Miami",
+    "Miami OH": "Miami (OH)",
+    "Michigan St.": "Michigan State",
+    "Mississippi": "Ole Miss",
+    "Mississippi St.": "Mississippi State",
+    "Mississippi Valley St.": "Mississippi Valley State",
+    "Missouri St.": "Missouri State",
+    "Montana St.": "Montana State",
+    "Morehead St.": "Morehead State",
+    "Morgan St.": "Morgan State",
+    "Murray St.": "Murray State",
+    "N.C. State": "NC State",
+    "Nebraska Omaha": "Omaha",
+    "New Mexico St.": "New Mexico State",
+    "Nicholls St.": "Nicholls",
+    "Norfolk St.": "Norfolk State",
+    "North Dakota St.": "North Dakota State",
+    "Northwestern St.": "Northwestern State",
+    "Ohio St.": "Ohio State",
+    "Oklahoma St.": "Oklahoma State",
+    "Oregon St.": "Oregon State",
+    "Penn": "Pennsylvania",
+    "Penn St.": "Penn State",
+    "Portland St.": "Portland State",
+    "Queens": "Queens University",
+    "Sacramento St.": "Sacramento State",
+    "Saint Francis": "St. Francis (PA)",
+    "Sam Houston St.": "Sam Houston",
+    "San Diego St.": "San Diego State",
+    "San Jose St.": "San Jos\u00e9 State",
+    "Seattle": "Seattle U",
+    "South Carolina St.": "South Carolina State",
+    "South Dakota St.": "South Dakota State",
+    "Southeast Missouri St.": "Southeast Missouri State",
+    "Southeastern Louisiana": "SE Louisiana",
+    "St. Thomas": "St. Thomas-Minnesota",
+    "Tarleton St.": "Tarleton State",
+    "Tennessee Martin": "UT Martin",
+    "Tennessee St.": "Tennessee State",
+    "Texas A&M Corpus Chris": "Texas A&M-Corpus Christi",
+    "Texas St.": "Texas State",
+    "UMKC": "Kansas City",
+    "USC Upstate": "South Carolina Upstate",
+    "Utah St.": "Utah State",
+    "Washington St.": "Washington State",
+    "Weber St.": "Weber State",
+    "Wichita St.": "Wichita State",
+    "Wright St.": "Wright State",
+    "Youngstown St.": "Youngstown State",
+}
@@ -0,0 +1,188 @@
+"""
+Columnar team-game log built from `sports.tot_boxscores`.
+
+Every boxscore row is melted into two rows – one from the away team's point
+of view and one from the home team's – in a single vectorised pass, and all
+per-game ratio stats used by the rolling averages in ``more_stats.py`` are
+computed with NumPy safe-division (a zero denominator yields 0, exactly like
+the legacy ``get_ppp`` / ``get_eff_fg_pct`` / ... helpers).
+
+Key entry points
+----------------
+build_team_game_log(box_df)   → long (team, opponent, date, stats...) frame
+STAT_COLUMNS                  → per-game stat columns, in legacy order
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+# --------------------------------------------------------------------------- #
+# 1. Column layout
+# --------------------------------------------------------------------------- #
+# raw per-side stat → tot_boxscores column suffix (prefixed with away_/home_)
+_BOX_COLUMNS = {
+    "pts_scored": "team_pts",
+    "assists": "assists",
+    "blocks": "blocks",
+    "def_reb": "def_reb",
+    "off_reb": "off_reb",
+    "tot_reb": "tot_reb",
+    "made_3pts": "made_3pts",
+    "tot_3pts": "tot_3pts",
+    "made_fts": "made_ft",
+    "tot_fts": "tot_ft",
+    "made_shots": "made_shots",
+    "tot_shots": "tot_shots",
+    "fouls": "personal_fouls",
+    "steals": "steals",
+    "turnovers": "turnovers",
+}
+
+# Ratio stats computed for both the team and its opponent (``opp_`` prefix)
+_SIDE_STATS = [
+    "ppp",
+    "efficency",
+    "to_pct",
+    "eff_fg_pct",
+    "true_shooting_pct",
+    "ft_rate",
+    "ft_pct",
+    "3pt_rate",
+    "3p_pct",
+    "2p_pct",
+    "steal_pct",
+]
+
+# Same order as the `full_df` projection in more_stats.do_that_shit
+STAT_COLUMNS = (
+    _SIDE_STATS
+    + ["opp_" + s for s in _SIDE_STATS]
+    + [
+        "block_pct",
+        "off_rebound_pct",
+        "def_rebound_pct",
+        "tot_rebound_pct",
+        "opp_block_pct",
+        "opp_off_rebound_pct",
+        "opp_def_rebound_pct",
+        "opp_tot_rebound_pct",
+        "tempo",
+    ]
+)
+
+KEY_COLUMNS = ["date", "team_name", "opp_team_name", "is_home"]
+
+# tot_boxscores columns the log needs (for SELECT projection)
+BOX_SCORE_COLUMNS = (
+    ["date", "away_team_name", "home_team_name", "game_tempo"]
+    + [f"away_{c}" for c in _BOX_COLUMNS.values()]
+    + [f"home_{c}" for c in _BOX_COLUMNS.values()]
+)
+
+
+# --------------------------------------------------------------------------- #
+# 2. Helpers
+# --------------------------------------------------------------------------- #
+def _safe_div(num: np.ndarray, den: np.ndarray) -> np.ndarray:
+    """Element-wise ``num / den`` with 0 wherever ``den == 0``."""
+    out = np.zeros(np.broadcast(num, den).shape, dtype=float)
+    np.divide(num, den, out=out, where=den != 0)
+    return out
+
+
+def _side_arrays(box_df: pd.DataFrame, side: str) -> dict[str, np.ndarray]:
+    """Raw stats for one side (``away`` / ``home``) as float arrays."""
+    raw = {
+        stat: pd.to_numeric(box_df[f"{side}_{col}"], errors="coerce").to_numpy(dtype=float)
+        for stat, col in _BOX_COLUMNS.items()
+    }
+    raw["made_2pts"] = raw["made_shots"] - raw["made_3pts"]
+    raw["tot_2pts"] = raw["tot_shots"] - raw["tot_3pts"]
+    return raw
+
+
+def _ratio_stats(s: dict[str, np.ndarray], tempo: np.ndarray) -> dict[str, np.ndarray]:
+    """Vectorised versions of more_stats.get_ppp, get_eff_fg_pct, ..."""
+    fga = s["tot_2pts"] + s["tot_3pts"]
+    return {
+        "ppp": _safe_div(s["pts_scored"], tempo),
+        "efficency": _safe_div(s["pts_scored"] * 100.0, tempo),
+        "to_pct": _safe_div(s["turnovers"], tempo),
+        "eff_fg_pct": _safe_div(s["made_2pts"] + 1.5 * s["made_3pts"], fga),
+        "true_shooting_pct": _safe_div(s["pts_scored"], 2 * (fga + 0.44 * s["tot_fts"])),
+        "ft_rate": _safe_div(s["tot_fts"], fga),
+        "ft_pct": _safe_div(s["made_fts"], s["tot_fts"]),
+        "3pt_rate": _safe_div(s["tot_3pts"], fga),
+        "3p_pct": _safe_div(s["made_3pts"], s["tot_3pts"]),
+        "2p_pct": _safe_div(s["made_2pts"], s["tot_2pts"]),
+        "steal_pct": _safe_div(s["steals"], tempo),
+    }
+
+
+def _perspective(team: dict[str, np.ndarray], opp: dict[str, np.ndarray], tempo: np.ndarray) -> dict[str, np.ndarray]:
+    """All STAT_COLUMNS for one point of view (team vs opp)."""
+    own = _ratio_stats(team, tempo)
+    other = _ratio_stats(opp, tempo)
+    cols = dict(own)
+    cols.update({"opp_" + k: v for k, v in other.items()})
+    cols["block_pct"] = _safe_div(team["blocks"], opp["tot_2pts"])
+    cols["off_rebound_pct"] = _safe_div(team["off_reb"], team["off_reb"] + opp["def_reb"])
+    cols["def_rebound_pct"] = _safe_div(team["def_reb"], team["def_reb"] + opp["off_reb"])
+    cols["tot_rebound_pct"] = _safe_div(team["tot_reb"], team["tot_reb"] + opp["tot_reb"])
+    cols["opp_block_pct"] = _safe_div(opp["blocks"], team["tot_2pts"])
+    cols["opp_off_rebound_pct"] = _safe_div(opp["off_reb"], opp["off_reb"] + team["def_reb"])
+    cols["opp_def_rebound_pct"] = _safe_div(opp["def_reb"], opp["def_reb"] + team["off_reb"])
+    cols["opp_tot_rebound_pct"] = _safe_div(opp["tot_reb"], opp["tot_reb"] + team["tot_reb"])
+    cols["tempo"] = tempo
+    return cols
+
+
+# --------------------------------------------------------------------------- #
+# 3. Public entry point
+# --------------------------------------------------------------------------- #
+def build_team_game_log(box_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Melt `tot_boxscores` rows into one row per (team, game).
+
+    Parameters
+    ----------
+    box_df : pd.DataFrame
+        Rows from `sports.tot_boxscores` (at least ``BOX_SCORE_COLUMNS``).
+
+    Returns
+    -------
+    pd.DataFrame
+        ``KEY_COLUMNS + STAT_COLUMNS``, sorted by date (stable, so games on
+        the same day keep their source order).
+    """
+    if box_df.empty:
+        return pd.DataFrame(columns=KEY_COLUMNS + STAT_COLUMNS)
+
+    away = _side_arrays(box_df, "away")
+    home = _side_arrays(box_df, "home")
+    tempo = pd.to_numeric(box_df["game_tempo"], errors="coerce").to_numpy(dtype=float)
+
+    dates = box_df["date"].to_numpy()
+    away_names = box_df["away_team_name"].to_numpy()
+    home_names = box_df["home_team_name"].to_numpy()
+    n = len(box_df)
+
+    away_view = _perspective(away, home, tempo)
+    home_view = _perspective(home, away, tempo)
+
+    data = {
+        "date": np.concatenate([dates, dates]),
+        "team_name": np.concatenate([away_names, home_names]),
+        "opp_team_name": np.concatenate([home_names, away_names]),
+        "is_home": np.concatenate([np.zeros(n, dtype="int8"), np.ones(n, dtype="int8")]),
+    }
+    for col in STAT_COLUMNS:
+        data[col] = np.concatenate([away_view[col], home_view[col]])
+
+    # interleave away/home rows of the same game so source order survives the sort
+    order = np.arange(2 * n).reshape(2, n).T.ravel()
+    log = pd.DataFrame(data).iloc[order]
+    log = log.sort_values("date", kind="mergesort").reset_index(drop=True)
+    return log
@@ -0,0 +1,244 @@
+"""
+Team registries shared by the slate builder, the line matchers, the finals
+export and the boxscore ingesters.
+
+* Name resolution: Torvik spellings are canonical.  ``TeamRegistry`` gives
+  every canonical name a stable-in-process integer ID and translates to and
+  from the per-source alias tables in ``team_aliases`` (Hard Rock, S3
+  lakehouse).  The D1 list (``d1_teams.txt``) is registered up front, so a
+  name spelled the same in every source resolves exactly; anything else
+  not in an alias table passes through unchanged unless the registry was
+  built with ``fuzzy=True`` (memoised difflib match, printed when used).
+  All translations work on whole columns by resolving each unique value once.
+* The non-D1 exclusion list lives in ``non_d1_teams.txt`` (one Torvik name
+  per line); it is read once into a frozenset and applied with a single
+  vectorised ``isin`` mask.  The ingesters drop only those games.  The
+  prediction slate additionally skips the D1 programs in
+  ``slate_skip_teams.txt``.
+
+Key entry points
+----------------
+registry()                              → shared TeamRegistry
+registry().to_source(names, "s3")       → source spellings (scalar or Series)
+registry().to_canonical(names, "hard_rock")
+registry().ids(names, source="torvik")  → int64 team IDs
+d1_teams()                              → bundled Torvik D1 names
+non_d1_teams() / is_non_d1(name) / drop_non_d1(df, away_col, home_col)
+is_non_d1_game(away, home)              → row filter for the boxscore ingesters
+drop_slate_excluded(df)                 → non-D1 + slate-only skips (predictions)
+"""
+from __future__ import annotations
+
+import difflib
+import os
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Mapping
+
+import numpy as np
+import pandas as pd
+
+from .team_aliases import HARD_ROCK_ALIASES, S3_ALIASES
+
+TORVIK = "torvik"
+HARD_ROCK = "hard_rock"
+S3 = "s3"
+
+SOURCE_ALIASES: dict[str, Mapping[str, str]] = {
+    HARD_ROCK: HARD_ROCK_ALIASES,
+    S3: S3_ALIASES,
+}
+
+FUZZY_CUTOFF = 0.9
+
+
+# --------------------------------------------------------------------------- #
+# 1. Name resolution
+# --------------------------------------------------------------------------- #
+class TeamRegistry:
+    """
+    Canonical (Torvik) team names, integer IDs and per-source aliases.
+
+    Parameters
+    ----------
+    aliases : mapping
+        ``{source: {torvik_name: source_name}}``.
+    known : iterable of str, optional
+        Extra canonical names to register up front.
+    fuzzy : bool
+        Resolve unknown source spellings with a difflib match (cutoff
+        ``FUZZY_CUTOFF``).  Off by default: "Northeastern" and
+        "Northwestern" are closer than the cutoff.
+    """
+
+    def __init__(
+        self,
+        aliases: Mapping[str, Mapping[str, str]] = SOURCE_ALIASES,
+        known=(),
+        fuzzy: bool = False,
+    ):
+        self._lock = threading.Lock()
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._to_source = {src: dict(table) for src, table in aliases.items()}
+        self._from_source: dict[str, dict[str, str]] = {}
+        for src, table in self._to_source.items():
+            inverse: dict[str, str] = {}
+            for canon, alias in table.items():
+                inverse[alias] = canon  # last wins, like hard_rock_converter.inv_convert
+            self._from_source[src] = inverse
+        self.fuzzy = fuzzy
+        self._fuzzy: dict[tuple[str, str], str] = {}
+        self.register(known)
+        for table in self._to_source.values():
+            self.register(table)
+
+    # ---- IDs ------------------------------------------------------------ #
+    def register(self, names) -> None:
+        with self._lock:
+            for name in names:
+                if name not in self._ids:
+                    self._ids[name] = len(self._names)
+                    self._names.append(name)
+
+    def team_id(self, name: str, source: str = TORVIK) -> int:
+        canon = self._canonical_one(name, source)
+        tid = self._ids.get(canon)
+        if tid is None:
+            self.register([canon])
+            tid = self._ids[canon]
+        return tid
+
+    def name(self, team_id: int) -> str:
+        return self._names[team_id]
+
+    # ---- scalar resolution --------------------------------------------- #
+    def _source_one(self, name: str, source: str) -> str:
+        if source == TORVIK:
+            return name
+        return self._to_source[source].get(name, name)
+
+    def _canonical_one(self, name: str, source: str) -> str:
+        if source == TORVIK:
+            return name
+        inverse = self._from_source[source]
+        canon = inverse.get(name)
+        if canon is not None:
+            return canon
+        if name in self._ids or not self.fuzzy:
+            return name  # spelled the same in both / no guessing
+        return self._fuzzy_one(name, source)
+
+    def _fuzzy_one(self, name: str, source: str) -> str:
+        key = (source, name)
+        hit = self._fuzzy.get(key)
+        if hit is None:
+            candidates = list(self._from_source[source]) + self._names
+            match = difflib.get_close_matches(name, candidates, n=1, cutoff=FUZZY_CUTOFF)
+            if match:
+                hit = self._from_source[source].get(match[0], match[0])
+                print(f"⚠️  fuzzy team match ({source}): {name!r} → {hit!r}")
+            else:
+                hit = name
+            self._fuzzy[key] = hit
+        return hit
+
+    # ---- vectorised ------------------------------------------------------ #
+    @staticmethod
+    def _map_unique(names, fn):
+        if isinstance(names, str):
+            return fn(names)
+        series = names if isinstance(names, pd.Series) else pd.Series(list(names))
+        lookup = {u: fn(u) for u in pd.unique(series.dropna())}
+        return series.map(lookup)
+
+    def to_source(self, names, source: str):
+        """Torvik name(s) → spelling used by ``source``."""
+        return self._map_unique(names, lambda n: self._source_one(n, source))
+
+    def to_canonical(self, names, source: str):
+        """``source`` spelling(s) → Torvik name (fuzzy fallback for unknowns)."""
+        return self._map_unique(names, lambda n: self._canonical_one(n, source))
+
+    def ids(self, names, source: str = TORVIK) -> np.ndarray:
+        """int64 team IDs for a column of names spelled as in ``source``."""
+        series = names if isinstance(names, pd.Series) else pd.Series(list(names))
+        return self._map_unique(series, lambda n: self.team_id(n, source)).to_numpy(dtype="int64")
+
+
+_REGISTRY: TeamRegistry | None = None
+
+
+def registry() -> TeamRegistry:
+    """Process-wide registry built from ``team_aliases``."""
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = TeamRegistry(known=sorted(d1_teams()))
+    return _REGISTRY
+
+
+# --------------------------------------------------------------------------- #
+# 2. Team lists (D1 names, non-D1 exclusions, slate-only skips)
+# --------------------------------------------------------------------------- #
+
+D1_TEAMS_PATH = Path(__file__).with_name("d1_teams.txt")
+NON_D1_TEAMS_PATH = Path(__file__).with_name("non_d1_teams.txt")
+SLATE_SKIP_TEAMS_PATH = Path(__file__).with_name("slate_skip_teams.txt")
+
+
+@lru_cache(maxsize=None)
+def _load_names(path: str) -> frozenset[str]:
+    names = set()
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            name = line.split("#", 1)[0].strip()
+            if name:
+                names.add(name)
+    return frozenset(names)
+
+
+def d1_teams() -> frozenset[str]:
+    """Torvik D1 names (``$BBALL_D1_TEAMS`` overrides the bundled list)."""
+    return _load_names(os.getenv("BBALL_D1_TEAMS", str(D1_TEAMS_PATH)))
+
+
+def non_d1_teams() -> frozenset[str]:
+    """Excluded team names (``$BBALL_NON_D1_TEAMS`` overrides the bundled list)."""
+    return _load_names(os.getenv("BBALL_NON_D1_TEAMS", str(NON_D1_TEAMS_PATH)))
+
+
+def slate_skip_teams() -> frozenset[str]:
+    """D1 teams left off the prediction slate (``$BBALL_SLATE_SKIP_TEAMS``)."""
+    return _load_names(os.getenv("BBALL_SLATE_SKIP_TEAMS", str(SLATE_SKIP_TEAMS_PATH)))
+
+
+def is_non_d1(name: str) -> bool:
+    return str(name).strip() in non_d1_teams()
+
+
+def is_non_d1_game(away: str, home: str) -> bool:
+    """True if either side is non-D1 (the ingesters skip these games)."""
+    return is_non_d1(away) or is_non_d1(home)
+
+
+def drop_non_d1(
+    df: pd.DataFrame,
+    away_col="away_team_name",
+    home_col="home_team_name",
+) -> pd.DataFrame:
+    """Rows of ``df`` where neither team is on the non-D1 list (one pass)."""
+    excluded = non_d1_teams()
+    mask = df[away_col].isin(excluded) | df[home_col].isin(excluded)
+    return df[~mask]
+
+
+def drop_slate_excluded(
+    df: pd.DataFrame,
+    away_col="away_team_name",
+    home_col="home_team_name",
+) -> pd.DataFrame:
+    """``drop_non_d1`` plus the slate-only skips; for the prediction slate only."""
+    excluded = non_d1_teams() | slate_skip_teams()
+    mask = df[away_col].isin(excluded) | df[home_col].isin(excluded)
+    return df[~mask]
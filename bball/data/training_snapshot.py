@@ -0,0 +1,187 @@
+"""
+Local columnar snapshot of ``sports.training_data``.
+
+``load_training_dataframe`` used to pull the whole table through
+``pd.read_sql`` on every ``train`` and then run ``pd.to_numeric`` over every
+column.  The snapshot keeps the table as a Parquet file with compact dtypes
+(float32 features, int8 flags, int16 points) next to a small JSON watermark:
+row count, max ``date`` and a server-side checksum of the rows before that
+date.  A refresh recomputes the checksum (one aggregate query, nothing
+transferred) and, if it still matches, only asks MySQL for rows on or after
+the watermark date (that day is replaced, since it may have been partial).
+Any insert, delete or in-place update of older rows (the averages backfills
+upsert) changes the checksum and the table is re-read in full, as it is with
+``full=True``.  Rows are always ordered by ``ORDER_BY``, so an incremental
+and a full load give the same frame (the train/val split is positional).
+
+On MySQL the checksum is ``BIT_XOR(CRC32(CONCAT_WS(...)))`` over every
+column; other dialects (the tests use SQLite) fall back to per-column sums.
+
+Files: ``$BBALL_TRAINING_SNAPSHOT`` (default ``.cache/training_data.parquet``)
+plus ``<same name>.json``.
+
+Key entry points
+----------------
+TrainingSnapshot().refresh(engine, full=False)
+                                    → up-to-date raw table (compact dtypes)
+TrainingSnapshot().read()           → last snapshot without touching MySQL
+compact_training_dtypes(df)         → the dtype plan applied to raw rows
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+from pathlib import Path
+
+import pandas as pd
+from sqlalchemy import text
+
+DEFAULT_SNAPSHOT_PATH = Path(".cache") / "training_data.parquet"
+TABLE = "sports.training_data"
+
+DATE_COLUMN = "date"
+TEXT_COLUMNS = ("away_team_name", "home_team_name")
+INT_COLUMNS = {
+    "away_team_pts": "int16",
+    "home_team_pts": "int16",
+    "neutral_site": "int8",
+}
+# NULL fill per INT_COLUMNS entry (default 0).  An unknown site counts as
+# neutral so home_team_home stays False, as neutral_site.eq(0) gave on NULL.
+INT_NULL_FILL = {"neutral_site": 1}
+# a team plays once a day, so this is a total order
+ORDER_BY = (DATE_COLUMN, "away_team_name", "home_team_name")
+
+
+def training_snapshot_path() -> Path:
+    return Path(os.getenv("BBALL_TRAINING_SNAPSHOT", str(DEFAULT_SNAPSHOT_PATH)))
+
+
+def compact_training_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Raw ``training_data`` rows with explicit dtypes: datetime ``date``,
+    string team names, ``INT_COLUMNS`` as small ints (NULL → ``INT_NULL_FILL``
+    or 0), bool → int8 and every other column float32.
+    """
+    out = {}
+    for col in df.columns:
+        values = df[col]
+        if col == DATE_COLUMN:
+            out[col] = pd.to_datetime(values)
+        elif col in TEXT_COLUMNS:
+            out[col] = values.astype(str)
+        elif col in INT_COLUMNS:
+            fill = INT_NULL_FILL.get(col, 0)
+            out[col] = pd.to_numeric(values, errors="coerce").fillna(fill).astype(INT_COLUMNS[col])
+        elif values.dtype == bool:
+            out[col] = values.astype("int8")
+        else:
+            out[col] = pd.to_numeric(values, errors="raise").astype("float32")
+    return pd.DataFrame(out, index=df.index)
+
+
+class TrainingSnapshot:
+    """
+    Parquet copy of ``training_data`` with a (rows, max date, checksum of
+    the older rows) watermark.
+
+    Parameters
+    ----------
+    path : path, optional
+        Parquet file; the watermark goes next to it as ``.json``.
+    table : str
+        Source table (tests point this at a scratch table).
+    """
+
+    def __init__(self, path: str | Path | None = None, table: str = TABLE):
+        self.path = Path(path) if path is not None else training_snapshot_path()
+        self.meta_path = self.path.with_suffix(".json")
+        self.table = table
+        self.pulled = 0  # rows read from the database by the last refresh
+
+    # ---- local ----------------------------------------------------------- #
+    def watermark(self) -> dict | None:
+        if not (self.path.exists() and self.meta_path.exists()):
+            return None
+        try:
+            return json.loads(self.meta_path.read_text())
+        except ValueError:
+            return None
+
+    def read(self) -> pd.DataFrame | None:
+        """The stored snapshot, or None if there isn't a valid one."""
+        if self.watermark() is None:
+            return None
+        return pd.read_parquet(self.path)
+
+    def _write(self, df: pd.DataFrame, older: list) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".parquet.tmp")
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, self.path)
+        max_date = df[DATE_COLUMN].max() if len(df) else None
+        self.meta_path.write_text(json.dumps({
+            "rows": int(len(df)),
+            "max_date": None if pd.isna(max_date) else pd.Timestamp(max_date).strftime("%Y-%m-%d"),
+            "older": older,
+        }))
+
+    # ---- database -------------------------------------------------------- #
+    def _select(self, con, where: str = "", params: dict | None = None) -> pd.DataFrame:
+        order = ", ".join(ORDER_BY)
+        sql = f"SELECT * FROM {self.table} {where} ORDER BY {order}"
+        df = pd.read_sql(text(sql), con, params=params or {}, coerce_float=True)
+        self.pulled += len(df)
+        return compact_training_dtypes(df)
+
+    def _checksum(self, con, columns, boundary: str | None) -> list:
+        """``[COUNT(*), checksum...]`` of the rows dated before ``boundary``."""
+        if boundary is None:
+            return []
+        quote = con.dialect.identifier_preparer.quote
+        if con.dialect.name == "mysql":
+            fields = ", ".join(f"IFNULL({quote(c)}, '~')" for c in columns)
+            aggs = f"COALESCE(BIT_XOR(CRC32(CONCAT_WS('|', {fields}))), 0)"
+        else:
+            numeric = [c for c in columns if c != DATE_COLUMN and c not in TEXT_COLUMNS]
+            aggs = ", ".join(f"COALESCE(SUM({quote(c)}), 0)" for c in numeric) or "0"
+        row = con.execute(
+            text(f"SELECT COUNT(*), {aggs} FROM {self.table} WHERE {DATE_COLUMN} < :d"),
+            {"d": boundary},
+        ).one()
+        return [int(row[0])] + [float(v) for v in row[1:]]
+
+    @staticmethod
+    def _same(a: list, b: list) -> bool:
+        return len(a) == len(b) and all(
+            math.isclose(x, y, rel_tol=1e-12, abs_tol=0.0) for x, y in zip(a, b)
+        )
+
+    def refresh(self, engine, full: bool = False) -> pd.DataFrame:
+        """
+        Bring the snapshot up to date against ``engine`` and return it.
+        ``full=True`` ignores the watermark and re-reads the whole table.
+        """
+        self.pulled = 0
+        mark = None if full else self.watermark()
+        # one connection = one transaction (SQLAlchemy autobegin), so under
+        # InnoDB's REPEATABLE READ the checksums and selects see one snapshot
+        with engine.connect() as con:
+            df = None
+            if mark is not None and mark.get("max_date") is not None and "older" in mark:
+                boundary = mark["max_date"]
+                local = pd.read_parquet(self.path)
+                if self._same(self._checksum(con, list(local.columns), boundary), mark["older"]):
+                    keep = local[local[DATE_COLUMN] < pd.Timestamp(boundary)]
+                    new = self._select(con, f"WHERE {DATE_COLUMN} >= :d", {"d": boundary})
+                    df = pd.concat([keep, new], ignore_index=True) if len(new) else keep
+                # else: older rows were inserted / deleted / updated: start over
+            if df is None:
+                df = self._select(con)
+            df = df.reset_index(drop=True)
+            max_date = df[DATE_COLUMN].max() if len(df) else None
+            boundary = None if pd.isna(max_date) else pd.Timestamp(max_date).strftime("%Y-%m-%d")
+            older = self._checksum(con, list(df.columns), boundary)
+        self._write(df, older)
+        return df
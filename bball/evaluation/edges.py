@@ -0,0 +1,54 @@
+"""
+Vectorised line-vs-model edge columns.
+
+Array version of ``predict_games.get_diffs``: the same spread and moneyline
+differences, computed for whole columns with NaN propagation instead of one
+``DataFrame.apply(axis=1)`` row at a time.  Used by ``attach_hard_rock_lines``
+and safe to call on historical prediction archives.
+
+Key entry points
+----------------
+moneyline_diff(book_odds, model_odds)  → book minus model across the ±100 gap
+line_diffs(df)                         → spread_diff / away_winner_diff /
+                                         home_winner_diff frame
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+DIFF_COLUMNS = ["spread_diff", "away_winner_diff", "home_winner_diff"]
+
+
+def _as_float(values) -> np.ndarray:
+    return pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=float)
+
+
+def moneyline_diff(book_odds, model_odds) -> np.ndarray:
+    """
+    Distance between two American odds, skipping the dead zone between -100
+    and +100 when they sit on opposite sides of it.
+
+    Opposite signs give ``(book - 100) + (100 + model)`` (= book + model),
+    otherwise ``book - model``.  NaN if either side is missing.
+    """
+    book = _as_float(book_odds)
+    model = _as_float(model_odds)
+    crossed = ((book > 0) & (model < 0)) | ((book < 0) & (model > 0))
+    return np.where(crossed, book + model, book - model)
+
+
+def line_diffs(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    ``spread_diff``, ``away_winner_diff`` and ``home_winner_diff`` for every row.
+
+    Needs ``spread_home``, ``home_spread_num``, ``away_winner_odds``,
+    ``away_win_odds``, ``home_winner_odds`` and ``home_win_odds``.  The
+    result keeps ``df.index``, so it can be assigned or concatenated back
+    onto a filtered frame.
+    """
+    return pd.DataFrame({
+        "spread_diff": _as_float(df["spread_home"]) - _as_float(df["home_spread_num"]),
+        "away_winner_diff": moneyline_diff(df["away_winner_odds"], df["away_win_odds"]),
+        "home_winner_diff": moneyline_diff(df["home_winner_odds"], df["home_win_odds"]),
+    }, columns=DIFF_COLUMNS, index=df.index)
@@ -6,11 +6,10 @@ import torch
 import torch.nn as nn
 import torch.optim as optim
 import torch.backends.cudnn as cudnn
-from torch.utils.data import DataLoader
 from torch.cuda.amp import GradScaler, autocast
 
 from .architecture import MLPRegressor, MLPClassifier
-from ..data.dataset import BasketballDataset
+from ..data.dataset import BasketballDataset, batch_loader
 
 import torch.nn.functional as F
 cudnn.benchmark = True  # autotune kernels once batch size is fixed
@@ -114,33 +113,24 @@ def _fit(
     loss_fn,
     checkpoint_name: str,
     task: str,
+    flip=None,
 ) -> Path:
-    """Fit `model_cls` on the given data and return the checkpoint path."""
-    ds_train = BasketballDataset(X_train, y_train)
-    workers = cfg.get("num_workers", 4)
-    train_loader = DataLoader(
-        ds_train,
-        batch_size=cfg.get("batch_size", 4096),
-        shuffle=True,
-        num_workers=workers,
-        pin_memory=True,
-        persistent_workers=(workers > 0),
-        prefetch_factor=4,
-    )
-
-    ds_val = BasketballDataset(X_val, y_val)
-    val_loader = DataLoader(
-        ds_val,
-        batch_size=cfg.get("batch_size", 4096),
-        shuffle=False,
-        num_workers=workers,
-        pin_memory=True,
-        persistent_workers=(workers > 0),
-        prefetch_factor=4,
-    )
+    """Fit `model_cls` on the given data and return the checkpoint path.
 
+    ``flip`` (a ``HomeAwayFlip``) re-draws home/away swaps for every
+    training batch; validation batches are never flipped.
+    """
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
+    # DataLoader workers + pinning only on CUDA; CPU slices whole tensors
+    workers = cfg.get("num_workers", 4)
+    batch_size = cfg.get("batch_size", 4096)
+    transform = flip.for_task(task) if flip is not None else None
+    train_loader = batch_loader(
+        BasketballDataset(X_train, y_train), batch_size, True, device, workers, transform=transform,
+    )
+    val_loader = batch_loader(BasketballDataset(X_val, y_val), batch_size, False, device, workers)
+
     # Build model kwargs
     kw = dict(
         input_dim=X_train.shape[1],
@@ -198,7 +188,7 @@ def _fit(
 # Public entry points
 # -----------------------------------------------------------------------------
 
-def fit_regressor(X_train, y_train, X_val, y_val, cfg: dict | None = None) -> Path:
+def fit_regressor(X_train, y_train, X_val, y_val, cfg: dict | None = None, flip=None) -> Path:
     cfg = cfg or {}
     return _fit(
         MLPRegressor,
@@ -210,10 +200,11 @@ def fit_regressor(X_train, y_train, X_val, y_val, cfg: dict | None = None) -> Pa
         gaussian_nll,
         "mlp_regressor.pth",
         task="reg",
+        flip=flip,
     )
 
 
-def fit_classifier(X_train, y_train, X_val, y_val, cfg: dict | None = None) -> Path:
+def fit_classifier(X_train, y_train, X_val, y_val, cfg: dict | None = None, flip=None) -> Path:
     cfg = cfg or {}
     return _fit(
         MLPClassifier,
@@ -225,4 +216,5 @@ def fit_classifier(X_train, y_train, X_val, y_val, cfg: dict | None = None) -> P
         nn.BCEWithLogitsLoss(),
         "mlp_classifier.pth",
         task="cls",
+        flip=flip,
     )
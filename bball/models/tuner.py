@@ -24,11 +24,10 @@ import torch.backends.cudnn as cudnn
 import torch.nn.functional as F
 from sklearn.metrics import log_loss
 from torch.amp import GradScaler, autocast
-from torch.utils.data import DataLoader
 import time
 import os
 from .architecture import MLPClassifier, MLPRegressor
-from bball.data.dataset import BasketballDataset
+from bball.data.dataset import BasketballDataset, as_float32_tensor, batch_loader
 torch.set_float32_matmul_precision("high")
 torch.backends.cuda.matmul.allow_tf32 = True
 torch.backends.cudnn.allow_tf32 = True
@@ -88,19 +87,14 @@ def _train(
     trial: optuna.Trial,
     xv,
     yv,
+    flip=None,
 ) -> None:
     """Train `model` and report val-loss every 10 epochs for pruning."""
-    loader = DataLoader(
-        ds_train,
-        batch_size=batch_size,
-        shuffle=True,
-        num_workers=workers,
-        pin_memory=True,
-        persistent_workers=False,
-        prefetch_factor=4,
-    )
-
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    transform = flip.for_task(task) if flip is not None else None
+    loader = batch_loader(
+        ds_train, batch_size, True, device, workers, persistent_workers=False, transform=transform,
+    )
     model = model.to(device)
     if torch.cuda.is_available():
         model = torch.compile(model)
@@ -109,8 +103,8 @@ def _train(
     scaler = GradScaler("cuda", enabled=torch.cuda.is_available())
 
     # cache validation tensors on device
-    xv_t = torch.tensor(xv.values, dtype=torch.float32, device=device)
-    yv_t = torch.tensor(yv.values, dtype=torch.float32, device=device).squeeze()
+    xv_t = as_float32_tensor(xv).to(device)
+    yv_t = as_float32_tensor(yv).to(device).squeeze()
 
     for epoch in range(epochs):
         model.train()
@@ -160,6 +154,7 @@ def _objective(
     ytr,
     yv,
     task: str,
+    flip=None,
 ) -> float:
     # Architecture params
     hidden = trial.suggest_int("hidden", 512, 4096, step=256)
@@ -197,16 +192,17 @@ def _objective(
         trial=trial,
         xv=Xv,
         yv=yv,
+        flip=flip,
     )
 
     model.eval()
     device = next(model.parameters()).device
     with torch.no_grad():
-        xv_t = torch.tensor(Xv.values, dtype=torch.float32, device=device)
+        xv_t = as_float32_tensor(Xv).to(device)
         out = model(xv_t)
 
         if task == "reg":
-            yv_t = torch.tensor(yv.values, dtype=torch.float32, device=device).squeeze()
+            yv_t = as_float32_tensor(yv).to(device).squeeze()
             return _gaussian_nll_torch(out, yv_t).item()
         else:
             logits = out.squeeze()
@@ -247,6 +243,7 @@ def tune(
     y_val_cls=None,
     n_trials: int = 30,
     tune_classifier: bool = False,
+    flip=None,
 ):
     pruner = optuna.pruners.SuccessiveHalvingPruner(min_resource=30, reduction_factor=3)
 
@@ -256,7 +253,7 @@ def tune(
         study_reg.enqueue_trial(SEED_REG)
 
     study_reg.optimize(
-        lambda t: _objective(t, X_train, X_val, y_train_reg, y_val_reg, "reg"),
+        lambda t: _objective(t, X_train, X_val, y_train_reg, y_val_reg, "reg", flip),
         n_trials=n_trials,
     )
     _save_best_params(study_reg, "reg")
@@ -271,7 +268,7 @@ def tune(
             study_cls.enqueue_trial(SEED_CLS)
 
         study_cls.optimize(
-            lambda t: _objective(t, X_train, X_val, y_train_cls, y_val_cls, "cls"),
+            lambda t: _objective(t, X_train, X_val, y_train_cls, y_val_cls, "cls", flip),
             n_trials=n_trials,
         )
         _save_best_params(study_cls, "cls")
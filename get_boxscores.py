@@ -7,6 +7,7 @@ import numpy as np
 import datetime
 from pathlib import Path
 from input_data import *
+from bball.data.teams import is_non_d1_game
 import csv
 from to_datetime import*
 
@@ -52,6 +53,7 @@ with open('bart_files/'+str(year)+'_super_sked.csv') as file_obj:
     # Iterate over each row in the csv
     # file using reader object
     i=0
+    new_rows = []
     for row in reader_obj:
         if any("unnamed" in str(x).lower() for x in row):
             i+=1
@@ -69,6 +71,10 @@ with open('bart_files/'+str(year)+'_super_sked.csv') as file_obj:
             i+=1
             continue
 
+        if is_non_d1_game(row[8], row[14]):
+            i+=1
+            continue
+
         neutral_site = int(row[7])
         away_team_name = row[8]
         away_team_oe = float(row[9])
@@ -139,8 +145,11 @@ with open('bart_files/'+str(year)+'_super_sked.csv') as file_obj:
 
         columns = ['date','neutral_site','away_team_name','away_team_oe','away_team_de','away_team_pythag','away_team_proj_points','home_team_name','home_team_oe','home_team_de','home_team_pythag','home_team_proj_points','tot_project_posessions','away_team_pts','home_team_pts','away_team_t_rank','home_team_t_rank','overtimes','game_tempo','away_team_adj_tempo','home_team_adj_tempo','away_team_adj_off','away_team_adj_def','home_team_adj_off','home_team_adj_def','away_team_ppp','home_team_ppp','away_made_shots','away_tot_shots','away_made_3pts','away_tot_3pts','away_made_ft','away_tot_ft','away_off_reb','away_def_reb','away_tot_reb','away_assists','away_steals','away_blocks','away_turnovers','away_personal_fouls','home_made_shots','home_tot_shots','home_made_3pts','home_tot_3pts','home_made_ft','home_tot_ft','home_off_reb','home_def_reb','home_tot_reb','home_assists','home_steals','home_blocks','home_turnovers','home_personal_fouls']
 
-        df = pd.DataFrame(data=[data],columns=columns)
-        input_data(df, 'tot_boxscores')
+        new_rows.append(data)
         i+=1
         if i % 100 == 0:
             print(i)
+
+    # one batched write for the whole file instead of a connection per game
+    if new_rows:
+        input_data(pd.DataFrame(data=new_rows, columns=columns), 'tot_boxscores', upsert=True)
@@ -3,36 +3,182 @@ from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 import requests
 import re
+import os
+import functools
+import tempfile
 import pandas as pd
 import datetime
 from pandas.io import sql
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 
 
+# Same env vars as bball.data.loaders, defaulting to the local dev box
+DB_HOST = os.getenv("BBALL_DB_HOST", "localhost")
+DB_USER = os.getenv("BBALL_DB_USER", "root")
+DB_PASS = os.getenv("BBALL_DB_PASS", "jake3241")
+DB_NAME = os.getenv("BBALL_DB_NAME", "sports")
 
-def input_data(df, table):
-    #print(df)
-    host="localhost"
-    user="root"
-    password="jake3241"
-    database="sports"
+DEFAULT_CHUNKSIZE = 1000
 
-    conn = mysql.connector.connect(
-      host=host,
-      user=user,
-      password=password,
-      database=database
+# Upserts only replace rows when the table has a PRIMARY / UNIQUE key on the
+# columns being written; without one ON DUPLICATE KEY UPDATE (and LOAD DATA
+# REPLACE) is a plain INSERT.  These are the keys the loaders rely on;
+# ensure_upsert_keys() adds any that are missing (dedupe the table first if
+# the ALTER fails on existing duplicates).
+UPSERT_KEYS = {
+    "tot_boxscores": ("date", "away_team_name", "home_team_name"),
+    "offensive_averages": ("Date", "TeamName"),
+    "defensive_averages": ("Date", "TeamName"),
+}
+# LOAD DATA LOCAL INFILE needs local_infile=1 on the server, so it's opt-in
+USE_LOAD_INFILE = os.getenv("BBALL_LOAD_INFILE", "0") == "1"
+
+
+@functools.lru_cache(maxsize=None)
+def get_engine(local_infile=False):
+    """One pooled SQLAlchemy engine per process (and per local_infile flag)."""
+    url = "mysql+mysqlconnector://" + DB_USER + ":" + DB_PASS + "@" + DB_HOST + "/" + DB_NAME
+    connect_args = {"allow_local_infile": True} if local_infile else {}
+    return create_engine(
+        url,
+        pool_size=5,
+        max_overflow=5,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        connect_args=connect_args,
+    )
+
+
+class WriteError(RuntimeError):
+    """A frame could not be written; nothing from it should be assumed stored."""
+
+
+def _unique_keys(table):
+    """Column tuples of every PRIMARY / UNIQUE index on ``table``."""
+    query = (
+        "SELECT INDEX_NAME, COLUMN_NAME FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = :db AND TABLE_NAME = :t AND NON_UNIQUE = 0 "
+        "ORDER BY INDEX_NAME, SEQ_IN_INDEX"
     )
+    keys = {}
+    with get_engine().connect() as conn:
+        for index, column in conn.execute(text(query), {"db": DB_NAME, "t": table}):
+            keys.setdefault(index, []).append(column)
+    return [tuple(cols) for cols in keys.values()]
+
+
+_CHECKED_KEYS = set()
+
+
+def require_upsert_key(table, columns):
+    """Raise WriteError unless ``table`` has a unique key within ``columns``."""
+    if table in _CHECKED_KEYS:
+        return
+    if not any(set(key) <= set(columns) for key in _unique_keys(table)):
+        wanted = UPSERT_KEYS.get(table)
+        hint = (
+            " (run input_data.ensure_upsert_keys() to add UNIQUE ("
+            + ", ".join(wanted) + "))" if wanted else ""
+        )
+        raise WriteError(
+            "upsert into " + table + " needs a PRIMARY/UNIQUE key on the written columns; "
+            "without one rows would be duplicated" + hint
+        )
+    _CHECKED_KEYS.add(table)
+
 
-    str = "mysql+mysqlconnector://"+ user +":"+password+"@"+host+"/"+database
-    engine = create_engine(str)
+def ensure_upsert_keys(tables=None):
+    """Add the ``UPSERT_KEYS`` unique keys that are not there yet."""
+    for table in tables or UPSERT_KEYS:
+        cols = UPSERT_KEYS[table]
+        if any(set(key) <= set(cols) for key in _unique_keys(table)):
+            continue
+        stmt = (
+            "ALTER TABLE `" + table + "` ADD UNIQUE KEY `uq_" + table + "` ("
+            + ", ".join("`" + c + "`" for c in cols) + ")"
+        )
+        with get_engine().begin() as conn:
+            conn.execute(text(stmt))
+        print("input_data: added " + stmt)
+
+
+def _upsert_rows(pd_table, conn, keys, data_iter):
+    """to_sql ``method``: multi-row INSERT ... ON DUPLICATE KEY UPDATE."""
+    rows = [dict(zip(keys, row)) for row in data_iter]
+    if not rows:
+        return 0
+    stmt = mysql_insert(pd_table.table).values(rows)
+    stmt = stmt.on_duplicate_key_update({k: stmt.inserted[k] for k in keys})
+    return conn.execute(stmt).rowcount
+
+
+def _load_infile(df, table, upsert):
+    """Bulk load through a temp CSV with LOAD DATA LOCAL INFILE."""
+    out = df.copy()
+    for col in out.columns:
+        if out[col].dtype == bool:
+            out[col] = out[col].astype(int)
+    fh = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, newline="")
     try:
-        df.to_sql(table, con=engine, if_exists='append', index=False)
-        #print('data added')
+        out.to_csv(fh, index=False, header=False, na_rep="\\N")
+        fh.close()
+        cols = ", ".join("`" + c + "`" for c in out.columns)
+        path = fh.name.replace("\\", "/")
+        stmt = (
+            "LOAD DATA LOCAL INFILE '" + path + "' "
+            + ("REPLACE " if upsert else "")
+            + "INTO TABLE `" + table + "` "
+            + "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+            + "LINES TERMINATED BY '\\n' (" + cols + ")"
+        )
+        with get_engine(local_infile=True).begin() as conn:
+            conn.execute(text(stmt))
+    finally:
+        fh.close()
+        os.unlink(fh.name)
+
+
+def write_frame(df, table, upsert=False, chunksize=DEFAULT_CHUNKSIZE, load_infile=None):
+    """
+    Append ``df`` to ``table`` over the shared pooled engine.
+
+    Rows go out as multi-row INSERTs of ``chunksize`` rows.  With
+    ``upsert=True`` they become INSERT ... ON DUPLICATE KEY UPDATE (or
+    LOAD DATA ... REPLACE), so re-running a load over the same keys is a
+    no-op instead of duplicating rows; that needs a unique key on the table
+    (see UPSERT_KEYS), which is checked first.  ``load_infile`` (default:
+    the BBALL_LOAD_INFILE env var) switches to LOAD DATA LOCAL INFILE.
+
+    Returns True on success and raises WriteError otherwise, so a failed
+    batch stops the ingest (non-zero exit) instead of being dropped.
+    """
+    if df is None or df.empty:
         return True
+    if load_infile is None:
+        load_infile = USE_LOAD_INFILE
+    try:
+        if upsert:
+            require_upsert_key(table, df.columns)
+        if load_infile:
+            _load_infile(df, table, upsert)
+        else:
+            df.to_sql(
+                table,
+                con=get_engine(),
+                if_exists='append',
+                index=False,
+                chunksize=chunksize,
+                method=_upsert_rows if upsert else 'multi',
+            )
+        return True
+    except WriteError:
+        raise
     except Exception as e:
-        print(e)
-        input()
-        return False
+        raise WriteError(
+            "input_data: writing " + str(len(df)) + " rows to " + table + " failed: " + str(e)
+        ) from e
+
 
-    conn.close()
+def input_data(df, table, upsert=False):
+    return write_frame(df, table, upsert=upsert)
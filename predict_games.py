@@ -19,24 +19,26 @@ Assumptions
 
 from __future__ import annotations
 
-import mysql.connector  # ⬅️ NEW
-
 from datetime import datetime, timedelta
 import datetime as _dt
 from pathlib import Path
+from dataclasses import dataclass
 from typing import Tuple
 
 import pandas as pd
 import numpy as np
 
-# This should be your existing connection setup
-# (or whatever you use today in input_data.py)
-from input_data import *  # noqa: F401,F403  (for mycursor / engine, etc.)
-import hard_rock_converter
-import io
+from bball.data.best_lines import best_season_lines, dedup_lines
+from bball.data.hard_rock_lines import hard_rock_lines_for_slate
+from bball.data.line_matching import LineMatcher
+from bball.data.s3_lines import read_season_lines
+from bball.data.slate_features import assemble_slate_features, fetch_slate_sources
+from bball.data.super_sked import load_super_sked, super_sked_path
+from bball.data.team_aliases import S3_ALIASES
+from bball.data.teams import S3 as S3_SOURCE, drop_slate_excluded, registry as team_registry
+from bball.evaluation.edges import line_diffs
 import os
-import boto3
-import pyarrow.parquet as pq
+import threading
 from dotenv import load_dotenv
 load_dotenv(Path(".env"))
 
@@ -51,18 +53,77 @@ DB_CONFIG = {
     "port": int(os.getenv("BBALL_DB_PORT", "3306")),
 }
 
-cnx = mysql.connector.connect(**DB_CONFIG)
-mycursor = cnx.cursor()
+DB_POOL_SIZE = int(os.getenv("BBALL_DB_POOL_SIZE", "4"))
+
+# Nothing connects at import time: the pool is created on first use and each
+# thread keeps its own pooled connection + cursor.
+_pool = None
+_pool_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_connection():
+    """This thread's pooled MySQL connection (opened on first use)."""
+    global _pool
+    conn = getattr(_local, "conn", None)
+    if conn is not None and conn.is_connected():
+        return conn
+    with _pool_lock:
+        if _pool is None:
+            from mysql.connector import pooling
+
+            _pool = pooling.MySQLConnectionPool(
+                pool_name="predict_games", pool_size=DB_POOL_SIZE, **DB_CONFIG
+            )
+    _local.conn = _pool.get_connection()
+    _local.cursor = None
+    return _local.conn
+
+
+def get_cursor():
+    """This thread's cursor on ``get_connection()``."""
+    conn = get_connection()
+    if getattr(_local, "cursor", None) is None:
+        _local.cursor = conn.cursor()
+    return _local.cursor
+
+
+class _LazyCursor:
+    """Module-level ``mycursor`` that only connects when first used."""
+
+    def __getattr__(self, name):
+        return getattr(get_cursor(), name)
+
+
+mycursor = _LazyCursor()
 
 # ---------------------------------------------------------------------------
-# Global date helpers (used by your existing SQL logic)
+# Slate date context (passed explicitly instead of module-level CURR_* globals,
+# so several dates can be built in one process at the same time)
 # ---------------------------------------------------------------------------
 
-_now = _dt.datetime.now()
-CURR_YEAR = _now.year
-CURR_MONTH = _now.month
-CURR_DAY = _now.day
-yesterday = _now - timedelta(days=1)  # needed by get_todays_lines
+@dataclass(frozen=True)
+class SlateDate:
+    """The calendar day a slate of games is built for."""
+
+    day: _dt.date
+
+    @classmethod
+    def coerce(cls, value: object | None = None) -> "SlateDate":
+        """SlateDate from None (today), a date/datetime or a YYYY-MM-DD string."""
+        if isinstance(value, SlateDate):
+            return value
+        if value is None:
+            return cls(_dt.date.today())
+        return cls(_coerce_date(value))
+
+    @property
+    def start(self) -> _dt.datetime:
+        return _dt.datetime(self.day.year, self.day.month, self.day.day)
+
+    @property
+    def end(self) -> _dt.datetime:
+        return self.start + timedelta(days=1)
 
 
 # ---------------------------------------------------------------------------
@@ -233,11 +294,9 @@ def get_stats_past(row_df):
     away_team_home = False
     return pd.Series([away_adj_oe, away_BARTHAG, away_adj_de, away_adj_pace, home_adj_oe, home_adj_de, home_adj_pace, home_BARTHAG, home_team_home, away_team_home])
 
-def _format_sql_time(dt_value: _dt.datetime) -> str:
-    return dt_value.strftime("%y/%m/%d %H:%M:%S")
-
-
 def _coerce_date(value: object) -> _dt.date:
+    if isinstance(value, SlateDate):
+        return value.day
     if isinstance(value, _dt.datetime):
         return value.date()
     if isinstance(value, _dt.date):
@@ -259,428 +318,57 @@ def _empty_hard_rock_row() -> pd.Series:
 
 
 def get_todays_lines(away_team_name, home_team_name, target_date: object | None = None):
-    if target_date is None:
-        sql = """
-        SELECT max(Time) from sports.hard_rock_lines
-        """
-        result = mycursor.execute(sql)
-        max_date_time = mycursor.fetchall()[0][0]
-        lower_bound = yesterday
-        if max_date_time is None:
-            return _empty_hard_rock_row()
-    else:
-        target = _coerce_date(target_date)
-        day_start = _dt.datetime(target.year, target.month, target.day)
-        day_end = day_start + timedelta(days=1)
-        sql = """
-        SELECT max(Time) from sports.hard_rock_lines
-        where Time >= \'""" + _format_sql_time(day_start) + """\'
-        and Time < \'""" + _format_sql_time(day_end) + """\'
-        """
-        result = mycursor.execute(sql)
-        max_date_time = mycursor.fetchall()[0][0]
-        if max_date_time is None:
-            return _empty_hard_rock_row()
-        lower_bound = day_start
-
-    sql = """
-    SELECT * from sports.hard_rock_lines
-    where Time = \'""" + _format_sql_time(max_date_time) + """\'
-    and away_team_name =\'""" + hard_rock_converter.convert_name(away_team_name).replace('\'','\'\'') + """\'
-    and home_team_name =\'""" + hard_rock_converter.convert_name(home_team_name).replace('\'','\'\'') + """\';
-    """
-    print(sql)
-    result = mycursor.execute(sql)
-    df = pd.DataFrame(mycursor.fetchall())
-    if df.empty:
-        sql = """
-        SELECT * from sports.hard_rock_lines
-        where away_team_name =\'""" + hard_rock_converter.convert_name(away_team_name).replace('\'','\'\'') + """\'
-        and home_team_name =\'""" + hard_rock_converter.convert_name(home_team_name).replace('\'','\'\'') + """\'
-        and Time < \'""" + _format_sql_time(max_date_time) + """\'
-        and Time >= \'""" + _format_sql_time(lower_bound) + """\'
-        order by Time desc
-        LIMIT 1;
-        """
-        print(sql)
-        result = mycursor.execute(sql)
-        df = pd.DataFrame(mycursor.fetchall())
-    if df.empty:
-        sql = """
-        SELECT * from sports.hard_rock_lines
-        where Time = \'""" + _format_sql_time(max_date_time) + """\'
-        and away_team_name =\'""" + hard_rock_converter.convert_name(home_team_name).replace('\'','\'\'') + """\'
-        and home_team_name =\'""" + hard_rock_converter.convert_name(away_team_name).replace('\'','\'\'') + """\';
-        """
-        print(sql)
-
-        result = mycursor.execute(sql)
-        df = pd.DataFrame(mycursor.fetchall())
-        if not df.empty:
-            time = df[0]
-            away_team = df[1]
-            home_team = df[2]
-            away_spread = df[[3,4]]
-            home_spread = df[[5,6]]
-            over_unders = df[[7,8,9,10]]
-            away_ml = df[11]
-            home_ml = df[12]
-            df = pd.concat([time, home_team, away_team,home_spread, away_spread, over_unders, home_ml, away_ml], axis=1)
-    if df.empty:
-        sql = """
-        SELECT * from sports.hard_rock_lines
-        where away_team_name =\'""" + hard_rock_converter.convert_name(home_team_name).replace('\'','\'\'') + """\'
-        and home_team_name =\'""" + hard_rock_converter.convert_name(away_team_name).replace('\'','\'\'') + """\'
-        and Time < \'""" + _format_sql_time(max_date_time) + """\'
-        and Time >= \'""" + _format_sql_time(lower_bound) + """\'
-        order by Time desc
-        LIMIT 1;
-        """
-        print(sql)
-
-        result = mycursor.execute(sql)
-        df = pd.DataFrame(mycursor.fetchall())
-        if not df.empty:
-            time = df[0]
-            away_team = df[1]
-            home_team = df[2]
-            away_spread = df[[3,4]]
-            home_spread = df[[5,6]]
-            over_unders = df[[7,8,9,10]]
-            away_ml = df[11]
-            home_ml = df[12]
-            df = pd.concat([time, home_team, away_team,home_spread, away_spread, over_unders, home_ml, away_ml], axis=1)
-    if df.empty:
+    """Hard Rock line for one game (see attach_hard_rock_lines for a slate)."""
+    game = pd.DataFrame({"away_team_name": [away_team_name], "home_team_name": [home_team_name]})
+    target = None if target_date is None else _coerce_date(target_date)
+    lines = hard_rock_lines_for_slate(mycursor, game, target)
+    if lines.columns.empty:
         return _empty_hard_rock_row()
-    field_names = [i[0] for i in mycursor.description]
-    df.columns = field_names
-    df = df.drop(['Time', 'away_team_name', 'home_team_name'], axis =1)
-    df = _ensure_row_df(df)
-    return df.iloc[0]
+    return lines.iloc[0]
 
 def get_diffs(df_row):
-    def _is_missing(value):
-        return pd.isna(value)
-
-    spread_home = df_row['spread_home']
-    home_spread_num = df_row['home_spread_num']
-    if _is_missing(spread_home) or _is_missing(home_spread_num):
-        spread_diff = np.nan
-    else:
-        spread_diff = spread_home - home_spread_num
-
-    away_winner_odds = df_row['away_winner_odds']
-    away_win_odds = df_row['away_win_odds']
-    if _is_missing(away_winner_odds) or _is_missing(away_win_odds):
-        away_winner_diff = np.nan
-    elif away_winner_odds > 0 and away_win_odds < 0:
-        away_winner_diff = (away_winner_odds - 100) + (100 + away_win_odds)
-    elif away_winner_odds < 0 and away_win_odds > 0:
-        away_winner_diff = (away_winner_odds + 100) + (away_win_odds - 100)
-    else:
-        away_winner_diff = away_winner_odds - away_win_odds
-
-    home_winner_odds = df_row['home_winner_odds']
-    home_win_odds = df_row['home_win_odds']
-    if _is_missing(home_winner_odds) or _is_missing(home_win_odds):
-        home_winner_diff = np.nan
-    elif home_winner_odds > 0 and home_win_odds < 0:
-        home_winner_diff = (home_winner_odds - 100) + (100 + home_win_odds)
-    elif home_winner_odds < 0 and home_win_odds > 0:
-        home_winner_diff = (home_winner_odds + 100) + (home_win_odds - 100)
-    else:
-        home_winner_diff = home_winner_odds - home_win_odds
-
-    return(pd.Series([spread_diff, away_winner_diff, home_winner_diff]))
+    """One-row version of bball.evaluation.edges.line_diffs."""
+    diffs = line_diffs(pd.DataFrame([df_row]))
+    return pd.Series(diffs.iloc[0].to_numpy())
 
 
 # ---------------------------------------------------------------------------
 # New: pull today's games from Bart Torvik super sked
 # ---------------------------------------------------------------------------
 
-def get_games_for_today(season_year: int, bart_dir: str = "bart_files") -> pd.DataFrame:
+def get_games_for_today(
+    season_year: int,
+    bart_dir: str = "bart_files",
+    target_date: object | None = None,
+) -> pd.DataFrame:
     """
-    Read bart_files/{season_year}_super_sked.csv and return *today's* games,
+    Read bart_files/{season_year}_super_sked.csv and return the games on
+    ``target_date`` (a SlateDate, date or YYYY-MM-DD; default today),
     excluding D2 games (where column 6 == 99).
     """
-    csv_path = Path(bart_dir) / f"{season_year}_super_sked.csv"
+    slate = SlateDate.coerce(target_date)
+    csv_path = super_sked_path(season_year, bart_dir)
     if not csv_path.exists():
         raise FileNotFoundError(
             f"Super sked not found at {csv_path}. "
             "Make sure you’ve downloaded it into bart_files/."
         )
 
-    games_df = pd.read_csv(csv_path, header=None)
-
-    # 1 = game datetime
-    games_df[1] = pd.to_datetime(games_df[1])
-
-    today_start = _dt.datetime(CURR_YEAR, CURR_MONTH, CURR_DAY)
-    today_end = today_start + timedelta(days=1)
-
-    # only today's games
-    mask_date = (games_df[1] >= today_start) & (games_df[1] < today_end)
+    # parsed once per CSV version (Parquet cache + in-process memo);
+    # column 1 = game datetime, sliced to the slate's day via the date index
+    games_df = load_super_sked(csv_path).between(slate.start, slate.end)
 
     # drop D2 games: column 6 == 99 (numeric or string)
     mask_div = (games_df[6] != 99) & (games_df[6].astype(str) != "99")
 
-    # apply both filters
-    todays_games = games_df.loc[mask_date & mask_div, [7, 8, 14]].copy()
+    todays_games = games_df.loc[mask_div, [7, 8, 14]].copy()
 
     # 7 = neutral_site, 8 = away_team_name, 14 = home_team_name
     todays_games.columns = ["neutral_site", "away_team_name", "home_team_name"]
     todays_games = todays_games.reset_index(drop=True)
-    todays_games = todays_games[todays_games.home_team_name != 'Western New Mexico']
-    todays_games = todays_games[todays_games.away_team_name != 'Western New Mexico']
-    todays_games = todays_games[todays_games.home_team_name != 'Middle Ga. St.']
-    todays_games = todays_games[todays_games.away_team_name != 'Middle Ga. St.']
-    todays_games = todays_games[todays_games.home_team_name != 'Northern New Mexico']
-    todays_games = todays_games[todays_games.away_team_name != 'Northern New Mexico']
-    todays_games = todays_games[todays_games.home_team_name != 'Pacific Oregon']
-    todays_games = todays_games[todays_games.away_team_name != 'Pacific Oregon']
-    todays_games = todays_games[todays_games.home_team_name != 'UMass Boston']
-    todays_games = todays_games[todays_games.away_team_name != 'UMass Boston']
-    todays_games = todays_games[todays_games.home_team_name != 'Virginia-Lynchburg']
-    todays_games = todays_games[todays_games.away_team_name != 'Virginia-Lynchburg']
-    todays_games = todays_games[todays_games.home_team_name != 'Hardin-Simmons']
-    todays_games = todays_games[todays_games.away_team_name != 'Hardin-Simmons']
-    todays_games = todays_games[todays_games.home_team_name != 'Northwest Indian']
-    todays_games = todays_games[todays_games.away_team_name != 'Northwest Indian']
-    todays_games = todays_games[todays_games.home_team_name != 'Johnson (TN)']
-    todays_games = todays_games[todays_games.away_team_name != 'Johnson (TN)']
-    todays_games = todays_games[todays_games.home_team_name != 'Brescia']
-    todays_games = todays_games[todays_games.away_team_name != 'Brescia']
-    todays_games = todays_games[todays_games.home_team_name != 'SUNY Delhi']
-    todays_games = todays_games[todays_games.away_team_name != 'SUNY Delhi']
-    todays_games = todays_games[todays_games.home_team_name != 'Walla Walla']
-    todays_games = todays_games[todays_games.away_team_name != 'Walla Walla']
-    todays_games = todays_games[todays_games.home_team_name != 'Bryn Athyn']
-    todays_games = todays_games[todays_games.away_team_name != 'Bryn Athyn']
-    todays_games = todays_games[todays_games.home_team_name != 'Crown MN']
-    todays_games = todays_games[todays_games.away_team_name != 'Crown MN']
-    todays_games = todays_games[todays_games.home_team_name != 'Bethany (WV)']
-    todays_games = todays_games[todays_games.away_team_name != 'Bethany (WV)']
-    todays_games = todays_games[todays_games.home_team_name != 'St. Francis (IL)']
-    todays_games = todays_games[todays_games.away_team_name != 'St. Francis (IL)']
-    todays_games = todays_games[todays_games.home_team_name != 'St. Mary-Woods']
-    todays_games = todays_games[todays_games.away_team_name != 'St. Mary-Woods']
-    todays_games = todays_games[todays_games.home_team_name != 'Eureka']
-    todays_games = todays_games[todays_games.away_team_name != 'Eureka']
-    todays_games = todays_games[todays_games.home_team_name != 'Shawnee St.']
-    todays_games = todays_games[todays_games.away_team_name != 'Shawnee St.']
-    todays_games = todays_games[todays_games.home_team_name != 'Ky. Christian']
-    todays_games = todays_games[todays_games.away_team_name != 'Ky. Christian']
-    todays_games = todays_games[todays_games.home_team_name != 'La Sierra']
-    todays_games = todays_games[todays_games.away_team_name != 'La Sierra']
-    todays_games = todays_games[todays_games.home_team_name != 'Our Lady of the Lake']
-    todays_games = todays_games[todays_games.away_team_name != 'Our Lady of the Lake']
-    todays_games = todays_games[todays_games.home_team_name != 'Champion Chris.']
-    todays_games = todays_games[todays_games.away_team_name != 'Champion Chris.']
-    todays_games = todays_games[todays_games.home_team_name != 'Lancaster Bible']
-    todays_games = todays_games[todays_games.away_team_name != 'Lancaster Bible']
-    todays_games = todays_games[todays_games.home_team_name != 'South Alabama']
-    todays_games = todays_games[todays_games.away_team_name != 'South Alabama']
-    todays_games = todays_games[todays_games.home_team_name != 'Stonehill']
-    todays_games = todays_games[todays_games.away_team_name != 'Stonehill']
-    todays_games = todays_games[todays_games.away_team_name != 'Truett-McConnell']
-    todays_games = todays_games[todays_games.home_team_name != 'Truett-McConnell']
-    todays_games = todays_games[todays_games.away_team_name != 'St. Thomas Houston']
-    todays_games = todays_games[todays_games.home_team_name != 'St. Thomas Houston']
-    todays_games = todays_games[todays_games.away_team_name != 'West Va. Wesleyan']
-    todays_games = todays_games[todays_games.home_team_name != 'West Va. Wesleyan']
-    todays_games = todays_games[todays_games.away_team_name != 'Willamette']
-    todays_games = todays_games[todays_games.home_team_name != 'Willamette']
-    todays_games = todays_games[todays_games.away_team_name != 'Whittier']
-    todays_games = todays_games[todays_games.home_team_name != 'Whittier']
-    todays_games = todays_games[todays_games.away_team_name != 'Cairn']
-    todays_games = todays_games[todays_games.home_team_name != 'Cairn']
-    todays_games = todays_games[todays_games.away_team_name != 'St. Andrews']
-    todays_games = todays_games[todays_games.home_team_name != 'St. Andrews']
-    todays_games = todays_games[todays_games.away_team_name != 'LaGrange']
-    todays_games = todays_games[todays_games.home_team_name != 'LaGrange']
-    todays_games = todays_games[todays_games.away_team_name != 'CarolinaU']
-    todays_games = todays_games[todays_games.home_team_name != 'CarolinaU']
-    todays_games = todays_games[todays_games.away_team_name != 'Misericordia']
-    todays_games = todays_games[todays_games.home_team_name != 'Misericordia']
-    todays_games = todays_games[todays_games.away_team_name != 'William Peace']
-    todays_games = todays_games[todays_games.home_team_name != 'William Peace']
-    todays_games = todays_games[todays_games.away_team_name != 'Mid-Atlantic Christ.']
-    todays_games = todays_games[todays_games.home_team_name != 'Mid-Atlantic Christ.']
-    todays_games = todays_games[todays_games.away_team_name != 'Ecclesia']
-    todays_games = todays_games[todays_games.home_team_name != 'Ecclesia']
-    todays_games = todays_games[todays_games.away_team_name != 'S\'western Adventist']
-    todays_games = todays_games[todays_games.home_team_name != 'S\'western Adventist']
-    todays_games = todays_games[todays_games.away_team_name != 'Montreat']
-    todays_games = todays_games[todays_games.home_team_name != 'Montreat']
-    todays_games = todays_games[todays_games.away_team_name != 'Tennessee Wesleyan']
-    todays_games = todays_games[todays_games.home_team_name != 'Tennessee Wesleyan']
-    todays_games = todays_games[todays_games.away_team_name != 'Lincoln (MO)']
-    todays_games = todays_games[todays_games.home_team_name != 'Lincoln (MO)']
-    todays_games = todays_games[todays_games.away_team_name != 'Lincoln (CA)']
-    todays_games = todays_games[todays_games.home_team_name != 'Lincoln (CA)']
-    todays_games = todays_games[todays_games.away_team_name != 'Michigan Tech']
-    todays_games = todays_games[todays_games.home_team_name != 'Michigan Tech']
-    todays_games = todays_games[todays_games.away_team_name != 'Regent']
-    todays_games = todays_games[todays_games.home_team_name != 'Regent']
-    todays_games = todays_games[todays_games.away_team_name != 'Chadron St.']
-    todays_games = todays_games[todays_games.home_team_name != 'Chadron St.']
-    todays_games = todays_games[todays_games.away_team_name != 'UNT Dallas']
-    todays_games = todays_games[todays_games.home_team_name != 'UNT Dallas']
-    todays_games = todays_games[todays_games.away_team_name != 'Milligan']
-    todays_games = todays_games[todays_games.home_team_name != 'Milligan']
-    todays_games = todays_games[todays_games.away_team_name != 'Schreiner']
-    todays_games = todays_games[todays_games.home_team_name != 'Schreiner']
-    todays_games = todays_games[todays_games.away_team_name != 'Franciscan']
-    todays_games = todays_games[todays_games.home_team_name != 'Franciscan']
-    todays_games = todays_games[todays_games.away_team_name != 'Defiance']
-    todays_games = todays_games[todays_games.home_team_name != 'Defiance']
-    todays_games = todays_games[todays_games.away_team_name != 'Dillard']
-    todays_games = todays_games[todays_games.home_team_name != 'Dillard']
-    todays_games = todays_games[todays_games.away_team_name != 'Loyola LA']
-    todays_games = todays_games[todays_games.home_team_name != 'Loyola LA']
-    todays_games = todays_games[todays_games.away_team_name != 'Texas Wesleyan']
-    todays_games = todays_games[todays_games.home_team_name != 'Texas Wesleyan']
-    todays_games = todays_games[todays_games.away_team_name != 'South Dakota Mines']
-    todays_games = todays_games[todays_games.home_team_name != 'South Dakota Mines']
-    todays_games = todays_games[todays_games.away_team_name != 'Southern-N.O.']
-    todays_games = todays_games[todays_games.home_team_name != 'Southern-N.O.']
-    todays_games = todays_games[todays_games.away_team_name != 'Ky. Wesleyan']
-    todays_games = todays_games[todays_games.home_team_name != 'Ky. Wesleyan']
-    todays_games = todays_games[todays_games.away_team_name != 'Rust']
-    todays_games = todays_games[todays_games.home_team_name != 'Rust']
-    todays_games = todays_games[todays_games.away_team_name != 'Immaculata']
-    todays_games = todays_games[todays_games.home_team_name != 'Immaculata']
-    todays_games = todays_games[todays_games.away_team_name != 'UHSP']
-    todays_games = todays_games[todays_games.home_team_name != 'UHSP']
-    todays_games = todays_games[todays_games.away_team_name != 'Biblical Stud. (TX)']
-    todays_games = todays_games[todays_games.home_team_name != 'Biblical Stud. (TX)']
-    todays_games = todays_games[todays_games.away_team_name != 'Howard Payne']
-    todays_games = todays_games[todays_games.home_team_name != 'Howard Payne']
-    todays_games = todays_games[todays_games.away_team_name != 'Brewton-Parker']
-    todays_games = todays_games[todays_games.home_team_name != 'Brewton-Parker']
-    todays_games = todays_games[todays_games.away_team_name != 'Penn St.-Fayette']
-    todays_games = todays_games[todays_games.home_team_name != 'Penn St.-Fayette']
-    todays_games = todays_games[todays_games.away_team_name != 'North Central (IL)']
-    todays_games = todays_games[todays_games.home_team_name != 'North Central (IL)']
-    todays_games = todays_games[todays_games.away_team_name != 'Non-DI']
-    todays_games = todays_games[todays_games.home_team_name != 'Non-DI']
-    todays_games = todays_games[todays_games.away_team_name != 'Florida Tech']
-    todays_games = todays_games[todays_games.home_team_name != 'Florida Tech']
-    todays_games = todays_games[todays_games.away_team_name != 'Calumet Col.']
-    todays_games = todays_games[todays_games.home_team_name != 'Calumet Col.']
-    todays_games = todays_games[todays_games.away_team_name != 'Midway']
-    todays_games = todays_games[todays_games.home_team_name != 'Midway']
-    todays_games = todays_games[todays_games.away_team_name != 'Fort Lauderdale']
-    todays_games = todays_games[todays_games.home_team_name != 'Fort Lauderdale']
-    todays_games = todays_games[todays_games.away_team_name != 'Stanislaus St.']
-    todays_games = todays_games[todays_games.home_team_name != 'Stanislaus St.']
-    todays_games = todays_games[todays_games.away_team_name != 'Occidental']
-    todays_games = todays_games[todays_games.home_team_name != 'Occidental']
-    todays_games = todays_games[todays_games.away_team_name != 'Spartanburg Meth.']
-    todays_games = todays_games[todays_games.home_team_name != 'Spartanburg Meth.']
-    todays_games = todays_games[todays_games.away_team_name != 'Dallas']
-    todays_games = todays_games[todays_games.home_team_name != 'Dallas']
-    todays_games = todays_games[todays_games.away_team_name != 'Bethesda (CA)']
-    todays_games = todays_games[todays_games.home_team_name != 'Bethesda (CA)']
-    todays_games = todays_games[todays_games.away_team_name != 'Webber International']
-    todays_games = todays_games[todays_games.home_team_name != 'Webber International']
-    todays_games = todays_games[todays_games.away_team_name != 'William Woods']
-    todays_games = todays_games[todays_games.home_team_name != 'William Woods']
-    todays_games = todays_games[todays_games.away_team_name != 'Cal Maritime']
-    todays_games = todays_games[todays_games.home_team_name != 'Cal Maritime']
-    todays_games = todays_games[todays_games.away_team_name != 'Westcliff']
-    todays_games = todays_games[todays_games.home_team_name != 'Westcliff']
-    todays_games = todays_games[todays_games.away_team_name != 'Southwest (NM)']
-    todays_games = todays_games[todays_games.home_team_name != 'Southwest (NM)']
-    todays_games = todays_games[todays_games.away_team_name != 'Southwestern Christ.']
-    todays_games = todays_games[todays_games.home_team_name != 'Southwestern Christ.']
-    todays_games = todays_games[todays_games.away_team_name != 'Mt. Marty']
-    todays_games = todays_games[todays_games.home_team_name != 'Mt. Marty']
-    todays_games = todays_games[todays_games.away_team_name != 'Columbia Int\'l']
-    todays_games = todays_games[todays_games.home_team_name != 'Columbia Int\'l']
-    todays_games = todays_games[todays_games.away_team_name != 'Va. Wesleyan']
-    todays_games = todays_games[todays_games.home_team_name != 'Va. Wesleyan']
-    todays_games = todays_games[todays_games.away_team_name != 'Blackburn']
-    todays_games = todays_games[todays_games.home_team_name != 'Blackburn']
-    todays_games = todays_games[todays_games.away_team_name != 'Alice Lloyd']
-    todays_games = todays_games[todays_games.home_team_name != 'Alice Lloyd']
-    todays_games = todays_games[todays_games.away_team_name != 'Nobel']
-    todays_games = todays_games[todays_games.home_team_name != 'Nobel']
-    todays_games = todays_games[todays_games.away_team_name != 'Friends']
-    todays_games = todays_games[todays_games.home_team_name != 'Friends']
-    todays_games = todays_games[todays_games.away_team_name != 'Asbury']
-    todays_games = todays_games[todays_games.home_team_name != 'Asbury']
-    todays_games = todays_games[todays_games.away_team_name != 'Heidelberg']
-    todays_games = todays_games[todays_games.home_team_name != 'Heidelberg']
-    todays_games = todays_games[todays_games.away_team_name != 'Westminster (MO)']
-    todays_games = todays_games[todays_games.home_team_name != 'Westminster (MO)']
-    todays_games = todays_games[todays_games.away_team_name != 'Manhattanville']
-    todays_games = todays_games[todays_games.home_team_name != 'Manhattanville']
-    todays_games = todays_games[todays_games.away_team_name != 'JWU (Providence)']
-    todays_games = todays_games[todays_games.home_team_name != 'JWU (Providence)']
-    todays_games = todays_games[todays_games.away_team_name != 'Neumann']
-    todays_games = todays_games[todays_games.home_team_name != 'Neumann']
-    todays_games = todays_games[todays_games.away_team_name != 'Waldorf']
-    todays_games = todays_games[todays_games.home_team_name != 'Waldorf']
-    todays_games = todays_games[todays_games.away_team_name != 'Texas Lutheran']
-    todays_games = todays_games[todays_games.home_team_name != 'Texas Lutheran']
-    todays_games = todays_games[todays_games.away_team_name != 'Warner']
-    todays_games = todays_games[todays_games.home_team_name != 'Warner']
-    todays_games = todays_games[todays_games.away_team_name != 'Regis (MA)']
-    todays_games = todays_games[todays_games.home_team_name != 'Regis (MA)']
-    todays_games = todays_games[todays_games.away_team_name != 'Muskingum']
-    todays_games = todays_games[todays_games.home_team_name != 'Muskingum']
-    todays_games = todays_games[todays_games.away_team_name != 'Dallas Christian']
-    todays_games = todays_games[todays_games.home_team_name != 'Dallas Christian']
-    todays_games = todays_games[todays_games.away_team_name != 'Emerson']
-    todays_games = todays_games[todays_games.home_team_name != 'Emerson']
-    todays_games = todays_games[todays_games.away_team_name != 'Fort Valley St.']
-    todays_games = todays_games[todays_games.home_team_name != 'Fort Valley St.']
-    todays_games = todays_games[todays_games.away_team_name != 'Cleary']
-    todays_games = todays_games[todays_games.home_team_name != 'Cleary']
-    todays_games = todays_games[todays_games.away_team_name != 'TAMU-San Antonio']
-    todays_games = todays_games[todays_games.home_team_name != 'TAMU-San Antonio']
-    todays_games = todays_games[todays_games.away_team_name != 'Eastern Oregon']
-    todays_games = todays_games[todays_games.home_team_name != 'Eastern Oregon']
-    todays_games = todays_games[todays_games.away_team_name != 'Benedictine Mesa']
-    todays_games = todays_games[todays_games.home_team_name != 'Benedictine Mesa']
-    todays_games = todays_games[todays_games.away_team_name != 'Tex. A&M-Texarkana']
-    todays_games = todays_games[todays_games.home_team_name != 'Tex. A&M-Texarkana']
-    todays_games = todays_games[todays_games.away_team_name != 'Elms']
-    todays_games = todays_games[todays_games.home_team_name != 'Elms']
-    todays_games = todays_games[todays_games.away_team_name != 'William Carey']
-    todays_games = todays_games[todays_games.home_team_name != 'William Carey']
-    todays_games = todays_games[todays_games.away_team_name != 'East-West U.']
-    todays_games = todays_games[todays_games.home_team_name != 'East-West U.']
-    todays_games = todays_games[todays_games.away_team_name != 'Anderson (IN)']
-    todays_games = todays_games[todays_games.home_team_name != 'Anderson (IN)']
-    todays_games = todays_games[todays_games.away_team_name != 'Kean']
-    todays_games = todays_games[todays_games.home_team_name != 'Kean']
-    todays_games = todays_games[todays_games.away_team_name != 'Medgar Evers']
-    todays_games = todays_games[todays_games.home_team_name != 'Medgar Evers']
-    todays_games = todays_games[todays_games.away_team_name != 'Penn St.-Schuylkill']
-    todays_games = todays_games[todays_games.home_team_name != 'Penn St.-Schuylkill']
-    todays_games = todays_games[todays_games.away_team_name != 'Bowdoin']
-    todays_games = todays_games[todays_games.home_team_name != 'Bowdoin']
-    todays_games = todays_games[todays_games.away_team_name != 'Bowie St.']
-    todays_games = todays_games[todays_games.home_team_name != 'Bowie St.']
-    todays_games = todays_games[todays_games.away_team_name != 'Cheyney']
-    todays_games = todays_games[todays_games.home_team_name != 'Cheyney']
-    todays_games = todays_games[todays_games.away_team_name != 'Washington Adventist']
-    todays_games = todays_games[todays_games.home_team_name != 'Washington Adventist']
-    todays_games = todays_games[todays_games.away_team_name != 'Morehouse']
-    todays_games = todays_games[todays_games.home_team_name != 'Morehouse']
-    todays_games = todays_games[todays_games.away_team_name != 'Penn St.-Shenango']
-    todays_games = todays_games[todays_games.home_team_name != 'Penn St.-Shenango']
-    # If you still want to hard-filter certain non-D1 teams,
-    # you can add those filters here (same pattern as your old script).
-    #
-    # Example:
-    # bad = {"Western New Mexico", "Middle Ga. St."}
-    # todays_games = todays_games[
-    #     ~todays_games.home_team_name.isin(bad)
-    #     & ~todays_games.away_team_name.isin(bad)
-    # ]
+    # non-D1 opponents + slate-only skips: one isin mask against
+    # bball/data/non_d1_teams.txt and slate_skip_teams.txt
+    todays_games = drop_slate_excluded(todays_games)
 
     return todays_games
 
@@ -704,15 +392,10 @@ def attach_hard_rock_lines(
               spread_diff, away_winner_diff, home_winner_diff
     """
 
-    # 1️⃣ Pull lines for each game using your existing SQL logic
-    def _fetch_lines(row):
-        return get_todays_lines(
-            row["away_team_name"],
-            row["home_team_name"],
-            target_date=target_date,
-        )
-
-    lines_df = df.apply(_fetch_lines, axis=1).reset_index(drop=True)
+    # 1️⃣ Pull lines for the whole slate: one window query (two for the live
+    #     slate), exact/flipped/earlier fallbacks resolved with merges
+    target = None if target_date is None else _coerce_date(target_date)
+    lines_df = hard_rock_lines_for_slate(mycursor, df, target)
 
     out = df.reset_index(drop=True).copy()
     out = pd.concat([out, lines_df], axis=1)
@@ -746,9 +429,8 @@ def attach_hard_rock_lines(
     # get_diffs expects 'spread_home' in the same sign convention as home_spread_num
     out["spread_home"] = out["model_home_spread"]
 
-    # 4️⃣ Finally, compute diff columns using your existing get_diffs logic
-    diffs_df = out.apply(get_diffs, axis=1).reset_index(drop=True)
-    diffs_df.columns = ["spread_diff", "away_winner_diff", "home_winner_diff"]
+    # 4️⃣ Finally, compute diff columns (vectorised get_diffs)
+    diffs_df = line_diffs(out)
 
     out = pd.concat([out, diffs_df], axis=1)
     return out
@@ -764,16 +446,23 @@ FEATURE_ORDER_PATH = Path("artifacts") / "feature_order.json"
 def build_today_feature_frame(
     season_year: int,
     bart_dir: str = "bart_files",
+    feature_store=None,
+    target_date: object | None = None,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
-    Build (info_df, X_df) for today's games.
+    Build (info_df, X_df) for the games on ``target_date`` (default today).
+
+    feature_store
+        Optional bball.data.feature_store.PointInTimeStore; when given the
+        team lookups are served from memory instead of MySQL.
 
     info_df
         Human-readable cols (date, neutral_site, away_team_name, home_team_name).
     X_df
         Pure numeric model inputs, columns matching artifacts/feature_order.json.
     """
-    games = get_games_for_today(season_year=season_year, bart_dir=bart_dir)
+    slate = SlateDate.coerce(target_date)
+    games = get_games_for_today(season_year=season_year, bart_dir=bart_dir, target_date=slate)
 
     if games.empty:
         # No games today – return empty frames with correct columns
@@ -789,27 +478,18 @@ def build_today_feature_frame(
 
     # Attach a "date" column used by your SQL (get_all_stats / get_stats)
     games = games.copy()
-    games["date"] = _dt.datetime(CURR_YEAR, CURR_MONTH, CURR_DAY)
-
-    # 1) advanced team strength (adj_oe, adj_de, BARTHAG, pace, home flags)
-    stats_basic = games.apply(get_stats, axis=1)
-    stats_basic = stats_basic.rename(
-        columns={
-            0: "away_team_adj_oe",
-            1: "away_team_BARTHAG",
-            2: "away_team_adj_de",
-            3: "away_team_adj_pace",
-            4: "home_team_adj_oe",
-            5: "home_team_adj_de",
-            6: "home_team_adj_pace",
-            7: "home_team_BARTHAG",
-            8: "home_team_home",
-            9: "away_team_home",
-        }
-    )
-
-    # 2) four-factor style stats from your rolling averages
-    stats_factors = games.apply(get_all_stats, axis=1)
+    games["date"] = slate.start
+
+    # 1) advanced team strength (adj_oe, adj_de, BARTHAG, pace, home flags) and
+    # 2) four-factor style stats from your rolling averages – one windowed
+    #    as-of query per source table for the whole slate
+    slate_teams = pd.concat([games["away_team_name"], games["home_team_name"]])
+    as_of = slate.day
+    if feature_store is not None:
+        latest = feature_store.latest(slate_teams, as_of)
+    else:
+        latest = fetch_slate_sources(mycursor, slate_teams, as_of)
+    stats_basic, stats_factors = assemble_slate_features(games, latest)
 
     # Combine into a single feature frame
     features_raw = pd.concat(
@@ -840,204 +520,31 @@ def build_today_feature_frame(
 # S3 Lines Integration (replaces Hard Rock for daily pipeline)
 # ---------------------------------------------------------------------------
 
-S3_BUCKET = "hoops-edge"
-S3_REGION = "us-east-1"
-SILVER_PREFIX = "silver"
-TABLE_FCT_LINES = "fct_lines"
-
-PROVIDER_RANK = {"Draft Kings": 0, "ESPN BET": 1, "Bovada": 2}
-
-LOCAL_TO_S3 = {
-    "Alabama St.": "Alabama State",
-    "Albany": "UAlbany",
-    "Alcorn St.": "Alcorn State",
-    "American": "American University",
-    "Appalachian St.": "App State",
-    "Arizona St.": "Arizona State",
-    "Arkansas Pine Bluff": "Arkansas-Pine Bluff",
-    "Arkansas St.": "Arkansas State",
-    "Ball St.": "Ball State",
-    "Bethune Cookman": "Bethune-Cookman",
-    "Boise St.": "Boise State",
-    "Cal Baptist": "California Baptist",
-    "Cal St. Bakersfield": "Cal State Bakersfield",
-    "Cal St. Fullerton": "Cal State Fullerton",
-    "Cal St. Northridge": "Cal State Northridge",
-    "Chicago St.": "Chicago State",
-    "Cleveland St.": "Cleveland State",
-    "Colorado St.": "Colorado State",
-    "Connecticut": "UConn",
-    "Coppin St.": "Coppin State",
-    "Delaware St.": "Delaware State",
-    "East Tennessee St.": "East Tennessee State",
-    "FIU": "Florida International",
-    "Florida St.": "Florida State",
-    "Fresno St.": "Fresno State",
-    "Gardner Webb": "Gardner-Webb",
-    "Georgia St.": "Georgia State",
-    "Grambling St.": "Grambling",
-    "Hawaii": "Hawai'i",
-    "IU Indy": "IU Indianapolis",
-    "Idaho St.": "Idaho State",
-    "Illinois Chicago": "UIC",
-    "Illinois St.": "Illinois State",
-    "Indiana St.": "Indiana State",
-    "Iowa St.": "Iowa State",
-    "Jackson St.": "Jackson State",
-    "Jacksonville St.": "Jacksonville State",
-    "Kansas St.": "Kansas State",
-    "Kennesaw St.": "Kennesaw State",
-    "Kent St.": "Kent State",
-    "LIU": "Long Island University",
-    "Long Beach St.": "Long Beach State",
-    "Louisiana Monroe": "UL Monroe",
-    "Loyola MD": "Loyola Maryland",
-    "McNeese St.": "McNeese",
-    "Miami FL": "Miami",
-    "Miami OH": "Miami (OH)",
-    "Michigan St.": "Michigan State",
-    "Mississippi": "Ole Miss",
-    "Mississippi St.": "Mississippi State",
-    "Mississippi Valley St.": "Mississippi Valley State",
-    "Missouri St.": "Missouri State",
-    "Montana St.": "Montana State",
-    "Morehead St.": "Morehead State",
-    "Morgan St.": "Morgan State",
-    "Murray St.": "Murray State",
-    "N.C. State": "NC State",
-    "Nebraska Omaha": "Omaha",
-    "New Mexico St.": "New Mexico State",
-    "Nicholls St.": "Nicholls",
-    "Norfolk St.": "Norfolk State",
-    "North Dakota St.": "North Dakota State",
-    "Northwestern St.": "Northwestern State",
-    "Ohio St.": "Ohio State",
-    "Oklahoma St.": "Oklahoma State",
-    "Oregon St.": "Oregon State",
-    "Penn": "Pennsylvania",
-    "Penn St.": "Penn State",
-    "Portland St.": "Portland State",
-    "Queens": "Queens University",
-    "Sacramento St.": "Sacramento State",
-    "Saint Francis": "St. Francis (PA)",
-    "Sam Houston St.": "Sam Houston",
-    "San Diego St.": "San Diego State",
-    "San Jose St.": "San Jos\u00e9 State",
-    "Seattle": "Seattle U",
-    "South Carolina St.": "South Carolina State",
-    "South Dakota St.": "South Dakota State",
-    "Southeast Missouri St.": "Southeast Missouri State",
-    "Southeastern Louisiana": "SE Louisiana",
-    "St. Thomas": "St. Thomas-Minnesota",
-    "Tarleton St.": "Tarleton State",
-    "Tennessee Martin": "UT Martin",
-    "Tennessee St.": "Tennessee State",
-    "Texas A&M Corpus Chris": "Texas A&M-Corpus Christi",
-    "Texas St.": "Texas State",
-    "UMKC": "Kansas City",
-    "USC Upstate": "South Carolina Upstate",
-    "Utah St.": "Utah State",
-    "Washington St.": "Washington State",
-    "Weber St.": "Weber State",
-    "Wichita St.": "Wichita State",
-    "Wright St.": "Wright State",
-    "Youngstown St.": "Youngstown State",
-}
+LOCAL_TO_S3 = S3_ALIASES
 
 
 def _to_s3_name(local_name: str) -> str:
-    return LOCAL_TO_S3.get(local_name, local_name)
-
-
-def _read_s3_lines(season: int) -> pd.DataFrame:
-    """Read fct_lines from S3 for a given season."""
-    prefix = f"{SILVER_PREFIX}/{TABLE_FCT_LINES}/season={season}/"
-    client = boto3.client("s3", region_name=S3_REGION)
-
-    resp = client.list_objects_v2(Bucket=S3_BUCKET, Prefix=prefix, Delimiter="/")
-    sub_prefixes = [p["Prefix"] for p in resp.get("CommonPrefixes", [])]
-    asof_prefixes = sorted([p for p in sub_prefixes if "asof=" in p], reverse=True)
-    scan_prefix = asof_prefixes[0] if asof_prefixes else prefix
-
-    keys = []
-    paginator = client.get_paginator("list_objects_v2")
-    for page in paginator.paginate(Bucket=S3_BUCKET, Prefix=scan_prefix):
-        for obj in page.get("Contents", []):
-            if obj["Key"].endswith(".parquet"):
-                keys.append(obj["Key"])
+    return team_registry().to_source(local_name, S3_SOURCE)
 
-    if not keys:
-        return pd.DataFrame()
 
-    dfs = []
-    for key in keys:
-        resp = client.get_object(Bucket=S3_BUCKET, Key=key)
-        data = resp["Body"].read()
-        tbl = pq.read_table(io.BytesIO(data))
-        dfs.append(tbl.to_pandas())
-
-    return pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
+def _read_s3_lines(season: int, start=None, end=None) -> pd.DataFrame:
+    """
+    Read fct_lines from S3 for a given season (unchanged objects come from the
+    local cache), projected to the matching columns and optionally limited to
+    start <= startDate < end.
+    """
+    return read_season_lines(season, start=start, end=end)
 
 
 def _dedup_s3_lines(lines_df: pd.DataFrame) -> pd.DataFrame:
     """Deduplicate lines: prefer complete data, then DK > ESPN BET > Bovada.
-    Fix spread sign via majority vote."""
-    lines_df = lines_df.copy()
-    lines_df["spread"] = pd.to_numeric(lines_df["spread"], errors="coerce")
-    lines_df["homeMoneyline"] = pd.to_numeric(lines_df["homeMoneyline"], errors="coerce")
-
-    has_spread = lines_df["spread"].notna() & (lines_df["spread"] != 0)
-    spread_sign = np.sign(lines_df.loc[has_spread, "spread"])
-    majority_sign = (
-        spread_sign.groupby(lines_df.loc[has_spread, "gameId"])
-        .sum()
-        .rename("_majority_sign")
-    )
-
-    dedup = (
-        lines_df
-        .assign(
-            _has_spread=lines_df["spread"].notna().astype(int),
-            _has_total=lines_df["overUnder"].notna().astype(int),
-            _prov_rank=lines_df["provider"].map(PROVIDER_RANK).fillna(99),
-        )
-        .sort_values(
-            ["_has_spread", "_has_total", "_prov_rank"],
-            ascending=[False, False, True],
-        )
-        .drop_duplicates(subset=["gameId"], keep="first")
-        .drop(columns=["_has_spread", "_has_total", "_prov_rank"])
-        .copy()
-    )
+    Fix spread sign via majority vote (see bball.data.best_lines)."""
+    return dedup_lines(lines_df)
 
-    dedup = dedup.merge(majority_sign, on="gameId", how="left")
-    _sp = dedup["spread"]
-    _maj = dedup["_majority_sign"]
-    mask = (
-        _sp.notna() & _maj.notna() & (_maj != 0)
-        & (abs(_sp) >= 3)
-        & (np.sign(_sp) != np.sign(_maj))
-    )
-    dedup.loc[mask, "spread"] = -_sp[mask]
-
-    _sp2 = dedup["spread"]
-    _ml = dedup["homeMoneyline"]
-    mask_ml = (
-        _sp2.notna() & _ml.notna()
-        & (~mask)
-        & dedup["_majority_sign"].isna()
-        & (((_sp2 > 3) & (_ml < -150)) | ((_sp2 < -3) & (_ml > 150)))
-    )
-    dedup.loc[mask_ml, "spread"] = -_sp2[mask_ml]
-    dedup = dedup.drop(columns=["_majority_sign"])
-
-    ts = pd.to_datetime(dedup["startDate"])
-    if ts.dt.tz is not None:
-        dedup["game_date"] = ts.dt.tz_convert("America/New_York").dt.strftime("%Y-%m-%d")
-    else:
-        dedup["game_date"] = ts.dt.tz_localize("UTC").dt.tz_convert("America/New_York").dt.strftime("%Y-%m-%d")
 
-    return dedup
+def s3_season(day: _dt.date) -> int:
+    """Lakehouse season key for a slate day (November starts the next season)."""
+    return day.year + 1 if day.month >= 11 else day.year
 
 
 def attach_s3_lines(
@@ -1050,16 +557,19 @@ def attach_s3_lines(
     Attach betting lines from the hoops-edge S3 lakehouse to a predictions
     DataFrame.  Replaces attach_hard_rock_lines for the daily pipeline.
     """
-    if target_date is None:
-        target_date = _dt.date.today()
-    target = _coerce_date(target_date)
-    date_str = target.strftime("%Y-%m-%d")
+    target = SlateDate.coerce(target_date).day
 
     if season_year is None:
-        season_year = target.year + 1 if target.month >= 11 else target.year
-
-    raw_lines = _read_s3_lines(season_year)
-    if raw_lines.empty:
+        season_year = s3_season(target)
+
+    # materialised best line per gameId (only changed games are re-deduped
+    # when a new snapshot lands); game_date is matched on +/- 1 day
+    lines = best_season_lines(
+        season_year,
+        start=target - _dt.timedelta(days=1),
+        end=target + _dt.timedelta(days=2),
+    )
+    if lines.empty:
         print(f"  No S3 lines found for season {season_year}")
         out = df.reset_index(drop=True).copy()
         out["home_spread_num"] = np.nan
@@ -1070,63 +580,12 @@ def attach_s3_lines(
         out["spread_home"] = out["model_home_spread"]
         return out
 
-    lines = _dedup_s3_lines(raw_lines)
-
-    # Build lookup: (s3_home, s3_away, date) -> line row
-    lines_lookup: dict[tuple[str, str, str], pd.Series] = {}
-    for _, row in lines.iterrows():
-        key = (str(row.get("homeTeam", "")), str(row.get("awayTeam", "")), str(row.get("game_date", "")))
-        lines_lookup[key] = row
-
-    # Adjacent dates for +/- 1 day fallback
-    _d = _dt.datetime.strptime(date_str, "%Y-%m-%d")
-    adjacent_dates = [
-        (_d + _dt.timedelta(days=delta)).strftime("%Y-%m-%d")
-        for delta in [-1, 1]
-    ]
-
-    spreads = []
-    for _, row in df.iterrows():
-        away_s3 = _to_s3_name(row.get("away_team_name", ""))
-        home_s3 = _to_s3_name(row.get("home_team_name", ""))
-
-        matched_line = None
-        flipped = False
-
-        # Exact match on same date
-        line = lines_lookup.get((home_s3, away_s3, date_str))
-        if line is not None and pd.notna(line.get("spread")):
-            matched_line = line
-        else:
-            # Flipped home/away on same date
-            line = lines_lookup.get((away_s3, home_s3, date_str))
-            if line is not None and pd.notna(line.get("spread")):
-                matched_line = line
-                flipped = True
-            else:
-                # +/- 1 day fallback
-                for adj_date in adjacent_dates:
-                    line = lines_lookup.get((home_s3, away_s3, adj_date))
-                    if line is not None and pd.notna(line.get("spread")):
-                        matched_line = line
-                        break
-                    line = lines_lookup.get((away_s3, home_s3, adj_date))
-                    if line is not None and pd.notna(line.get("spread")):
-                        matched_line = line
-                        flipped = True
-                        break
-
-        if matched_line is not None:
-            sp = float(matched_line["spread"])
-            if flipped:
-                sp = -sp
-            spreads.append(sp)
-        else:
-            spreads.append(np.nan)
+    # exact > flipped > +/- 1 day, as merges on integer team IDs
+    spreads = LineMatcher(lines).match(df.reset_index(drop=True), target)
 
     out = df.reset_index(drop=True).copy()
     out["home_spread_num"] = spreads
-    out["away_spread_num"] = [-s if pd.notna(s) else np.nan for s in spreads]
+    out["away_spread_num"] = -spreads
     out["home_spread_odds"] = -110.0
     out["away_spread_odds"] = -110.0
 
@@ -20,124 +20,23 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
-# --- S3 reading (inline to avoid import issues) ---
-
-import io
-import boto3
-import pyarrow.parquet as pq
-
-S3_BUCKET = "hoops-edge"
-S3_REGION = "us-east-1"
-SILVER_PREFIX = "silver"
-TABLE_FCT_LINES = "fct_lines"
-
-PROVIDER_RANK = {"Draft Kings": 0, "ESPN BET": 1, "Bovada": 2}
-
-# --- Team name mapping: local name -> S3 name ---
-
-LOCAL_TO_S3 = {
-    "Alabama St.": "Alabama State",
-    "Albany": "UAlbany",
-    "Alcorn St.": "Alcorn State",
-    "American": "American University",
-    "Appalachian St.": "App State",
-    "Arizona St.": "Arizona State",
-    "Arkansas Pine Bluff": "Arkansas-Pine Bluff",
-    "Arkansas St.": "Arkansas State",
-    "Ball St.": "Ball State",
-    "Bethune Cookman": "Bethune-Cookman",
-    "Boise St.": "Boise State",
-    "Cal Baptist": "California Baptist",
-    "Cal St. Bakersfield": "Cal State Bakersfield",
-    "Cal St. Fullerton": "Cal State Fullerton",
-    "Cal St. Northridge": "Cal State Northridge",
-    "Chicago St.": "Chicago State",
-    "Cleveland St.": "Cleveland State",
-    "Colorado St.": "Colorado State",
-    "Connecticut": "UConn",
-    "Coppin St.": "Coppin State",
-    "Delaware St.": "Delaware State",
-    "East Tennessee St.": "East Tennessee State",
-    "FIU": "Florida International",
-    "Florida St.": "Florida State",
-    "Fresno St.": "Fresno State",
-    "Gardner Webb": "Gardner-Webb",
-    "Georgia St.": "Georgia State",
-    "Grambling St.": "Grambling",
-    "Hawaii": "Hawai'i",
-    "IU Indy": "IU Indianapolis",
-    "Idaho St.": "Idaho State",
-    "Illinois Chicago": "UIC",
-    "Illinois St.": "Illinois State",
-    "Indiana St.": "Indiana State",
-    "Iowa St.": "Iowa State",
-    "Jackson St.": "Jackson State",
-    "Jacksonville St.": "Jacksonville State",
-    "Kansas St.": "Kansas State",
-    "Kennesaw St.": "Kennesaw State",
-    "Kent St.": "Kent State",
-    "LIU": "Long Island University",
-    "Long Beach St.": "Long Beach State",
-    "Louisiana Monroe": "UL Monroe",
-    "Loyola MD": "Loyola Maryland",
-    "McNeese St.": "McNeese",
-    "Miami FL": "Miami",
-    "Miami OH": "Miami (OH)",
-    "Michigan St.": "Michigan State",
-    "Mississippi": "Ole Miss",
-    "Mississippi St.": "Mississippi State",
-    "Mississippi Valley St.": "Mississippi Valley State",
-    "Missouri St.": "Missouri State",
-    "Montana St.": "Montana State",
-    "Morehead St.": "Morehead State",
-    "Morgan St.": "Morgan State",
-    "Murray St.": "Murray State",
-    "N.C. State": "NC State",
-    "Nebraska Omaha": "Omaha",
-    "New Mexico St.": "New Mexico State",
-    "Nicholls St.": "Nicholls",
-    "Norfolk St.": "Norfolk State",
-    "North Dakota St.": "North Dakota State",
-    "Northwestern St.": "Northwestern State",
-    "Ohio St.": "Ohio State",
-    "Oklahoma St.": "Oklahoma State",
-    "Oregon St.": "Oregon State",
-    "Penn": "Pennsylvania",
-    "Penn St.": "Penn State",
-    "Portland St.": "Portland State",
-    "Queens": "Queens University",
-    "Sacramento St.": "Sacramento State",
-    "Saint Francis": "St. Francis (PA)",
-    "Sam Houston St.": "Sam Houston",
-    "San Diego St.": "San Diego State",
-    "San Jose St.": "San Jos\u00e9 State",
-    "Seattle": "Seattle U",
-    "South Carolina St.": "South Carolina State",
-    "South Dakota St.": "South Dakota State",
-    "Southeast Missouri St.": "Southeast Missouri State",
-    "Southeastern Louisiana": "SE Louisiana",
-    "St. Thomas": "St. Thomas-Minnesota",
-    "Tarleton St.": "Tarleton State",
-    "Tennessee Martin": "UT Martin",
-    "Tennessee St.": "Tennessee State",
-    "Texas A&M Corpus Chris": "Texas A&M-Corpus Christi",
-    "Texas St.": "Texas State",
-    "UMKC": "Kansas City",
-    "USC Upstate": "South Carolina Upstate",
-    "Utah St.": "Utah State",
-    "Washington St.": "Washington State",
-    "Weber St.": "Weber State",
-    "Wichita St.": "Wichita State",
-    "Wright St.": "Wright State",
-    "Youngstown St.": "Youngstown State",
-}
+# --- S3 reading (cached locally, see bball.data.s3_lines) ---
+
+from bball.data.best_lines import BestLinesTable
+from bball.data.line_matching import LineMatcher
+from bball.data.s3_lines import S3LinesCache
+
+# --- Team name mapping: local name -> S3 name (shared alias table) ---
+
+from bball.data.team_aliases import S3_ALIASES as LOCAL_TO_S3
+from bball.data.teams import S3 as S3_SOURCE, registry as team_registry
 
 # Reverse mapping for S3 -> local
 S3_TO_LOCAL = {v: k for k, v in LOCAL_TO_S3.items()}
 
 
 def to_s3_name(local_name: str) -> str:
-    return LOCAL_TO_S3.get(local_name, local_name)
+    return team_registry().to_source(local_name, S3_SOURCE)
 
 
 # --- Edge computation helpers (from bball.cli) ---
@@ -177,107 +76,18 @@ def prob_to_american(prob):
 
 # --- S3 reading ---
 
-def _s3_client():
-    return boto3.client("s3", region_name=S3_REGION)
+_S3_CACHE = S3LinesCache()
+_BEST_LINES = BestLinesTable(_S3_CACHE)
 
 
 def _read_s3_lines(season: int) -> pd.DataFrame:
-    """Read fct_lines from S3 for a given season."""
-    prefix = f"{SILVER_PREFIX}/{TABLE_FCT_LINES}/season={season}/"
-    client = _s3_client()
-
-    # Check for asof= sub-partitions first
-    resp = client.list_objects_v2(Bucket=S3_BUCKET, Prefix=prefix, Delimiter="/")
-    sub_prefixes = [p["Prefix"] for p in resp.get("CommonPrefixes", [])]
-    asof_prefixes = sorted([p for p in sub_prefixes if "asof=" in p], reverse=True)
-
-    scan_prefix = asof_prefixes[0] if asof_prefixes else prefix
-
-    # List parquet files
-    keys = []
-    paginator = client.get_paginator("list_objects_v2")
-    for page in paginator.paginate(Bucket=S3_BUCKET, Prefix=scan_prefix):
-        for obj in page.get("Contents", []):
-            if obj["Key"].endswith(".parquet"):
-                keys.append(obj["Key"])
-
-    if not keys:
-        return pd.DataFrame()
-
-    # Read and concat
-    dfs = []
-    for key in keys:
-        resp = client.get_object(Bucket=S3_BUCKET, Key=key)
-        data = resp["Body"].read()
-        tbl = pq.read_table(io.BytesIO(data))
-        dfs.append(tbl.to_pandas())
-
-    return pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
-
-
-def _dedup_lines(lines_df: pd.DataFrame) -> pd.DataFrame:
-    """Deduplicate lines: prefer complete data, then DK > ESPN BET > Bovada.
-    Fix spread sign via majority vote."""
-    lines_df = lines_df.copy()
-    lines_df["spread"] = pd.to_numeric(lines_df["spread"], errors="coerce")
-    lines_df["homeMoneyline"] = pd.to_numeric(lines_df["homeMoneyline"], errors="coerce")
-
-    # Spread sign fix: majority vote
-    has_spread = lines_df["spread"].notna() & (lines_df["spread"] != 0)
-    spread_sign = np.sign(lines_df.loc[has_spread, "spread"])
-    majority_sign = (
-        spread_sign.groupby(lines_df.loc[has_spread, "gameId"])
-        .sum()
-        .rename("_majority_sign")
-    )
+    """Read fct_lines for a given season; only new/changed objects are downloaded."""
+    return _S3_CACHE.read(season)
 
-    dedup = (
-        lines_df
-        .assign(
-            _has_spread=lines_df["spread"].notna().astype(int),
-            _has_total=lines_df["overUnder"].notna().astype(int),
-            _prov_rank=lines_df["provider"].map(PROVIDER_RANK).fillna(99),
-        )
-        .sort_values(
-            ["_has_spread", "_has_total", "_prov_rank"],
-            ascending=[False, False, True],
-        )
-        .drop_duplicates(subset=["gameId"], keep="first")
-        .drop(columns=["_has_spread", "_has_total", "_prov_rank"])
-        .copy()
-    )
 
-    # Apply majority sign flip
-    dedup = dedup.merge(majority_sign, on="gameId", how="left")
-    _sp = dedup["spread"]
-    _maj = dedup["_majority_sign"]
-    mask = (
-        _sp.notna() & _maj.notna() & (_maj != 0)
-        & (abs(_sp) >= 3)
-        & (np.sign(_sp) != np.sign(_maj))
-    )
-    dedup.loc[mask, "spread"] = -_sp[mask]
-
-    # Moneyline cross-check for single-provider games
-    _sp2 = dedup["spread"]
-    _ml = dedup["homeMoneyline"]
-    mask_ml = (
-        _sp2.notna() & _ml.notna()
-        & (~mask)
-        & dedup["_majority_sign"].isna()
-        & (((_sp2 > 3) & (_ml < -150)) | ((_sp2 < -3) & (_ml > 150)))
-    )
-    dedup.loc[mask_ml, "spread"] = -_sp2[mask_ml]
-    dedup = dedup.drop(columns=["_majority_sign"])
-
-    # Extract date from startDate in Eastern Time (predictions use ET dates)
-    ts = pd.to_datetime(dedup["startDate"])
-    if ts.dt.tz is not None:
-        dedup["game_date"] = ts.dt.tz_convert("America/New_York").dt.strftime("%Y-%m-%d")
-    else:
-        dedup["game_date"] = ts.dt.tz_localize("UTC").dt.tz_convert("America/New_York").dt.strftime("%Y-%m-%d")
-
-    return dedup
+def _best_lines(season: int) -> pd.DataFrame:
+    """Materialised best line per gameId; only changed games are re-deduplicated."""
+    return _BEST_LINES.load(season)
 
 
 # --- Edge recomputation ---
@@ -402,22 +212,17 @@ def main() -> int:
 
     for season in sorted(files_by_season):
         print(f"\n  Season {season}: loading lines from S3...")
-        raw_lines = _read_s3_lines(season)
-        if raw_lines.empty:
+        lines = _best_lines(season)
+        if lines.empty:
             print(f"  Season {season}: no lines found, skipping")
             continue
-
-        lines = _dedup_lines(raw_lines)
+        print(f"  Re-deduplicated {_BEST_LINES.refreshed} changed games")
         print(f"  Got {len(lines)} deduplicated lines across {lines['game_date'].nunique()} dates")
 
-        # Build lookup: (s3_home, s3_away, date) -> line row
-        lines_lookup: dict[tuple[str, str, str], pd.Series] = {}
-        for _, row in lines.iterrows():
-            key = (str(row.get("homeTeam", "")), str(row.get("awayTeam", "")), str(row.get("game_date", "")))
-            lines_lookup[key] = row
+        # Keyed once per season; each file is matched with two merges
+        matcher = LineMatcher(lines)
 
         for csv_path, date_value in files_by_season[season]:
-            date_str = date_value.strftime("%Y-%m-%d")
             df = pd.read_csv(csv_path)
             df = df.loc[:, ~df.columns.duplicated()]
 
@@ -444,70 +249,18 @@ def main() -> int:
             if cols_to_drop:
                 df = df.drop(columns=cols_to_drop)
 
-            # Build adjacent date strings for ±1 day fallback
-            _d = _dt.datetime.strptime(date_str, "%Y-%m-%d")
-            adjacent_dates = [
-                (_d + _dt.timedelta(days=delta)).strftime("%Y-%m-%d")
-                for delta in [-1, 1]
-            ]
-
             # Match lines by team name with fallbacks:
             # 1. Exact (home, away, date)
             # 2. Flipped (away, home, date) — negate spread
             # 3. Exact on ±1 day
             # 4. Flipped on ±1 day — negate spread
-            spreads = []
-            spread_odds_home = []
-            spread_odds_away = []
-            for _, row in df.iterrows():
-                away_local = row.get("away_team_name", "")
-                home_local = row.get("home_team_name", "")
-                away_s3 = to_s3_name(away_local)
-                home_s3 = to_s3_name(home_local)
-
-                matched_line = None
-                flipped = False
-
-                # Try exact match on same date
-                line = lines_lookup.get((home_s3, away_s3, date_str))
-                if line is not None and pd.notna(line.get("spread")):
-                    matched_line = line
-                else:
-                    # Try flipped home/away on same date
-                    line = lines_lookup.get((away_s3, home_s3, date_str))
-                    if line is not None and pd.notna(line.get("spread")):
-                        matched_line = line
-                        flipped = True
-                    else:
-                        # Try ±1 day
-                        for adj_date in adjacent_dates:
-                            line = lines_lookup.get((home_s3, away_s3, adj_date))
-                            if line is not None and pd.notna(line.get("spread")):
-                                matched_line = line
-                                break
-                            line = lines_lookup.get((away_s3, home_s3, adj_date))
-                            if line is not None and pd.notna(line.get("spread")):
-                                matched_line = line
-                                flipped = True
-                                break
-
-                if matched_line is not None:
-                    sp = float(matched_line["spread"])
-                    # If home/away flipped, negate the spread
-                    if flipped:
-                        sp = -sp
-                    spreads.append(sp)
-                    spread_odds_home.append(-110.0)
-                    spread_odds_away.append(-110.0)
-                else:
-                    spreads.append(np.nan)
-                    spread_odds_home.append(np.nan)
-                    spread_odds_away.append(np.nan)
+            spreads = matcher.match(df, date_value)
+            spread_odds = np.where(np.isnan(spreads), np.nan, -110.0)
 
             df["home_spread_num"] = spreads
-            df["away_spread_num"] = [-s if pd.notna(s) else np.nan for s in spreads]
-            df["home_spread_odds"] = spread_odds_home
-            df["away_spread_odds"] = spread_odds_away
+            df["away_spread_num"] = -spreads
+            df["home_spread_odds"] = spread_odds
+            df["away_spread_odds"] = spread_odds
 
             df = _recompute_edges(df)
 
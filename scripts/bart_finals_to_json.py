@@ -10,6 +10,9 @@ from typing import Iterable
 
 import pandas as pd
 
+from bball.data.super_sked import load_super_sked, super_sked_path
+from bball.data.teams import drop_non_d1
+
 
 PREDICTIONS_JSON_DIRS = [
     Path("predictions") / "json",
@@ -100,11 +103,11 @@ def load_prediction_games_by_date(date_str: str) -> set[tuple[str, str]]:
 
 
 def iter_bart_rows(date_strs: Iterable[str]) -> pd.DataFrame:
-    bart_path = Path("bart_files") / "2026_super_sked.csv"
-    df = pd.read_csv(bart_path, header=None)
-    df[1] = pd.to_datetime(df[1], errors="coerce")
+    bart_path = super_sked_path(2026, "bart_files")
+    df = load_super_sked(bart_path).on_dates(date_strs)
+    df = drop_non_d1(df, away_col=8, home_col=14)
     df["date_str"] = df[1].dt.strftime("%Y-%m-%d")
-    return df[df["date_str"].isin(set(date_strs))]
+    return df
 
 
 def coerce_int(value) -> int | None:
@@ -0,0 +1,73 @@
+import hashlib
+import io
+
+import pandas as pd
+import pytest
+
+
+class FakeS3:
+    """Just enough of the boto3 S3 client, backed by a dict."""
+
+    def __init__(self, objects):
+        self.objects, self.gets = dict(objects), []
+
+    def list_objects_v2(self, Bucket, Prefix, Delimiter=None):
+        subs = {Prefix + k[len(Prefix):].split("/", 1)[0] + "/"
+                for k in self.objects if k.startswith(Prefix) and "/" in k[len(Prefix):]}
+        return {"CommonPrefixes": [{"Prefix": p} for p in sorted(subs)]}
+
+    def get_paginator(self, name):
+        fake = self
+
+        class _Pages:
+            def paginate(self, Bucket, Prefix):
+                yield {"Contents": [
+                    {"Key": k, "ETag": '"%s"' % hashlib.md5(v).hexdigest(), "Size": len(v)}
+                    for k, v in fake.objects.items() if k.startswith(Prefix)
+                ]}
+
+        return _Pages()
+
+    def get_object(self, Bucket, Key):
+        self.gets.append(Key)
+        return {"Body": io.BytesIO(self.objects[Key])}
+
+
+@pytest.fixture
+def fake_s3():
+    """The ``FakeS3`` class; call it with ``{key: bytes}``."""
+    return FakeS3
+
+
+@pytest.fixture
+def parquet_bytes():
+    def _parquet(rows):
+        buf = io.BytesIO()
+        pd.DataFrame(rows).to_parquet(buf, index=False)
+        return buf.getvalue()
+    return _parquet
+
+
+@pytest.fixture
+def lines_part():
+    def _part(asof, n):
+        return f"silver/fct_lines/season=2026/asof={asof}/part-{n}.parquet"
+    return _part
+
+
+@pytest.fixture
+def box_row():
+    """Builder for one ``boxscores`` row; keyword overrides replace columns."""
+    def _box_row(date, away, home, **overrides):
+        row = {"date": pd.Timestamp(date), "away_team_name": away, "home_team_name": home, "game_tempo": 70.0}
+        for side in ("away", "home"):
+            row.update({
+                f"{side}_team_pts": 70, f"{side}_assists": 12, f"{side}_blocks": 4,
+                f"{side}_def_reb": 25, f"{side}_off_reb": 10, f"{side}_tot_reb": 35,
+                f"{side}_made_3pts": 8, f"{side}_tot_3pts": 22, f"{side}_made_ft": 12,
+                f"{side}_tot_ft": 16, f"{side}_made_shots": 25, f"{side}_tot_shots": 60,
+                f"{side}_personal_fouls": 18, f"{side}_steals": 7, f"{side}_turnovers": 11,
+            })
+        row.update(overrides)
+        return row
+    return _box_row
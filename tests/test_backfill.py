@@ -0,0 +1,25 @@
+import datetime as dt
+
+import pandas as pd
+from bball.data.backfill import backfill_snapshots
+from bball.data.boxscores import BoxscoreIndex
+
+
+def test_sharded_backfill_matches_serial_in_order(box_row):
+    teams = ["Kansas", "Duke", "Baylor", "Houston"]
+    rows = []
+    for d in range(12):
+        away, home = teams[d % 4], teams[(d + 1) % 4]
+        rows.append(box_row(f"2025-11-{d + 1:02d}", away, home, home_team_pts=60 + d, away_steals=d % 5))
+    index = BoxscoreIndex(pd.DataFrame(rows))
+    start = dt.datetime(2025, 10, 2)
+    dates = [dt.datetime(2025, 11, 3) + dt.timedelta(days=i) for i in range(10)]
+    thresholds = [1] * 5 + [2] * 5
+
+    serial = list(backfill_snapshots(index, dates, thresholds, start, workers=1))
+    sharded = list(backfill_snapshots(index, dates, thresholds, start, workers=3))
+
+    assert [d for d, _ in sharded] == dates
+    for (_, a), (_, b) in zip(serial, sharded):
+        pd.testing.assert_frame_equal(a, b)
+    assert not serial[-1][1].empty
@@ -0,0 +1,65 @@
+import json
+
+import pandas as pd
+from bball.data.best_lines import BestLinesTable, dedup_lines
+from bball.data.s3_lines import S3LinesCache
+
+
+def _raw(game_ids, spreads, providers):
+    n = len(game_ids)
+    return {
+        "gameId": game_ids,
+        "homeTeam": ["Duke"] * n,
+        "awayTeam": ["Kansas"] * n,
+        "startDate": pd.to_datetime(["2026-01-10T23:00Z"] * n),
+        "spread": spreads,
+        "overUnder": [140.5] * n,
+        "homeMoneyline": [-150.0] * n,
+        "provider": providers,
+    }
+
+
+def test_only_changed_games_are_rededuplicated(tmp_path, monkeypatch, fake_s3, parquet_bytes, lines_part):
+    a = parquet_bytes(_raw([1, 1, 2], [-4.0, -3.5, 6.0], ["Bovada", "Draft Kings", "Bovada"]))
+    s3 = fake_s3({lines_part("2026-01-01", 0): a})
+    table = BestLinesTable(S3LinesCache(s3, tmp_path))
+
+    best = table.load(2026)
+    assert table.refreshed == 2
+    assert best.set_index("gameId")["spread"].to_dict() == {1: -3.5, 2: 6.0}
+    assert best["game_date"].tolist() == ["2026-01-10", "2026-01-10"]
+
+    # same snapshot: stored table, no dedup
+    calls = []
+    monkeypatch.setattr("bball.data.best_lines.dedup_lines", lambda df: calls.append(df) or dedup_lines(df))
+    assert table.load(2026).equals(best) and table.refreshed == 0 and not calls
+
+    # new snapshot: game 2 gets an ESPN BET line, game 3 is new, game 1 unchanged
+    b = parquet_bytes(_raw([2, 2, 3], [6.0, 5.5, -1.0], ["Bovada", "ESPN BET", "Bovada"]))
+    s3.objects = {lines_part("2026-01-02", 0): a, lines_part("2026-01-02", 1): b}
+    best = table.load(2026, start="2026-01-10", end="2026-01-11")
+    assert table.refreshed == 2 and sorted(calls[0]["gameId"].unique()) == [2, 3]
+    assert best.set_index("gameId")["spread"].to_dict() == {1: -3.5, 2: 5.5, 3: -1.0}
+    meta = json.loads((tmp_path / "season=2026" / "best_lines.json").read_text())
+    assert meta["asof"] == "2026-01-02" and meta["games"] == 3
+    assert table.load(2026, start="2026-01-11").empty
+
+
+def test_concurrent_loads_share_one_cold_season(tmp_path, fake_s3, parquet_bytes, lines_part):
+    from concurrent.futures import ThreadPoolExecutor
+
+    parts = {
+        lines_part("2026-01-01", i): parquet_bytes(_raw([i], [-2.0 - i], ["Bovada"]))
+        for i in range(6)
+    }
+    s3 = fake_s3(parts)
+
+    def _load(_):
+        # a fresh table + cache per call, as attach_s3_lines does
+        return BestLinesTable(S3LinesCache(s3, tmp_path)).load(2026)
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        results = list(pool.map(_load, range(12)))
+    assert all(len(r) == 6 for r in results)
+    objects = list((tmp_path / "season=2026" / "objects").iterdir())
+    assert len(objects) == 6 and not any(p.suffix == ".tmp" for p in objects)
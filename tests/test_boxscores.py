@@ -0,0 +1,40 @@
+import pandas as pd
+from bball.data.boxscores import BoxscoreIndex, load_boxscores
+from bball.data.team_games import BOX_SCORE_COLUMNS
+
+
+class _Cursor:
+    def __init__(self, rows):
+        self.rows, self.executed = rows, []
+
+    def execute(self, sql, params):
+        self.executed.append((sql, params))
+
+    def fetchall(self):
+        return self.rows
+
+
+def test_load_boxscores_projects_and_pushes_down_dates(box_row):
+    row = box_row("2026-01-01", "Duke", "Kansas")
+    cur = _Cursor([tuple(row[c] for c in BOX_SCORE_COLUMNS)])
+    df = load_boxscores(cur, "2025-10-02", "2026-04-15")
+    sql, params = cur.executed[0]
+    assert "select *" not in sql.lower() and "`home_steals`" in sql
+    assert params == ("2025-10-02", "2026-04-15")
+    assert list(df.columns) == BOX_SCORE_COLUMNS and len(df) == 1
+
+
+def test_index_slices_by_date_and_team(box_row):
+    box = pd.DataFrame([
+        box_row("2026-01-03", "Kansas", "Duke"),
+        box_row("2026-01-01", "Duke", "Kansas"),
+        box_row("2026-01-02", "Baylor", "Kansas"),
+    ])
+    idx = BoxscoreIndex(box)
+    assert len(idx) == 3
+    assert list(idx.games_between("2026-01-02", "2026-01-03")["away_team_name"]) == ["Baylor"]
+    assert len(idx.log_between(None, "2026-01-02")) == 2
+    assert idx.log_between("2026-01-04").empty
+    kansas = idx.team_log("Kansas", before="2026-01-03")
+    assert list(kansas["opp_team_name"]) == ["Duke", "Baylor"]
+    assert idx.team_log("Gonzaga").empty
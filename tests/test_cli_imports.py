@@ -0,0 +1,13 @@
+import subprocess
+import sys
+
+
+def test_cli_import_is_lazy_and_db_free():
+    code = (
+        "import sys, bball.cli, predict_games; "
+        "heavy = [m for m in ('torch', 'optuna', 'boto3', 'mysql.connector') if m in sys.modules]; "
+        "assert not heavy, heavy; "
+        "assert predict_games._pool is None"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
@@ -0,0 +1,68 @@
+import pandas as pd
+import torch
+from torch.utils.data import DataLoader
+from bball.data.dataset import BasketballDataset, TensorBatches, batch_loader
+
+
+def _dataset(n=10):
+    X = pd.DataFrame({"a": range(n), "b": [2 * i for i in range(n)]}, dtype=float)
+    return BasketballDataset(X, pd.Series(range(n), dtype=float))
+
+
+def test_tensor_batches_cover_every_row_once():
+    ds = _dataset()
+    batches = TensorBatches(ds, batch_size=4, generator=torch.Generator().manual_seed(0))
+    assert len(batches) == 3
+    seen = []
+    for xb, yb in batches:
+        assert xb.shape[1] == 2 and yb.shape[1] == 1 and len(xb) <= 4
+        assert torch.equal(xb[:, 0], yb.view(-1))  # rows stay paired
+        seen += yb.view(-1).tolist()
+    assert sorted(seen) == list(range(10)) and seen != list(range(10))
+
+    ordered = [yb.view(-1).tolist() for _, yb in TensorBatches(ds, 4, shuffle=False)]
+    assert ordered == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+def test_batch_loader_uses_dataloader_only_on_cuda():
+    ds = _dataset()
+    assert isinstance(batch_loader(ds, 4, True, torch.device("cpu"), num_workers=4), TensorBatches)
+    assert isinstance(batch_loader(ds, 4, True, torch.device("cuda"), num_workers=1), DataLoader)
+    assert isinstance(batch_loader(ds, 4, True, torch.device("cuda"), num_workers=0), TensorBatches)
+
+
+def test_home_away_flip_swaps_scaled_columns_per_batch():
+    import numpy as np
+    from sklearn.preprocessing import StandardScaler
+    from bball.data.augment import HomeAwayFlip, _build_swap_pairs
+
+    rng = np.random.default_rng(0)
+    raw = pd.DataFrame({
+        "home_adjoe": rng.normal(110, 5, 64),
+        "away_adjoe": rng.normal(100, 8, 64),
+        "home_opp_ft_rate": rng.normal(30, 2, 64),
+        "away_def_ft_rate": rng.normal(35, 4, 64),
+        "neutral_site": rng.integers(0, 2, 64).astype(float),
+    })
+    scaler = StandardScaler().fit(raw)
+    order = list(raw.columns)
+    X = torch.from_numpy(scaler.transform(raw).astype("float32"))
+    y = torch.arange(64, dtype=torch.float32).view(-1, 1)
+
+    # flipping every row == standardising the swapped raw frame
+    swapped = raw.copy()
+    for a, b in _build_swap_pairs(order):
+        swapped[[a, b]] = raw[[b, a]].to_numpy()
+    Xf, yf = HomeAwayFlip(order, scaler, flip_frac=1.0)(X, y)
+    np.testing.assert_allclose(Xf.numpy(), scaler.transform(swapped), atol=1e-4)
+    assert torch.equal(yf, -y)
+    _, yc = HomeAwayFlip(order, scaler, flip_frac=1.0, target="cls")(X, torch.ones(64, 1))
+    assert torch.equal(yc, torch.zeros(64, 1))
+
+    # a fresh mask every epoch
+    ds = BasketballDataset(pd.DataFrame(X.numpy(), columns=order), pd.Series(y.view(-1).numpy()))
+    batches = TensorBatches(ds, batch_size=64, shuffle=False, transform=HomeAwayFlip(order, scaler))
+    (_, y1), = list(batches)
+    (_, y2), = list(batches)
+    assert not torch.equal(y1 < 0, y2 < 0)
+    assert torch.equal(y1.abs(), y)
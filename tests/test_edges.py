@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+from bball.evaluation.edges import line_diffs, moneyline_diff
+
+
+def _row_diff(book, model):
+    # the original per-row branches from predict_games.get_diffs
+    if pd.isna(book) or pd.isna(model):
+        return np.nan
+    if book > 0 and model < 0:
+        return (book - 100) + (100 + model)
+    if book < 0 and model > 0:
+        return (book + 100) + (model - 100)
+    return book - model
+
+
+def test_moneyline_diff_matches_row_branches():
+    book = [150, -150, 120, -200, np.nan, 0, 110]
+    model = [-130, 140, 105, -180, 120, -110, None]
+    expected = [_row_diff(b, m) for b, m in zip(book, model)]
+    np.testing.assert_array_equal(moneyline_diff(book, model), expected)
+
+
+def test_line_diffs_handles_missing_book_lines():
+    df = pd.DataFrame({
+        "spread_home": [-3.0, 2.0],
+        "home_spread_num": [-4.5, None],
+        "away_winner_odds": [160, None],
+        "away_win_odds": [140.0, 150.0],
+        "home_winner_odds": [-190, None],
+        "home_win_odds": [-140.0, -150.0],
+    }, index=[7, 9])
+    out = line_diffs(df)
+    assert list(out.columns) == ["spread_diff", "away_winner_diff", "home_winner_diff"]
+    assert list(out.index) == [7, 9]
+    assert out.loc[7].tolist() == [1.5, 20.0, -50.0]
+    assert out.loc[9].isna().all()
+    joined = pd.concat([df, out], axis=1)
+    assert len(joined) == 2 and joined.loc[7, "spread_diff"] == 1.5
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+from bball.data.feature_store import PointInTimeStore
+
+
+class _Cursor:
+    def __init__(self, tables):
+        self.tables, self.queries = tables, []
+
+    def execute(self, sql, params):
+        self.queries.append(sql)
+        self._table = next(t for t in self.tables if f"sports.{t}" in sql)
+
+    def fetchall(self):
+        return self.tables[self._table]
+
+
+def _daily():
+    return pd.DataFrame({
+        "team_name": ["Duke", "Duke", "Kansas", "Duke"],
+        "date": pd.to_datetime(["2026-01-01", "2026-01-05", "2026-01-03", "2026-01-03"]),
+        "adj_oe": [110.0, 115.0, 120.0, 112.0],
+        "adj_de": 95.0, "BARTHAG": 0.9, "adj_pace": 68.0,
+    })
+
+
+def test_as_of_returns_latest_row_on_or_before_date():
+    store = PointInTimeStore({"daily_data": _daily()})
+    out = store.as_of("daily_data", ["Duke", "Kansas", "Gonzaga"], "2026-01-03")
+    assert list(out.index) == ["Duke", "Kansas"]
+    assert out.loc["Duke", "adj_oe"] == 112.0 and out.loc["Kansas", "adj_oe"] == 120.0
+    assert store.as_of("daily_data", ["Kansas"], "2026-01-02").empty
+    assert store.as_of("daily_data", ["Duke"], "2026-02-01").loc["Duke", "adj_oe"] == 115.0
+
+
+def test_load_issues_one_query_per_table():
+    empty_off = pd.DataFrame(columns=["TeamName", "Date", "eff_fg_pct", "ft_pct", "ft_rate", "3pt_rate",
+                                      "3p_pct", "off_rebound_pct", "def_rebound_pct"])
+    empty_def = pd.DataFrame(columns=["TeamName", "Date", "def_eff_fg_pct", "def_ft_rate", "def_3pt_rate",
+                                      "def_3p_pct", "def_off_rebound_pct", "def_def_rebound_pct"])
+    cur = _Cursor({
+        "daily_data": _daily().values.tolist(),
+        "sub_offensive_averages": empty_off.values.tolist(),
+        "sub_defensive_averages": empty_def.values.tolist(),
+    })
+    store = PointInTimeStore.load(cur, "2026-01-01", "2026-01-31")
+    assert len(cur.queries) == 3
+    latest = store.latest(["Duke"], "2026-01-04")
+    assert np.isclose(latest["daily_data"].loc["Duke", "adj_oe"], 112.0)
+    assert latest["sub_offensive_averages"].empty
@@ -0,0 +1,61 @@
+import datetime as dt
+
+import pandas as pd
+from bball.data.hard_rock_lines import hard_rock_lines_for_slate, resolve_hard_rock_lines
+
+FIELDS = ["Time", "away_team_name", "home_team_name",
+          "away_spread_num", "away_spread_odds", "home_spread_num", "home_spread_odds",
+          "over_total_num", "over_total_odds", "under_total_num", "under_total_odds",
+          "away_winner_odds", "home_winner_odds"]
+
+
+class _Cursor:
+    def __init__(self, rows):
+        self.rows, self.executed = rows, []
+        self.description = [(f,) for f in FIELDS]
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+
+    def fetchall(self):
+        return self.rows
+
+
+def _row(time, away, home, away_sp, away_ml):
+    return (time, away, home, away_sp, -110, -away_sp, -110, 140.5, -110, 140.5, -110, away_ml, -away_ml)
+
+
+def test_one_query_resolves_exact_earlier_and_flipped():
+    t0, t1 = dt.datetime(2026, 1, 10, 9), dt.datetime(2026, 1, 10, 15)
+    cur = _Cursor([
+        _row(t0, "Duke", "Kansas", 3.5, 150),
+        _row(t1, "Duke", "Kansas", 2.5, 130),           # exact at latest wins
+        _row(t0, "Gonzaga", "Baylor", -4.0, -180),      # only an earlier scrape
+        _row(t1, "Houston", "Auburn", 1.5, 105),        # listed flipped
+        _row(t1, "UT Martin", "Iowa", 7.0, 250),         # Hard Rock spelling
+    ])
+    games = pd.DataFrame({
+        "away_team_name": ["Duke", "Gonzaga", "Auburn", "Tennessee Martin", "Nobody"],
+        "home_team_name": ["Kansas", "Baylor", "Houston", "Iowa", "Else"],
+    })
+    out = hard_rock_lines_for_slate(cur, games, dt.date(2026, 1, 10))
+    assert len(cur.executed) == 1
+    assert list(out.columns) == FIELDS[3:]
+    assert list(out["away_spread_num"][:3]) == [2.5, -4.0, -1.5]
+    assert list(out["away_winner_odds"][:3]) == [130, -180, -105]
+    assert out.loc[3, "home_spread_num"] == -7.0
+    assert out.loc[4].isna().all()
+
+
+def test_earlier_exact_beats_flipped_latest():
+    latest, earlier = pd.Timestamp("2026-01-10 15:00"), pd.Timestamp("2026-01-10 12:00")
+    rows = pd.DataFrame([
+        _row(earlier, "Duke", "Kansas", 3.0, 140),
+        _row(latest, "Kansas", "Duke", 9.0, -400),
+        _row(pd.Timestamp("2026-01-09 12:00"), "Duke", "Kansas", 1.0, 100),  # before lower
+    ], columns=FIELDS)
+    games = pd.DataFrame({"away_team_name": ["Duke"], "home_team_name": ["Kansas"]})
+    out = resolve_hard_rock_lines(rows, games, latest, pd.Timestamp("2026-01-10"))
+    assert out.loc[0, "away_spread_num"] == 3.0
+    out = resolve_hard_rock_lines(rows.iloc[1:], games, latest, pd.Timestamp("2026-01-10"))
+    assert out.loc[0, "away_spread_num"] == -9.0 and out.loc[0, "home_winner_odds"] == -400
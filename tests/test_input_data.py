@@ -0,0 +1,53 @@
+import pytest
+import pandas as pd
+from sqlalchemy import Column, Float, MetaData, String, Table
+from sqlalchemy.dialects import mysql
+
+import input_data
+
+
+class _Conn:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, stmt):
+        self.statements.append(stmt)
+        return type("Result", (), {"rowcount": 2})()
+
+
+def test_upsert_rows_is_one_multi_row_on_duplicate_key_update():
+    table = Table("offensive_averages", MetaData(), Column("TeamName", String(64)), Column("ppp", Float))
+    pd_table = type("PdTable", (), {"table": table})()
+    conn = _Conn()
+    n = input_data._upsert_rows(pd_table, conn, ["TeamName", "ppp"], iter([("Duke", 1.1), ("Kansas", 1.0)]))
+    sql = str(conn.statements[0].compile(dialect=mysql.dialect()))
+    assert n == 2 and len(conn.statements) == 1
+    assert "ON DUPLICATE KEY UPDATE" in sql and sql.count("%s") == 4
+
+
+def test_empty_frames_skip_the_database(monkeypatch):
+    monkeypatch.setattr(input_data, "get_engine", lambda **kw: (_ for _ in ()).throw(AssertionError))
+    assert input_data.input_data(pd.DataFrame(), "daily_data")
+
+
+def test_failed_writes_raise_instead_of_returning_false(monkeypatch):
+    def _boom(**kw):
+        raise OSError("server gone")
+
+    monkeypatch.setattr(input_data, "get_engine", _boom)
+    with pytest.raises(input_data.WriteError, match="2 rows to daily_data"):
+        input_data.input_data(pd.DataFrame({"a": [1, 2]}), "daily_data")
+
+
+def test_upserts_require_a_unique_key_on_the_written_columns(monkeypatch):
+    monkeypatch.setattr(input_data, "_CHECKED_KEYS", set())
+    keys = {"tot_boxscores": [("id",)], "offensive_averages": [("Date", "TeamName")]}
+    monkeypatch.setattr(input_data, "_unique_keys", lambda table: keys[table])
+    monkeypatch.setattr(input_data.pd.DataFrame, "to_sql", lambda self, *a, **kw: None)
+    monkeypatch.setattr(input_data, "get_engine", lambda **kw: None)
+
+    games = pd.DataFrame({"date": ["2026-01-10"], "away_team_name": ["Duke"], "home_team_name": ["Kansas"]})
+    with pytest.raises(input_data.WriteError, match="UNIQUE \\(date, away_team_name, home_team_name\\)"):
+        input_data.write_frame(games, "tot_boxscores", upsert=True)
+    avgs = pd.DataFrame({"Date": ["2026-01-10"], "TeamName": ["Duke"], "ppp": [1.1]})
+    assert input_data.write_frame(avgs, "offensive_averages", upsert=True)
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+from bball.data.line_matching import LineMatcher, match_spreads
+
+
+def _lines(rows):
+    return pd.DataFrame(rows, columns=["homeTeam", "awayTeam", "game_date", "spread"])
+
+
+def test_cascade_priority_and_sign_flip():
+    lines = _lines([
+        ("UAlbany", "Wichita State", "2026-01-10", -3.5),   # exact, S3 spellings
+        ("Duke", "Kansas", "2026-01-10", 2.0),               # flipped
+        ("Baylor", "Gonzaga", "2026-01-09", 4.0),            # exact, day before
+        ("Gonzaga", "Baylor", "2026-01-10", 6.0),            # flipped same day beats it
+        ("Houston", "Auburn", "2026-01-11", -1.0),           # day after
+        ("Iowa", "Purdue", "2026-01-12", 9.0),               # too far
+    ])
+    games = pd.DataFrame({
+        "away_team_name": ["Wichita St.", "Duke", "Gonzaga", "Auburn", "Purdue"],
+        "home_team_name": ["Albany", "Kansas", "Baylor", "Houston", "Iowa"],
+    })
+    out = match_spreads(games, lines, "2026-01-10")
+    np.testing.assert_array_equal(out, [-3.5, -2.0, -6.0, -1.0, np.nan])
+
+
+def test_last_duplicate_wins_and_missing_spread_is_absent():
+    lines = _lines([
+        ("Duke", "Kansas", "2026-01-10", 1.0),
+        ("Duke", "Kansas", "2026-01-10", None),   # last row for the key, no spread
+        ("Kansas", "Duke", "2026-01-10", 3.0),
+    ])
+    games = pd.DataFrame({
+        "away_team_name": ["Kansas", "Kansas"],
+        "home_team_name": ["Duke", "Duke"],
+        "game_date": ["2026-01-10", "2026-01-11"],
+    })
+    out = LineMatcher(lines).match(games)
+    np.testing.assert_array_equal(out, [-3.0, -3.0])
+
+
+def test_similar_names_keep_their_own_lines():
+    lines = _lines([
+        ("Northwestern", "Iowa", "2026-01-10", -3.5),
+        ("Northeastern", "Hofstra", "2026-01-10", 2.5),
+    ])
+    games = pd.DataFrame({
+        "away_team_name": ["Iowa", "Hofstra"],
+        "home_team_name": ["Northwestern", "Northeastern"],
+    })
+    np.testing.assert_array_equal(match_spreads(games, lines, "2026-01-10"), [-3.5, 2.5])
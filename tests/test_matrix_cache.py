@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+from bball.data.dataset import BasketballDataset
+from bball.data.matrix_cache import TrainingMatrixCache, fit_scaler, float32_matrix, matrix_fingerprint
+
+
+def _frame(n=50, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(rng.normal(size=(n, 3)) * [1, 10, 100], columns=["a", "b", "c"])
+
+
+def test_matrix_is_scaled_once_and_mapped(tmp_path):
+    X = _frame()
+    order = ["c", "a", "b"]
+    scaler = StandardScaler().fit(X[order])
+    cache = TrainingMatrixCache(tmp_path)
+
+    mm = cache.matrix(X, order, scaler)
+    assert isinstance(mm, np.memmap) and mm.dtype == np.float32 and not mm.flags.writeable
+    np.testing.assert_allclose(mm, scaler.transform(X[order]), rtol=1e-5, atol=1e-5)
+    assert len(cache.built) == 1
+
+    # new process: same inputs map the existing file instead of rebuilding
+    again = TrainingMatrixCache(tmp_path)
+    frame = again.frame(X, order, scaler)
+    assert again.built == [] and list(frame.columns) == order
+    ds = BasketballDataset(frame, pd.Series(np.zeros(len(X))))
+    assert np.shares_memory(ds.X.numpy(), frame.values)
+
+
+def test_fingerprint_tracks_rows_order_and_scaler():
+    X = _frame()
+    base = matrix_fingerprint(X, ["a", "b", "c"])
+    assert base == matrix_fingerprint(X.copy(), ["a", "b", "c"])
+    assert base != matrix_fingerprint(X, ["b", "a", "c"])
+    assert base != matrix_fingerprint(X.iloc[:-1], ["a", "b", "c"])
+    assert base != matrix_fingerprint(X, ["a", "b", "c"], StandardScaler().fit(X))
+
+
+def test_chunked_scaler_and_mixed_dtype_matrix():
+    X = _frame(n=101).astype("float32").assign(flag=np.arange(101, dtype="int8") % 2)
+    full = StandardScaler().fit(X)
+    chunked = fit_scaler(X, chunk_rows=16)
+    np.testing.assert_allclose(chunked.mean_, full.mean_, rtol=1e-5)
+    np.testing.assert_allclose(chunked.scale_, full.scale_, rtol=1e-5)
+
+    M = float32_matrix(X, ["flag", "a", "missing"])
+    assert M.dtype == np.float32 and M.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(M[:, 0], X["flag"].to_numpy())
+    assert np.isnan(M[:, 2]).all()
+
+
+def test_cache_keeps_only_recent_matrices(tmp_path):
+    import os
+
+    order = ["a", "b", "c"]
+    old = TrainingMatrixCache(tmp_path, keep=2)
+    for seed in range(3):
+        old.matrix(_frame(seed=seed), order)
+    # one process maps all three, so nothing it uses is removed
+    assert len(list(tmp_path.glob("*.npy"))) == 3
+    for i, path in enumerate(sorted(tmp_path.glob("*.npy"), key=lambda p: p.stat().st_mtime)):
+        os.utime(path, (1_000_000 + i, 1_000_000 + i))
+
+    # a later run (new snapshot) writes a new matrix: only the 2 newest stay
+    run = TrainingMatrixCache(tmp_path, keep=2)
+    run.matrix(_frame(seed=9), order)
+    kept = {p.stem for p in tmp_path.glob("*.npy")}
+    assert len(kept) == 2 and run.built[0] in kept
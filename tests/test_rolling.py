@@ -0,0 +1,111 @@
+import math
+from statistics import mean, stdev
+
+import numpy as np
+import pandas as pd
+from bball.data.rolling import RollingStatEngine, decayed_moments, required_aggregates
+
+
+def _legacy_decreasing(values, games):
+    # mirrors more_stats.get_avg_decreased_games / get_stdev_decreased_games
+    j, weights = 1.0, []
+    for _ in range(games, len(values)):
+        j -= 0.05
+        weights.append(max(j, 0))
+    weights = (weights + [1] * games)[: len(values)]
+    avg = np.average(values, weights=weights)
+    return avg, math.sqrt(np.average((values - avg) ** 2, weights=weights))
+
+
+def _log(n_games, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "date": pd.date_range("2025-11-03", periods=n_games),
+        "team_name": "Kansas",
+        "is_home": rng.integers(0, 2, n_games),
+        "ppp": rng.normal(1.05, 0.1, n_games),
+        "tempo": rng.normal(68, 4, n_games),
+    })
+
+
+def test_engine_matches_full_recompute():
+    log = _log(27)
+    engine = RollingStatEngine(["ppp", "tempo"], windows=(3, 10), decay_windows=(5, 15))
+    # feed one game at a time, as the nightly job does
+    for i in range(len(log)):
+        engine.update(log.iloc[[i]])
+    row = engine.snapshot(["Kansas"], "2026-01-01").iloc[0]
+
+    ppp = log["ppp"].to_numpy()
+    assert np.isclose(row["full_season_avg_ppp_avg"], mean(ppp))
+    assert np.isclose(row["full_season_stdev_ppp_std"], stdev(ppp))
+    assert np.isclose(row["three_game_avg_ppp_3_games_avg"], mean(ppp[-3:]))
+    assert np.isclose(row["ten_game_std_devs_ppp_std"], stdev(ppp[-10:]))
+    for g, word in ((5, "five"), (15, "fifteen")):
+        avg, std = _legacy_decreasing(ppp, g)
+        assert np.isclose(row[f"{word}_game_decreasing_avg_ppp_avg"], avg)
+        assert np.isclose(row[f"{word}_game_decreasing_std_ppp_std"], std)
+
+
+def test_eligibility_and_untouched_teams():
+    log = _log(4)
+    engine = RollingStatEngine(["ppp"], windows=(3,), decay_windows=(5,))
+    engine.update(log)
+    n_home = int(log["is_home"].sum())
+    expected = ["Kansas"] if max(n_home, 4 - n_home) > 2 else []
+    assert engine.eligible_teams(2) == expected
+    assert engine.update(log.iloc[:0]) == []
+    assert engine.snapshot(["Duke"]).empty
+
+
+def test_decayed_moments_matches_legacy_for_every_prefix():
+    values = _log(30, seed=3)[["ppp", "tempo"]].to_numpy()
+    windows = (3, 5, 7, 10, 12, 15, 20)
+    avg, std = decayed_moments(values, windows)
+    assert avg.shape == std.shape == (len(windows), 30, 2)
+    for w, g in enumerate(windows):
+        for k in (1, g, 29):
+            for s in range(2):
+                exp_avg, exp_std = _legacy_decreasing(values[:k + 1, s], g)
+                assert np.isclose(avg[w, k, s], exp_avg)
+                assert np.isclose(std[w, k, s], exp_std)
+    last_avg, _ = decayed_moments(values, windows, last_only=True)
+    assert np.allclose(last_avg[:, 0], avg[:, -1])
+
+
+def test_required_aggregates_from_feature_order():
+    feats = ["away_eff_fg_pct", "home_def_3p_pct", "away_adj_oe",
+             "home_three_game_avg_tempo_3_games_avg", "spread_home"]
+    specs = required_aggregates(feats, include_sub_tables=False)
+    assert specs == {
+        ("decay", 15, "avg", "eff_fg_pct"),
+        ("decay", 15, "avg", "opp_3p_pct"),
+        ("window", 3, "avg", "tempo"),
+    }
+    assert len(required_aggregates()) == 13
+
+
+def test_restricted_engine_matches_full_engine():
+    log = _log(20, seed=5)
+    specs = {("decay", 15, "avg", "ppp"), ("window", 3, "std", "tempo"), ("full_season", None, "avg", "tempo")}
+    small = RollingStatEngine.for_aggregates(specs)
+    full = RollingStatEngine(["ppp", "tempo"], windows=(3,), decay_windows=(15,))
+    small.update(log)
+    full.update(log)
+    a = small.snapshot(["Kansas"]).iloc[0]
+    b = full.snapshot(["Kansas"]).iloc[0]
+    assert len(small.columns) == 3
+    for col in small.columns:
+        assert np.isclose(a[col], b[col])
+
+
+def test_full_layout_nulls_the_skipped_aggregates():
+    from bball.data.rolling import full_layout
+
+    small = RollingStatEngine.for_aggregates({("window", 3, "avg", "tempo")})
+    small.update(_log(5))
+    snap = full_layout(small.snapshot(["Kansas"], date="2026-01-10"))
+    assert list(snap.columns[:2]) == ["Date", "TeamName"]
+    assert list(snap.columns[2:]) == RollingStatEngine().columns
+    assert snap[small.columns].notna().all(axis=None)
+    assert snap.drop(columns=["Date", "TeamName", *small.columns]).isna().all(axis=None)
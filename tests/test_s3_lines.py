@@ -0,0 +1,52 @@
+import pandas as pd
+from bball.data.s3_lines import S3LinesCache, list_season_objects
+
+
+def test_newest_asof_snapshot_is_listed(fake_s3, lines_part):
+    s3 = fake_s3({lines_part("2026-01-01", 0): b"old", lines_part("2026-01-02", 0): b"new"})
+    objs = list_season_objects(s3, 2026)
+    assert [o["key"] for o in objs] == [lines_part("2026-01-02", 0)]
+    assert objs[0]["size"] == 3 and '"' not in objs[0]["etag"]
+
+
+def test_cache_only_transfers_new_objects(tmp_path, fake_s3, parquet_bytes, lines_part):
+    a = parquet_bytes({"gameId": [1, 2], "spread": [-3.5, 2.0]})
+    b = parquet_bytes({"gameId": [3], "spread": [7.0]})
+    s3 = fake_s3({lines_part("2026-01-01", 0): a})
+    cache = S3LinesCache(s3, tmp_path)
+    assert list(cache.read(2026).gameId) == [1, 2]
+    assert len(s3.gets) == 1
+
+    # unchanged listing: served from the consolidated Arrow file
+    assert list(S3LinesCache(s3, tmp_path).read(2026).gameId) == [1, 2]
+    assert len(s3.gets) == 1
+
+    # new snapshot re-publishes part-0 unchanged and adds part-1
+    s3.objects = {lines_part("2026-01-02", 0): a, lines_part("2026-01-02", 1): b}
+    out = S3LinesCache(s3, tmp_path).read(2026)
+    assert list(out.gameId) == [1, 2, 3]
+    assert s3.gets[1:] == [lines_part("2026-01-02", 1)]
+    assert len(list((tmp_path / "season=2026" / "objects").iterdir())) == 2
+
+
+def test_read_projects_columns_and_filters_window(tmp_path, fake_s3, parquet_bytes, lines_part):
+    rows = {
+        "gameId": [1, 2, 3],
+        "startDate": pd.to_datetime(
+            ["2026-01-09T23:00Z", "2026-01-10T18:00Z", "2026-01-12T01:00Z"]),
+        "spread": [1.0, 2.0, 3.0],
+        "provider": ["Bovada"] * 3,
+        "lineMovement": ["x"] * 3,
+    }
+    other = dict(rows, gameId=[4, 5, 6])
+    s3 = fake_s3({lines_part("2026-01-02", 0): parquet_bytes(rows), lines_part("2026-01-02", 1): parquet_bytes(other)})
+    cache = S3LinesCache(s3, tmp_path, max_workers=2)
+    out = cache.read(2026, start="2026-01-10", end="2026-01-12")
+    assert sorted(s3.gets) == [lines_part("2026-01-02", 0), lines_part("2026-01-02", 1)]
+    assert "lineMovement" not in out.columns and "homeTeam" not in out.columns
+    assert list(out.gameId) == [2, 5]
+
+    as_text = dict(rows, startDate=["2026-01-09T23:00:00Z", "2026-01-10T18:00:00Z", "2026-01-12T01:00:00Z"])
+    s3.objects = {lines_part("2026-01-03", 0): parquet_bytes(as_text)}
+    out = cache.read(2026, columns=None, start="2026-01-10", end="2026-01-12")
+    assert list(out.gameId) == [2] and "lineMovement" in out.columns
@@ -0,0 +1,38 @@
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+import predict_games
+from predict_games import SlateDate, get_games_for_today
+
+
+def _write_sked(path):
+    rows = []
+    for date, away, home, div in [
+        ("2026-01-10 19:00", "Duke", "Kansas", 1),
+        ("2026-01-10 21:00", "Gonzaga", "Baylor", 99),
+        ("2026-01-11 18:00", "Houston", "Auburn", 1),
+    ]:
+        row = [""] * 15
+        row[1], row[6], row[7], row[8], row[14] = date, div, 0, away, home
+        rows.append(row)
+    pd.DataFrame(rows).to_csv(path / "2026_super_sked.csv", header=False, index=False)
+
+
+def test_slate_date_coerce():
+    assert SlateDate.coerce("2026-01-10").day == dt.date(2026, 1, 10)
+    s = SlateDate.coerce(dt.datetime(2026, 1, 10, 15))
+    assert SlateDate.coerce(s) is s
+    assert s.end - s.start == dt.timedelta(days=1)
+    assert not hasattr(predict_games, "CURR_YEAR")
+
+
+def test_games_for_different_dates_in_parallel(tmp_path):
+    _write_sked(tmp_path)
+    dates = ["2026-01-10", "2026-01-11"] * 4
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda d: get_games_for_today(2026, str(tmp_path), target_date=d), dates))
+    for date, games in zip(dates, results):
+        expected = ["Duke"] if date == "2026-01-10" else ["Houston"]
+        assert list(games.away_team_name) == expected
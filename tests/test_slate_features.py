@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+from bball.data.slate_features import AS_OF_SOURCES, assemble_slate_features, fetch_latest_as_of
+
+
+class _Cursor:
+    def __init__(self, rows):
+        self.rows, self.executed = rows, []
+
+    def execute(self, sql, params):
+        self.executed.append((sql, params))
+
+    def fetchall(self):
+        return self.rows
+
+
+def _latest(table, teams):
+    cols = AS_OF_SOURCES[table]["columns"]
+    return pd.DataFrame(
+        [[i * 10 + j for j in range(len(cols))] for i, _ in enumerate(teams)],
+        index=pd.Index(teams, name="team"), columns=cols,
+    )
+
+
+def test_one_windowed_query_per_table():
+    cur = _Cursor([("Duke", 110.0, 95.0, 0.9, 68.0)])
+    out = fetch_latest_as_of(cur, "daily_data", ["Kansas", "Duke", "Duke"], "2026-01-10")
+    sql, params = cur.executed[0]
+    assert len(cur.executed) == 1 and "ROW_NUMBER()" in sql
+    assert params == ("Duke", "Kansas", "2026-01-10")
+    assert out.loc["Duke", "BARTHAG"] == 0.9
+
+
+def test_assemble_matches_per_game_layout():
+    games = pd.DataFrame({
+        "away_team_name": ["Duke", "Gonzaga"],
+        "home_team_name": ["Kansas", "Duke"],
+        "neutral_site": [0, 1],
+    })
+    latest = {t: _latest(t, ["Duke", "Kansas"]) for t in AS_OF_SOURCES}
+    basic, factors = assemble_slate_features(games, latest)
+
+    assert list(basic.columns[:4]) == ["away_team_adj_oe", "away_team_BARTHAG", "away_team_adj_de", "away_team_adj_pace"]
+    assert basic.loc[0, "home_team_adj_oe"] == 10 and basic.loc[1, "home_team_BARTHAG"] == 2
+    assert list(basic["home_team_home"]) == [True, False]
+    assert np.isnan(basic.loc[1, "away_team_adj_oe"])  # Gonzaga has no rows
+    assert factors.columns[0] == "away_eff_fg_pct" and "home_def_def_rebound_pct" in factors
+    assert factors.loc[0, "home_def_3p_pct"] == 13
@@ -0,0 +1,45 @@
+import os
+
+import pandas as pd
+from bball.data import super_sked
+from bball.data.super_sked import load_super_sked
+
+
+def _write(path, rows):
+    pd.DataFrame(rows).to_csv(path, header=False, index=False)
+
+
+def _rows():
+    return [
+        [0, "2026-01-11 18:00", "Houston", 1],
+        [1, "2026-01-10 19:00", "Duke", 99],
+        [2, "2026-01-10 12:00", "Kansas", 1],
+    ]
+
+
+def test_slices_by_date_in_csv_order(tmp_path):
+    csv = tmp_path / "2026_super_sked.csv"
+    _write(csv, _rows())
+    sked = load_super_sked(csv)
+    day = sked.between("2026-01-10", "2026-01-11")
+    assert list(day[2]) == ["Duke", "Kansas"]
+    assert list(sked.on_dates(["2026-01-11", "2026-01-10"])[0]) == [0, 1, 2]
+    assert (tmp_path / ".cache" / "2026_super_sked.parquet").exists()
+
+
+def test_reuses_cache_and_rebuilds_on_change(tmp_path, monkeypatch):
+    csv = tmp_path / "2026_super_sked.csv"
+    _write(csv, _rows())
+    first = load_super_sked(csv)
+    assert load_super_sked(csv) is first  # in-process memo
+
+    super_sked._MEMO.clear()
+    calls = []
+    real_parse = super_sked._parse_csv
+    monkeypatch.setattr(super_sked, "_parse_csv", lambda p: calls.append(p) or real_parse(p))
+    st = csv.stat()
+    os.utime(csv, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))  # touched, same bytes
+    assert len(load_super_sked(csv)) == 3 and calls == []
+
+    _write(csv, _rows()[:2])
+    assert len(load_super_sked(csv)) == 2 and len(calls) == 1
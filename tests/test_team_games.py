@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+from bball.data.team_games import STAT_COLUMNS, build_team_game_log
+
+
+def test_team_game_log_matches_legacy_formulas(box_row):
+    box = pd.DataFrame([
+        box_row("2026-01-03", "Kansas", "Duke", home_team_pts=81, home_off_reb=14),
+        box_row("2026-01-01", "Duke", "Kansas", game_tempo=0.0, away_tot_ft=0),
+    ])
+    log = build_team_game_log(box)
+
+    assert list(log.columns[4:]) == STAT_COLUMNS
+    assert len(log) == 4
+    assert log["date"].is_monotonic_increasing
+
+    kansas = log[(log.team_name == "Kansas") & (log.date == pd.Timestamp("2026-01-03"))].iloc[0]
+    assert kansas.is_home == 0 and kansas.opp_team_name == "Duke"
+    assert np.isclose(kansas.ppp, 70 / 70.0)
+    assert np.isclose(kansas.opp_efficency, 81 * 100 / 70.0)
+    assert np.isclose(kansas.eff_fg_pct, (17 + 8 + 0.5 * 8) / 60)
+    assert np.isclose(kansas.true_shooting_pct, 70 / (2 * (60 + 0.44 * 16)))
+    assert np.isclose(kansas.block_pct, 4 / 38)
+    assert np.isclose(kansas.off_rebound_pct, 10 / 35)
+    assert np.isclose(kansas.opp_off_rebound_pct, 14 / 39)
+
+    # zero denominators fall back to 0 like the scalar helpers
+    duke = log[(log.team_name == "Duke") & (log.date == pd.Timestamp("2026-01-01"))].iloc[0]
+    assert duke.ppp == 0 and duke.steal_pct == 0 and duke.ft_pct == 0
@@ -0,0 +1,75 @@
+import pandas as pd
+from bball.data import teams
+
+
+def test_registry_loads_bundled_list():
+    names = teams.non_d1_teams()
+    assert isinstance(names, frozenset) and len(names) == 119
+    assert "Western New Mexico" in names and "S'western Adventist" in names
+    assert not any(n.startswith("#") for n in names)
+    assert teams.is_non_d1(" Morehouse ") and not teams.is_non_d1("Kansas")
+
+
+def test_d1_games_survive_the_ingester_filter():
+    # South Alabama / Stonehill are D1: skipped on the slate, never at ingest
+    assert not teams.is_non_d1_game("South Alabama", "Stonehill")
+    assert not teams.is_non_d1_game("Duke", "Kansas")
+    assert teams.is_non_d1_game("Duke", "Morehouse") and teams.is_non_d1_game("Brescia", "Duke")
+    slate = pd.DataFrame({
+        "away_team_name": ["South Alabama", "Duke", "Kansas"],
+        "home_team_name": ["Troy", "Stonehill", "Baylor"],
+    })
+    assert list(teams.drop_non_d1(slate).away_team_name) == ["South Alabama", "Duke", "Kansas"]
+    assert list(teams.drop_slate_excluded(slate).away_team_name) == ["Kansas"]
+
+
+def test_drop_non_d1_masks_both_columns(tmp_path, monkeypatch):
+    path = tmp_path / "teams.txt"
+    path.write_text("# custom\nBrescia\nPacific Oregon  # trailing comment\n")
+    monkeypatch.setenv("BBALL_NON_D1_TEAMS", str(path))
+    df = pd.DataFrame({
+        "away_team_name": ["Duke", "Brescia", "Kansas"],
+        "home_team_name": ["Pacific Oregon", "Baylor", "Houston"],
+    })
+    assert list(teams.drop_non_d1(df).away_team_name) == ["Kansas"]
+    positional = df.set_axis([8, 14], axis=1)
+    assert len(teams.drop_non_d1(positional, away_col=8, home_col=14)) == 1
+
+
+def test_team_registry_maps_columns_between_sources():
+    reg = teams.TeamRegistry()
+    torvik = pd.Series(["Albany", "Wichita St.", "Kansas", "Albany", None])
+    s3 = reg.to_source(torvik, teams.S3)
+    assert list(s3[:4]) == ["UAlbany", "Wichita State", "Kansas", "UAlbany"] and pd.isna(s3[4])
+    assert list(reg.to_canonical(s3[:4], teams.S3)) == list(torvik[:4])
+    assert reg.to_source("Albany", teams.S3) == "UAlbany"
+
+    ids = reg.ids(torvik[:4])
+    assert ids.dtype == "int64" and ids[0] == ids[3]
+    assert list(reg.ids(s3[:4], source=teams.S3)) == list(ids)
+    assert reg.name(int(ids[2])) == "Kansas"
+
+
+def test_team_registry_fuzzy_fallback_is_memoised():
+    reg = teams.TeamRegistry({teams.S3: {"Wichita St.": "Wichita State"}}, fuzzy=True)
+    assert reg.to_canonical("Wichita  State", teams.S3) == "Wichita St."
+    assert reg._fuzzy[(teams.S3, "Wichita  State")] == "Wichita St."
+    # nothing close enough: passes through unchanged
+    assert reg.to_canonical("Gonzaga", teams.S3) == "Gonzaga"
+
+
+def test_exact_names_never_fuzzy_match_a_neighbour():
+    assert {"Northeastern", "Northwestern"} <= teams.d1_teams()
+    # opt-in fuzzy still prefers a registered exact name
+    reg = teams.TeamRegistry({teams.S3: {}}, known=["Northwestern"], fuzzy=True)
+    assert reg.to_canonical("Northwestern", teams.S3) == "Northwestern"
+    # default: unknown spellings pass through rather than snapping to a neighbour
+    reg = teams.TeamRegistry({teams.S3: {}}, known=["Northwestern"])
+    assert reg.to_canonical("Northeastern", teams.S3) == "Northeastern"
+    assert reg.team_id("Northeastern", teams.S3) != reg.team_id("Northwestern", teams.S3)
+
+
+def test_team_lists_are_consistent():
+    d1 = teams.d1_teams()
+    assert len(d1) == 365 and not d1 & teams.non_d1_teams()
+    assert teams.slate_skip_teams() == {"South Alabama", "Stonehill"} <= d1
@@ -0,0 +1,115 @@
+import pandas as pd
+from sqlalchemy import create_engine
+
+from bball.data.loaders import load_training_dataframe
+from bball.data.training_snapshot import TrainingSnapshot
+
+
+def _rows(dates, start=0):
+    n = len(dates)
+    return pd.DataFrame({
+        "date": dates,
+        "away_team_name": [f"Away {i}" for i in range(start, start + n)],
+        "home_team_name": [f"Home {i}" for i in range(start, start + n)],
+        "away_team_pts": [60 + i for i in range(n)],
+        "home_team_pts": [70] * n,
+        "neutral_site": [i % 2 for i in range(n)],
+        "away_adjoe": [100.5 + i for i in range(n)],
+    })
+
+
+def test_snapshot_pulls_only_rows_past_the_watermark(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    _rows(["2025-01-01", "2025-01-02", "2025-01-03"]).to_sql("training_data", engine, index=False)
+    snap = TrainingSnapshot(tmp_path / "snap.parquet", table="training_data")
+
+    first = snap.refresh(engine)
+    assert snap.pulled == 3
+    assert first["away_adjoe"].dtype == "float32"
+    assert first["neutral_site"].dtype == "int8"
+    assert first["home_team_pts"].dtype == "int16"
+    mark = snap.watermark()
+    assert mark["rows"] == 3 and mark["max_date"] == "2025-01-03" and mark["older"][0] == 2
+
+    # a late game on the watermark day plus a new day
+    _rows(["2025-01-03", "2025-01-04"], start=3).to_sql("training_data", engine, index=False, if_exists="append")
+    second = snap.refresh(engine)
+    assert snap.pulled == 3  # both 01-03 rows + 01-04, nothing older
+    assert len(second) == 5
+    assert snap.watermark()["max_date"] == "2025-01-04"
+
+    # incremental and full loads give the same frame, row order included
+    full = TrainingSnapshot(tmp_path / "full.parquet", table="training_data").refresh(engine)
+    pd.testing.assert_frame_equal(second, full)
+
+    # an older row updated in place (same count) → full re-read
+    with engine.begin() as con:
+        con.exec_driver_sql("UPDATE training_data SET away_adjoe = 111.25 WHERE date = '2025-01-01'")
+    third = snap.refresh(engine)
+    assert snap.pulled == 5 and third.loc[0, "away_adjoe"] == 111.25
+
+    # history deleted → full re-read
+    with engine.begin() as con:
+        con.exec_driver_sql("DELETE FROM training_data WHERE date = '2025-01-01'")
+    fourth = snap.refresh(engine)
+    assert snap.pulled == 4 and len(fourth) == 4
+
+    # nothing changed: only the watermark day; full=True re-reads everything
+    snap.refresh(engine)
+    assert snap.pulled == 1
+    snap.refresh(engine, full=True)
+    assert snap.pulled == 4
+
+
+def test_loader_engineers_targets_from_snapshot(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    _rows(["2025-01-01", "2025-01-02"]).to_sql("training_data", engine, index=False)
+    snap = TrainingSnapshot(tmp_path / "snap.parquet", table="training_data")
+    snap.refresh(engine)
+
+    def _down():
+        raise ConnectionError("no db")
+
+    monkeypatch.setattr("bball.data.loaders._sa_engine", _down)
+    df = load_training_dataframe(snap)
+    assert list(df["spread_home"]) == [10, 9]
+    assert list(df["home_team_home"]) == [1, 0]
+
+
+def test_null_neutral_site_is_not_a_home_game(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    rows = _rows(["2025-01-01", "2025-01-02", "2025-01-03"])
+    rows["neutral_site"] = [0, None, 1]
+    rows.to_sql("training_data", engine, index=False)
+    monkeypatch.setattr("bball.data.loaders._sa_engine", lambda: engine)
+    snap = TrainingSnapshot(tmp_path / "snap.parquet", table="training_data")
+    df = load_training_dataframe(snap)
+    # baseline: neutral_site.eq(0) is False for NULL
+    assert list(df["home_team_home"]) == [1, 0, 0]
+    assert not any(df.dtypes == "object")
+
+
+def test_dtype_plan_and_in_place_augment():
+    from bball.data.augment import augment_home_away
+    from bball.data.loaders import apply_dtype_plan, split_X_y
+
+    df = apply_dtype_plan(pd.DataFrame({
+        "home_adjoe": [110.0, 105.0, 99.0, 101.0],
+        "away_adjoe": [100.0, 95.0, 98.0, 97.0],
+        "home_team_home": [True, True, False, True],
+        "away_team_home": [False] * 4,
+        "spread_home": [3.0, -2.0, 7.0, 1.0],
+        "home_win": [1, 0, 1, 1],
+    }))
+    assert df["home_adjoe"].dtype == "float32"
+    assert df["home_team_home"].dtype == "int8" and df["away_team_home"].dtype == "int8"
+    assert df["spread_home"].dtype == "int16" and df["home_win"].dtype == "int8"
+
+    expected = augment_home_away(df, flip_frac=0.5, random_state=1)
+    out = augment_home_away(df, flip_frac=0.5, random_state=1, inplace=True)
+    assert out is df
+    assert list(out["spread_home"]) == [-3, -2, -7, -1]
+    pd.testing.assert_frame_equal(out, expected)
+
+    X, y_reg, y_cls = split_X_y(df, "spread_home", "home_win", inplace=True)
+    assert X is df and "spread_home" not in X.columns and y_reg.dtype == "int16"